@@ -51,8 +51,8 @@ def show_detection_results():
             print(f"  {app}: Not installed")
 
 
-def main():
-    """Main entry point for D-Bus MCP server."""
+def create_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
     parser = argparse.ArgumentParser(
         prog="dbus-mcp",
         description="D-Bus MCP Server - Bridge AI assistants to Linux systems"
@@ -123,44 +123,17 @@ def main():
         help="Print version and exit"
     )
     
-    args = parser.parse_args()
-    
-    # Handle special commands
-    if args.print_version:
-        print("dbus-mcp version 0.1.0")
-        sys.exit(0)
-    
-    if args.check_requirements:
-        check_and_warn()
-        sys.exit(0)
-    
-    if args.detect:
-        show_detection_results()
-        sys.exit(0)
-    
-    # Configure logging
-    log_level = logging.DEBUG if args.debug else logging.INFO
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    if args.log_file:
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            filename=args.log_file,
-            filemode='a'
-        )
-    else:
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            stream=sys.stderr
-        )
+    return parser
+
+
+def create_server(args: argparse.Namespace) -> DBusMCPServer:
+    """
+    Build the MCP server and register its tools from parsed arguments.
     
+    Shared by main() and the in-process socket bridge.
+    """
     logger = logging.getLogger(__name__)
     
-    # Safety level is just a string
-    safety_level = args.safety_level
-    
     # Detect system profile
     profile = load_profile()  # Auto-detects if no name provided
     
@@ -194,20 +167,76 @@ def main():
     if args.mode == 'stdio':
         mcp_server.publish_on_dbus()
     
+    return mcp_server
+
+
+async def serve_stdio(mcp_server: DBusMCPServer, sock=None):
+    """
+    Serve MCP over stdio, or over a connected socket when one is given.
+    
+    Shared by main() and the in-process socket bridge.
+    """
+    import anyio
+    
+    from dbus_mcp.tools.registry import prewarm_core_tools
+    
+    async with anyio.create_task_group() as tg:
+        # Connect to the buses while the client is still initializing
+        tg.start_soon(prewarm_core_tools, mcp_server.profile, mcp_server.dbus_manager)
+        
+        # stdio, or the socket systemd passed when socket-activated
+        await mcp_server.run_stdio(sock)
+
+
+def main():
+    """Main entry point for D-Bus MCP server."""
+    args = create_parser().parse_args()
+    
+    # Handle special commands
+    if args.print_version:
+        print("dbus-mcp version 0.1.0")
+        sys.exit(0)
+    
+    if args.check_requirements:
+        check_and_warn()
+        sys.exit(0)
+    
+    if args.detect:
+        show_detection_results()
+        sys.exit(0)
+    
+    # Configure logging
+    log_level = logging.DEBUG if args.debug else logging.INFO
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    
+    if args.log_file:
+        logging.basicConfig(
+            level=log_level,
+            format=log_format,
+            filename=args.log_file,
+            filemode='a'
+        )
+    else:
+        logging.basicConfig(
+            level=log_level,
+            format=log_format,
+            stream=sys.stderr
+        )
+    
+    mcp_server = create_server(args)
+    
     # Run based on transport mode
     if args.mode == 'stdio':
         import anyio
-        from mcp.server.stdio import stdio_server
         
-        async def run():
-            async with stdio_server() as (read_stream, write_stream):
-                await mcp_server.server.run(
-                    read_stream,
-                    write_stream,
-                    mcp_server.server.create_initialization_options()
-                )
+        # Use uvloop when available; it is an optional speedup
+        try:
+            import uvloop  # noqa: F401
+            backend_options = {"use_uvloop": True}
+        except ImportError:
+            backend_options = {}
         
-        anyio.run(run)
+        anyio.run(serve_stdio, mcp_server, backend_options=backend_options)
     else:
         raise NotImplementedError(f"Mode {args.mode} not yet implemented")
     
@@ -21,7 +21,7 @@ from .server import DBusMCPServer
 from .profiles import load_profile, ProfileDetector
 from .tools.registry import register_core_tools
 from .system_requirements import check_and_warn
-from .systemd_server import setup_systemd_stdio, restore_stdio
+from .systemd_server import get_systemd_socket, socket_stdio_streams
 
 
 def setup_logging(level: str = "INFO"):
@@ -147,23 +147,28 @@ def detect_and_display():
 
 async def run_stdio_server(server: FastMCP, profile):
     """Run the MCP server with stdio transport."""
-    # Check if we need to set up systemd socket wrapping
-    is_systemd = setup_systemd_stdio()
+    # A socket passed by systemd replaces the process's stdio
+    sock = get_systemd_socket()
     
-    if is_systemd:
+    if sock is not None:
         logging.info(f"Starting D-Bus MCP Server (systemd socket mode)")
     else:
         logging.info(f"Starting D-Bus MCP Server (stdio mode)")
     
     logging.info(f"Using profile: {profile.name}")
     
-    try:
+    if sock is None:
         # Run the stdio server using FastMCP's built-in method
         await server.run_stdio_async()
-    finally:
-        # Restore stdio if we modified it
-        if is_systemd:
-            restore_stdio()
+        return
+    
+    # Same as run_stdio_async, but over the socket's streams
+    async with socket_stdio_streams(sock) as (read_stream, write_stream):
+        await server._mcp_server.run(
+            read_stream,
+            write_stream,
+            server._mcp_server.create_initialization_options()
+        )
 
 
 async def run_socket_server(server: FastMCP, profile, socket_path: Optional[str]):
@@ -244,7 +249,12 @@ def main():
         return 0 if success else 1
     
     try:
-        # Run the async main
+        # Run the async main, on uvloop when it is installed
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
         asyncio.run(async_main(args))
         return 0
     except KeyboardInterrupt:
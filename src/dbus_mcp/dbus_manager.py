@@ -4,15 +4,35 @@ D-Bus Connection Manager
 Handles connections to session and system buses with proper lifecycle management.
 """
 
+import sys
+import time
+import bisect
+import asyncio
 import logging
-from typing import Optional, Any
+from collections import OrderedDict
+from typing import Optional, Any, Callable, Dict, List, Set, Tuple, Sequence
 from pydbus import SessionBus, SystemBus
 from gi.repository import GLib, Gio
 import threading
 import os
 
+# dbus-fast marshals messages in Cython and runs on the asyncio loop; it is
+# optional and only used for the calls that opt into call_async()
+try:
+    from dbus_fast import Message, MessageType
+    from dbus_fast.aio import MessageBus as AsyncMessageBus
+except ImportError:
+    AsyncMessageBus = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds an object's introspection XML is reused; it only changes when the
+# service is upgraded, which also shows up as an owner change
+INTROSPECT_CACHE_TTL = 60.0
+
+# Most objects whose introspection XML is kept; least recently used go first
+INTROSPECT_CACHE_SIZE = 128
+
 
 class DBusManager:
     """
@@ -42,19 +62,65 @@ class DBusManager:
         self._loop: Optional[GLib.MainLoop] = None
         self._loop_thread: Optional[threading.Thread] = None
         
+        # Bus setup can be reached from worker threads at once (prewarm)
+        self._connect_lock = threading.RLock()
+        
+        # Proxies reused across calls, keyed by (bus, service, path); entries
+        # for a service are dropped when its owner changes
+        self._proxy_cache: Dict[Tuple[str, str, Optional[str]], Any] = {}
+        # One lock per key, so concurrent misses build a proxy only once
+        self._proxy_locks: Dict[Tuple[str, str, Optional[str]], threading.Lock] = {}
+        self._watched_buses: set = set()
+        # Called with a service name whenever its cached state is dropped,
+        # for callers keeping their own caches keyed by service
+        self._invalidation_listeners: List[Callable[[str], None]] = []
+        
+        # Bus names and object properties mirrored from D-Bus signals, so
+        # repeated reads need no round trip. Signal callbacks run on the
+        # GLib loop thread, hence the lock.
+        self._service_names: Dict[str, Set[str]] = {}
+        # Well-known (non ':1.x') names per bus, kept sorted as names change
+        self._well_known_sorted: Dict[str, List[str]] = {}
+        # Sorted names within one namespace, keyed by (bus, namespace), for
+        # callers that only need that namespace; its NameOwnerChanged match
+        # is filtered by the bus, so other names never wake us
+        self._namespace_names: Dict[Tuple[str, str], List[str]] = {}
+        # NameOwnerChanged events seen while a mirror above is being seeded,
+        # as name -> has owner, replayed over the ListNames snapshot
+        self._pending_name_changes: Dict[str, Dict[str, bool]] = {}
+        self._pending_namespace_changes: Dict[Tuple[str, str], Dict[str, bool]] = {}
+        self._property_cache: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        self._property_subscriptions: set = set()
+        self._state_lock = threading.Lock()
+        
+        # Introspection XML known without asking the bus, e.g. for objects
+        # this process exports itself; keyed by (bus, service, path)
+        self._static_introspection: Dict[Tuple[str, str, str], str] = {}
+        
+        # Introspection XML keyed by (bus, service, path), with fetch time
+        self._introspect_cache: 'OrderedDict[Tuple[str, str, str], Tuple[float, str]]' = OrderedDict()
+        
+        # The DBusMCPService this process published, if any; set by the server
+        self.published_service = None
+        
+        # dbus-fast session connection for call_async(), opened on first use
+        self._async_session_bus = None
+        
         logger.info("D-Bus Manager initialized")
     
     @property
     def session_bus(self) -> SessionBus:
         """Get or create session bus connection."""
         if self._session_bus is None:
-            try:
-                self._session_bus = SessionBus()
-                logger.info("Connected to session bus")
-                self._ensure_main_loop()
-            except Exception as e:
-                logger.error(f"Failed to connect to session bus: {e}")
-                raise
+            with self._connect_lock:
+                if self._session_bus is None:
+                    try:
+                        self._session_bus = SessionBus()
+                        logger.info("Connected to session bus")
+                        self._ensure_main_loop()
+                    except Exception as e:
+                        logger.error(f"Failed to connect to session bus: {e}")
+                        raise
         return self._session_bus
     
     @property
@@ -64,18 +130,23 @@ class DBusManager:
             return None
             
         if self._system_bus is None:
-            try:
-                self._system_bus = SystemBus()
-                logger.info("Connected to system bus")
-                self._ensure_main_loop()
-            except Exception as e:
-                logger.warning(f"Failed to connect to system bus: {e}")
-                # System bus is optional, don't raise
+            with self._connect_lock:
+                if self._system_bus is None:
+                    try:
+                        self._system_bus = SystemBus()
+                        logger.info("Connected to system bus")
+                        self._ensure_main_loop()
+                    except Exception as e:
+                        logger.warning(f"Failed to connect to system bus: {e}")
+                        # System bus is optional, don't raise
         return self._system_bus
     
     def _ensure_main_loop(self):
         """Ensure GLib main loop is running for signal handling."""
-        if self._loop is None:
+        with self._connect_lock:
+            if self._loop is not None:
+                return
+            
             self._loop = GLib.MainLoop()
             self._loop_thread = threading.Thread(
                 target=self._run_main_loop,
@@ -121,6 +192,376 @@ class DBusManager:
             logger.error(f"Failed to get service {service_name}: {e}")
             raise
     
+    def get_cached_service(self, bus_name: str, service_name: str,
+                           object_path: str = None) -> Any:
+        """
+        Get a D-Bus service proxy, reusing one from an earlier call.
+        
+        Creating a pydbus proxy fetches and parses the object's
+        introspection data, so repeated tool calls keep the proxy instead.
+        Cached proxies for a service are dropped when its owner changes.
+        
+        Args:
+            bus_name: 'session' or 'system'
+            service_name: D-Bus service name
+            object_path: D-Bus object path (optional, will auto-detect)
+            
+        Returns:
+            Proxy object for the service
+        """
+        key = (bus_name, service_name, object_path)
+        proxy = self._proxy_cache.get(key)
+        if proxy is None:
+            with self._state_lock:
+                lock = self._proxy_locks.setdefault(key, threading.Lock())
+            # Callers that missed together wait for the first one's proxy
+            with lock:
+                proxy = self._proxy_cache.get(key)
+                if proxy is None:
+                    proxy = self.get_service(bus_name, service_name, object_path)
+                    # Names in a mirrored namespace are evicted by its own
+                    # filtered watch; only others need the bus-wide one
+                    if not self._in_mirrored_namespace(bus_name, service_name):
+                        self._watch_name_owners(bus_name)
+                    self._proxy_cache[key] = proxy
+        return proxy
+    
+    def invalidate_service(self, service_name: str):
+        """Drop cached proxies and properties for a service on every bus."""
+        for key in list(self._proxy_cache):
+            if key[1] == service_name:
+                self._proxy_cache.pop(key, None)
+        with self._state_lock:
+            for key in list(self._property_cache):
+                if key[1] == service_name:
+                    del self._property_cache[key]
+            for key in list(self._introspect_cache):
+                if key[1] == service_name:
+                    del self._introspect_cache[key]
+        for listener in self._invalidation_listeners:
+            listener(service_name)
+    
+    def add_invalidation_listener(self, listener: Callable[[str], None]):
+        """Call listener(service_name) whenever a service's cached state is dropped."""
+        self._invalidation_listeners.append(listener)
+    
+    def get_service_names(self, bus_name: str = 'session') -> List[str]:
+        """
+        List the names on a bus from a local mirror.
+        
+        The list is fetched once with ListNames and then kept current from
+        NameOwnerChanged signals.
+        
+        Args:
+            bus_name: 'session' or 'system'
+            
+        Returns:
+            List of service names
+        """
+        with self._state_lock:
+            names = self._service_names.get(bus_name)
+            if names is not None:
+                return list(names)
+        
+        # Subscribe before seeding, and keep the changes that arrive until the
+        # snapshot is in, so none made during ListNames are lost
+        with self._state_lock:
+            self._pending_name_changes.setdefault(bus_name, {})
+        try:
+            self._watch_name_owners(bus_name)
+            dbus = self.get_cached_service(bus_name, 'org.freedesktop.DBus', '/org/freedesktop/DBus')
+            seeded = dbus.ListNames()
+        except Exception:
+            with self._state_lock:
+                self._pending_name_changes.pop(bus_name, None)
+            raise
+        with self._state_lock:
+            pending = self._pending_name_changes.pop(bus_name, {})
+            names = self._service_names.get(bus_name)
+            if names is not None:
+                # Seeded by another caller meanwhile, and kept current since
+                return list(names)
+            # Interned so names shared with the proxy and property cache keys
+            # are stored once and compare by identity
+            names = set(map(sys.intern, seeded))
+            for name, owned in pending.items():
+                if owned:
+                    names.add(sys.intern(name))
+                else:
+                    names.discard(name)
+            self._service_names[bus_name] = names
+            self._well_known_sorted[bus_name] = sorted(
+                name for name in names if not name.startswith(':')
+            )
+            return list(names)
+    
+    def get_well_known_names(self, bus_name: str = 'session') -> Tuple[List[str], int]:
+        """
+        Get the sorted well-known names on a bus and the count of unique names.
+        
+        The sorted list is maintained as names come and go, so no sort
+        happens here.
+        
+        Args:
+            bus_name: 'session' or 'system'
+            
+        Returns:
+            Tuple of (sorted well-known names, number of unique ':x.y' names)
+        """
+        with self._state_lock:
+            well_known = self._well_known_sorted.get(bus_name)
+            if well_known is not None:
+                return list(well_known), len(self._service_names[bus_name]) - len(well_known)
+        
+        self.get_service_names(bus_name)
+        return self.get_well_known_names(bus_name)
+    
+    def get_names_with_prefix(self, bus_name: str, prefix: str) -> List[str]:
+        """
+        Get the well-known names on a bus that start with a prefix.
+        
+        Read from the sorted mirror by bisection, so no name is tested one by one.
+        A namespace prefix such as 'org.mcp.' is served from a mirror of
+        just that namespace until the full one exists.
+        
+        Args:
+            bus_name: 'session' or 'system'
+            prefix: Name prefix, e.g. 'org.mcp.'
+            
+        Returns:
+            Sorted list of matching names
+        """
+        namespace = prefix[:-1] if prefix.endswith('.') else None
+        with self._state_lock:
+            well_known = self._well_known_sorted.get(bus_name)
+            if well_known is None and namespace is not None:
+                well_known = self._namespace_names.get((bus_name, namespace))
+            if well_known is not None:
+                if not prefix:
+                    return list(well_known)
+                # Names with the prefix sort between it and the prefix with
+                # its last character bumped, so both ends are a bisect away
+                start = bisect.bisect_left(well_known, prefix)
+                end = bisect.bisect_left(well_known, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+                return well_known[start:end]
+        
+        if namespace is not None:
+            self._mirror_namespace(bus_name, namespace)
+        else:
+            self.get_service_names(bus_name)
+        return self.get_names_with_prefix(bus_name, prefix)
+    
+    def _in_mirrored_namespace(self, bus_name: str, name: str) -> bool:
+        """Whether a name falls in a namespace mirrored by _mirror_namespace."""
+        for mirrored_bus, namespace in list(self._namespace_names):
+            if mirrored_bus == bus_name and (name == namespace or name.startswith(namespace + '.')):
+                return True
+        return False
+    
+    def _mirror_namespace(self, bus_name: str, namespace: str):
+        """Seed and watch the names in one namespace, e.g. 'org.mcp'."""
+        key = (bus_name, namespace)
+        bus = self.session_bus if bus_name == 'session' else self.system_bus
+        
+        def on_name_owner_changed(connection, sender, object_path, iface, signal, params, _data=None):
+            name, old_owner, new_owner = params.unpack()
+            with self._state_lock:
+                names = self._namespace_names.get(key)
+                if names is None:
+                    pending = self._pending_namespace_changes.get(key)
+                    if pending is not None:
+                        pending[name] = bool(new_owner)
+                else:
+                    index = bisect.bisect_left(names, name)
+                    present = index < len(names) and names[index] == name
+                    if new_owner and not present:
+                        names.insert(index, sys.intern(name))
+                    elif not new_owner and present:
+                        del names[index]
+            self.invalidate_service(name)
+        
+        # Subscribe before seeding, and keep the changes that arrive until the
+        # snapshot is in, so none made during ListNames are lost.
+        # MATCH_ARG0_NAMESPACE puts the filter in the bus daemon's match rule.
+        with self._connect_lock:
+            if key in self._namespace_names:
+                return
+            with self._state_lock:
+                self._pending_namespace_changes[key] = {}
+            subscription = bus.con.signal_subscribe(
+                'org.freedesktop.DBus',
+                'org.freedesktop.DBus',
+                'NameOwnerChanged',
+                '/org/freedesktop/DBus',
+                namespace,
+                Gio.DBusSignalFlags.MATCH_ARG0_NAMESPACE,
+                on_name_owner_changed,
+                None
+            )
+            try:
+                # A raw call: a cached proxy would add the bus-wide name watch
+                names = bus.con.call_sync(
+                    'org.freedesktop.DBus',
+                    '/org/freedesktop/DBus',
+                    'org.freedesktop.DBus',
+                    'ListNames',
+                    None,
+                    GLib.VariantType.new('(as)'),
+                    Gio.DBusCallFlags.NONE,
+                    -1,
+                    None
+                ).unpack()[0]
+            except Exception:
+                bus.con.signal_unsubscribe(subscription)
+                with self._state_lock:
+                    self._pending_namespace_changes.pop(key, None)
+                raise
+            prefix = namespace + '.'
+            seeded = {name for name in names if name.startswith(prefix)}
+            with self._state_lock:
+                for name, owned in self._pending_namespace_changes.pop(key, {}).items():
+                    if owned:
+                        seeded.add(name)
+                    else:
+                        seeded.discard(name)
+                self._namespace_names[key] = sorted(map(sys.intern, seeded))
+    
+    def has_service(self, bus_name: str, service_name: str) -> bool:
+        """Check whether a name currently has an owner, using the local mirror."""
+        with self._state_lock:
+            names = self._service_names.get(bus_name)
+            if names is not None:
+                return service_name in names
+        return service_name in self.get_service_names(bus_name)
+    
+    def get_cached_properties(self, bus_name: str, service_name: str,
+                              object_path: str, interface_name: str) -> Dict[str, Any]:
+        """
+        Get all properties of an interface from a local mirror.
+        
+        The properties are fetched once with GetAll and then kept current
+        from PropertiesChanged signals. They are re-fetched after the
+        service's owner changes.
+        
+        Args:
+            bus_name: 'session' or 'system'
+            service_name: D-Bus service name
+            object_path: D-Bus object path
+            interface_name: Interface whose properties to read
+            
+        Returns:
+            Dict of property name to value
+        """
+        key = (bus_name, service_name, object_path, interface_name)
+        with self._state_lock:
+            props = self._property_cache.get(key)
+            if props is not None:
+                return dict(props)
+        
+        watched = self._watch_properties(key)
+        proxy = self.get_cached_service(bus_name, service_name, object_path)
+        fetched = proxy.GetAll(interface_name)
+        if not watched:
+            # Nothing would keep a stored copy current; ask again next time
+            return dict(fetched)
+        with self._state_lock:
+            props = self._property_cache.setdefault(key, {})
+            props.update(fetched)
+            return dict(props)
+    
+    def _watch_properties(self, key: Tuple[str, str, str, str]) -> bool:
+        """Subscribe once to PropertiesChanged for a cached interface; False if that failed."""
+        if key in self._property_subscriptions:
+            return True
+        
+        bus_name, service_name, object_path, interface_name = key
+        bus = self.session_bus if bus_name == 'session' else self.system_bus
+        
+        def on_properties_changed(sender, path, iface, signal, params):
+            changed_iface, changed, invalidated = params
+            if changed_iface != interface_name:
+                return
+            with self._state_lock:
+                props = self._property_cache.get(key)
+                if props is None:
+                    return
+                if invalidated:
+                    # Values not sent with the signal have to be re-fetched
+                    del self._property_cache[key]
+                else:
+                    props.update(changed)
+        
+        with self._connect_lock:
+            if key in self._property_subscriptions:
+                return True
+            try:
+                bus.subscribe(
+                    sender=service_name,
+                    iface='org.freedesktop.DBus.Properties',
+                    signal='PropertiesChanged',
+                    object=object_path,
+                    signal_fired=on_properties_changed
+                )
+            except Exception as e:
+                # Left unmarked, so the next caller tries again
+                logger.warning(f"Could not watch properties of {service_name} at {object_path}: {e}")
+                return False
+            self._property_subscriptions.add(key)
+            return True
+    
+    def _watch_name_owners(self, bus_name: str):
+        """Subscribe once per bus to NameOwnerChanged for cache eviction."""
+        if bus_name in self._watched_buses:
+            return
+        
+        bus = self.session_bus if bus_name == 'session' else self.system_bus
+        
+        def on_name_owner_changed(sender, object_path, iface, signal, params):
+            self._on_name_owner_changed(bus_name, params)
+        
+        with self._connect_lock:
+            if bus_name in self._watched_buses:
+                return
+            try:
+                bus.subscribe(
+                    sender='org.freedesktop.DBus',
+                    iface='org.freedesktop.DBus',
+                    signal='NameOwnerChanged',
+                    signal_fired=on_name_owner_changed
+                )
+            except Exception as e:
+                # Left unmarked, so the next caller tries again
+                logger.warning(f"Could not watch name owners on {bus_name} bus: {e}")
+                return
+            self._watched_buses.add(bus_name)
+    
+    def _on_name_owner_changed(self, bus_name: str, params):
+        """Track a name appearing or vanishing and evict its cached state."""
+        name, old_owner, new_owner = params
+        with self._state_lock:
+            names = self._service_names.get(bus_name)
+            if names is None:
+                pending = self._pending_name_changes.get(bus_name)
+                if pending is not None:
+                    pending[name] = bool(new_owner)
+            else:
+                well_known = self._well_known_sorted[bus_name]
+                if new_owner:
+                    if name not in names:
+                        name = sys.intern(name)
+                        names.add(name)
+                        if not name.startswith(':'):
+                            bisect.insort(well_known, name)
+                elif name in names:
+                    names.discard(name)
+                    if not name.startswith(':'):
+                        index = bisect.bisect_left(well_known, name)
+                        if index < len(well_known) and well_known[index] == name:
+                            del well_known[index]
+        # The namespace's own watch evicts its names; don't do it twice
+        if not self._in_mirrored_namespace(bus_name, name):
+            self.invalidate_service(name)
+    
     def list_services(self, bus_name: str = 'session') -> list:
         """
         List available services on a bus.
@@ -131,25 +572,34 @@ class DBusManager:
         Returns:
             List of service names
         """
-        if bus_name == 'session':
-            bus = self.session_bus
-        else:
-            bus = self.system_bus
-            if bus is None:
-                return []
+        if bus_name != 'session' and self.system_bus is None:
+            return []
         
         try:
-            # Get the D-Bus daemon itself
-            dbus = bus.get('org.freedesktop.DBus')
-            return dbus.ListNames()
+            # Answered from the NameOwnerChanged-maintained mirror, whose
+            # org.freedesktop.DBus proxy is built once per bus
+            return self.get_service_names(bus_name)
         except Exception as e:
             logger.error(f"Failed to list services: {e}")
             return []
     
+    def add_static_introspection(self, bus_name: str, service_name: str,
+                                 object_path: str, xml: str):
+        """
+        Answer introspect() for an object from known XML instead of the bus.
+        
+        Meant for objects this process publishes itself, whose interface
+        can't change while it runs.
+        """
+        self._static_introspection[(bus_name, service_name, object_path)] = xml
+    
     def introspect(self, bus_name: str, service_name: str, object_path: str = '/') -> str:
         """
         Introspect a D-Bus service.
         
+        Results are reused for INTROSPECT_CACHE_TTL seconds, or until the
+        service's owner changes.
+        
         Args:
             bus_name: 'session' or 'system'
             service_name: D-Bus service name
@@ -158,10 +608,141 @@ class DBusManager:
         Returns:
             XML introspection data
         """
-        service = self.get_service(bus_name, service_name, object_path)
+        key = (bus_name, service_name, object_path)
+        xml = self._static_introspection.get(key)
+        if xml is not None:
+            return xml
+        
+        with self._state_lock:
+            cached = self._introspect_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < INTROSPECT_CACHE_TTL:
+                self._introspect_cache.move_to_end(key)
+                return cached[1]
+        
+        bus = self.session_bus if bus_name == 'session' else self.system_bus
+        if bus is None:
+            raise RuntimeError("System bus is not enabled")
+        self._watch_name_owners(bus_name)
+        
+        # Call Introspect directly; building a pydbus proxy would introspect
+        # the object once already before we could ask for the XML
+        reply = bus.con.call_sync(
+            service_name,
+            object_path,
+            'org.freedesktop.DBus.Introspectable',
+            'Introspect',
+            None,
+            GLib.VariantType.new('(s)'),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None
+        )
+        xml = reply.unpack()[0]
+        with self._state_lock:
+            self._introspect_cache[key] = (time.monotonic(), xml)
+            self._introspect_cache.move_to_end(key)
+            while len(self._introspect_cache) > INTROSPECT_CACHE_SIZE:
+                self._introspect_cache.popitem(last=False)
+        return xml
+    
+    async def call_gio(self, bus_name: str, service_name: str, object_path: str,
+                       interface_name: str, method_name: str,
+                       parameters: Optional[GLib.Variant] = None,
+                       reply_type: Optional[str] = None, timeout_ms: int = -1) -> Any:
+        """
+        Call a D-Bus method without blocking the event loop.
+        
+        The call is issued with Gio's asynchronous API. Its completion
+        callback runs on the GLib main loop thread and resolves an asyncio
+        future, so no worker thread waits on the reply.
+        
+        Args:
+            bus_name: 'session' or 'system'
+            service_name: D-Bus service name
+            object_path: Object path
+            interface_name: Interface name
+            method_name: Method name
+            parameters: Arguments as a tuple GLib.Variant, or None
+            reply_type: Expected reply signature, e.g. '(u)'
+            timeout_ms: Call timeout in milliseconds (-1 for the default)
+            
+        Returns:
+            The unpacked reply tuple
+        """
+        bus = self.session_bus if bus_name == 'session' else self.system_bus
+        if bus is None:
+            raise RuntimeError("System bus is not enabled")
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def resolve(setter, value):
+            if not future.done():
+                setter(value)
+        
+        def on_reply(connection, result, _data=None):
+            try:
+                reply = connection.call_finish(result).unpack()
+            except Exception as e:
+                loop.call_soon_threadsafe(resolve, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(resolve, future.set_result, reply)
+        
+        bus.con.call(
+            service_name,
+            object_path,
+            interface_name,
+            method_name,
+            parameters,
+            GLib.VariantType.new(reply_type) if reply_type else None,
+            Gio.DBusCallFlags.NONE,
+            timeout_ms,
+            None,
+            on_reply,
+            None
+        )
+        return await future
+    
+    @property
+    def has_async_backend(self) -> bool:
+        """Whether call_async() can use dbus-fast instead of pydbus."""
+        return AsyncMessageBus is not None
+    
+    async def call_async(self, service_name: str, object_path: str, interface_name: str,
+                         method_name: str, signature: str, body: list) -> list:
+        """
+        Call a session bus method through dbus-fast without blocking the event loop.
+        
+        Args:
+            service_name: D-Bus service name
+            object_path: Object path
+            interface_name: Interface name
+            method_name: Method name
+            signature: D-Bus signature of the arguments
+            body: Method arguments; variants as dbus_fast.Variant
+            
+        Returns:
+            The reply's values
+        """
+        if AsyncMessageBus is None:
+            raise RuntimeError("dbus-fast is not installed")
         
-        # Call the Introspect method
-        return service.Introspect()
+        if self._async_session_bus is None:
+            self._async_session_bus = await AsyncMessageBus().connect()
+            logger.info("Connected to session bus (dbus-fast)")
+        
+        reply = await self._async_session_bus.call(Message(
+            destination=service_name,
+            path=object_path,
+            interface=interface_name,
+            member=method_name,
+            signature=signature,
+            body=body
+        ))
+        if reply.message_type == MessageType.ERROR:
+            detail = reply.body[0] if reply.body else ''
+            raise RuntimeError(f"{reply.error_name}: {detail}")
+        return reply.body
     
     def cleanup(self):
         """Cleanup D-Bus connections and resources."""
@@ -174,13 +755,73 @@ class DBusManager:
                 self._loop_thread.join(timeout=1.0)
         
         # Connections will be cleaned up by garbage collection
+        self._proxy_cache.clear()
+        self._proxy_locks.clear()
+        self._watched_buses.clear()
+        with self._state_lock:
+            self._service_names.clear()
+            self._well_known_sorted.clear()
+            self._namespace_names.clear()
+            self._pending_name_changes.clear()
+            self._pending_namespace_changes.clear()
+            self._property_cache.clear()
+            self._property_subscriptions.clear()
+            self._introspect_cache.clear()
         self._session_bus = None
         self._system_bus = None
+        if self._async_session_bus is not None:
+            self._async_session_bus.disconnect()
+            self._async_session_bus = None
         
         logger.info("D-Bus cleanup complete")
     
+    def _bus_connection(self, bus_name: str) -> Gio.DBusConnection:
+        """Get the Gio connection behind a bus name."""
+        if bus_name == 'session':
+            return self.session_bus.con
+        connection = self.system_bus.con if self.system_bus else None
+        if connection is None:
+            raise RuntimeError("System bus is not available")
+        return connection
+    
+    def _fd_call_parameters(self, args: Optional[Sequence], fd: int) -> Tuple[GLib.Variant, Gio.UnixFDList]:
+        """Build the parameters and fd list for a call that passes a file descriptor."""
+        # Create Unix FD list
+        fd_list = Gio.UnixFDList.new()
+        fd_index = fd_list.append(fd)
+        
+        # Prepare method call with GVariant
+        # Most screenshot methods take (options: a{sv}, fd: h)
+        # The 'h' type in D-Bus represents a file descriptor handle
+        if args is None:
+            args = []
+        
+        # Build the complete argument list with fd handle
+        full_args = list(args) + [fd_index]
+        return GLib.Variant(self._build_signature(full_args), full_args), fd_list
+    
+    @staticmethod
+    def _unpack_fd_reply(result) -> Any:
+        """Unpack the (return_value, out_fd_list) reply of an fd call."""
+        if result:
+            # Result is a tuple (return_value, out_fd_list)
+            logger.info(f"D-Bus call_with_fd result tuple: {result}")
+            return_value = result[0] if result else None
+            if return_value:
+                logger.info(f"Return value type: {type(return_value)}, value: {return_value}")
+                # Unpack the GVariant to get the actual dictionary
+                if hasattr(return_value, 'unpack'):
+                    unpacked = return_value.unpack()
+                    logger.info(f"Unpacked result: {unpacked}")
+                    # KDE returns a tuple with the dict inside
+                    if isinstance(unpacked, tuple) and len(unpacked) == 1:
+                        return unpacked[0]
+                    return unpacked
+                return return_value
+        return None
+    
     def call_with_fd(self, bus_name: str, service_name: str, object_path: str,
-                     interface_name: str, method_name: str, args: list, fd: int) -> Any:
+                     interface_name: str, method_name: str, args: Sequence, fd: int) -> Any:
         """
         Call a D-Bus method that requires a Unix file descriptor.
         
@@ -196,26 +837,10 @@ class DBusManager:
         Returns:
             Method result
         """
-        if bus_name == 'session':
-            connection = self.session_bus.con
-        else:
-            connection = self.system_bus.con if self.system_bus else None
-            if connection is None:
-                raise RuntimeError("System bus is not available")
+        connection = self._bus_connection(bus_name)
         
         try:
-            # Create Unix FD list
-            fd_list = Gio.UnixFDList.new()
-            fd_index = fd_list.append(fd)
-            
-            # Prepare method call with GVariant
-            # Most screenshot methods take (options: a{sv}, fd: h)
-            # The 'h' type in D-Bus represents a file descriptor handle
-            if args is None:
-                args = []
-            
-            # Build the complete argument list with fd handle
-            full_args = list(args) + [fd_index]
+            parameters, fd_list = self._fd_call_parameters(args, fd)
             
             # Call method with FD list
             result = connection.call_with_unix_fd_list_sync(
@@ -223,35 +848,76 @@ class DBusManager:
                 object_path,
                 interface_name,
                 method_name,
-                GLib.Variant(self._build_signature(full_args), full_args),
+                parameters,
                 None,  # reply type
                 Gio.DBusCallFlags.NONE,
                 -1,    # timeout
                 fd_list,
                 None   # cancellable
             )
-            
-            if result:
-                # Result is a tuple (return_value, out_fd_list)
-                logger.info(f"D-Bus call_with_fd result tuple: {result}")
-                return_value = result[0] if result else None
-                if return_value:
-                    logger.info(f"Return value type: {type(return_value)}, value: {return_value}")
-                    # Unpack the GVariant to get the actual dictionary
-                    if hasattr(return_value, 'unpack'):
-                        unpacked = return_value.unpack()
-                        logger.info(f"Unpacked result: {unpacked}")
-                        # KDE returns a tuple with the dict inside
-                        if isinstance(unpacked, tuple) and len(unpacked) == 1:
-                            return unpacked[0]
-                        return unpacked
-                    return return_value
-            return None
+            return self._unpack_fd_reply(result)
             
         except Exception as e:
             logger.error(f"Failed to call method with FD: {e}")
             raise
     
+    async def call_with_fd_async(self, bus_name: str, service_name: str, object_path: str,
+                                 interface_name: str, method_name: str, args: Sequence,
+                                 fd: int, timeout_ms: int = -1) -> Any:
+        """
+        Call a D-Bus method that requires a Unix file descriptor, without blocking.
+        
+        Like call_with_fd(), but issued with Gio's asynchronous API the way
+        call_gio() is; the reply resolves an asyncio future from the GLib
+        loop thread. The callee writes straight into the passed fd.
+        
+        Args:
+            timeout_ms: Call timeout in milliseconds (-1 for the default);
+                other arguments as for call_with_fd()
+        
+        Returns:
+            Method result
+        """
+        connection = self._bus_connection(bus_name)
+        parameters, fd_list = self._fd_call_parameters(args, fd)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def resolve(setter, value):
+            if not future.done():
+                setter(value)
+        
+        def on_reply(source, result, _data=None):
+            try:
+                reply = source.call_with_unix_fd_list_finish(result)
+            except Exception as e:
+                loop.call_soon_threadsafe(resolve, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(resolve, future.set_result, reply)
+        
+        connection.call_with_unix_fd_list(
+            service_name,
+            object_path,
+            interface_name,
+            method_name,
+            parameters,
+            None,  # reply type
+            Gio.DBusCallFlags.NONE,
+            timeout_ms,
+            fd_list,
+            None,  # cancellable
+            on_reply,
+            None
+        )
+        
+        try:
+            result = await future
+        except Exception as e:
+            logger.error("Failed to call method with FD: %s", e)
+            raise
+        return self._unpack_fd_reply(result)
+    
     def _build_signature(self, args: list) -> str:
         """Build D-Bus signature from arguments."""
         signature = "("
@@ -9,16 +9,57 @@ This module exposes the MCP server itself as a D-Bus service, enabling:
 - Coordination between multiple AI agents
 """
 
+import time
 import logging
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 
 from pydbus import SessionBus
-from gi.repository import GLib
+from gi.repository import GLib, Gio
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# JSON straight to UTF-8 bytes for the 'ay' getters, via orjson when installed
+if orjson is not None:
+    _dumps_bytes = orjson.dumps
+else:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Bus name namespace every MCP instance publishes under
+MCP_NAMESPACE = "org.mcp"
+
+# How long a peer's GetInfo may take before it is left out of ListPeers
+PEER_INFO_TIMEOUT_MS = 5000
+
+# Seconds a peer's info is served from memory before ListPeers refetches it;
+# client changes are picked up sooner through the peers' own signals
+PEER_INFO_TTL = 30.0
+
+# Peer signals after which a peer's GetInfo reply changes
+_PEER_INFO_SIGNALS = ('ClientConnected', 'ClientDisconnected')
+
+
+# D-Bus signature of each GetStatus value
+_STATUS_TYPES = {
+    "running": 'b',
+    "uptime": 's',
+    "memory_usage": 's',
+    "total_requests": 'u',
+}
+
+
+def object_path_for(bus_name: str) -> str:
+    """Object path pydbus publishes a single object at for a bus name."""
+    return '/' + bus_name.replace('.', '/')
+
+
 # D-Bus service interface definition
 DBUS_MCP_INTERFACE = """
 <node>
@@ -31,6 +72,18 @@ DBUS_MCP_INTERFACE = """
       <arg type='a{sv}' name='status' direction='out'/>
     </method>
     
+    <method name='GetFullInfo'>
+      <arg type='s' name='info' direction='out'/>
+    </method>
+    
+    <method name='GetInfoBytes'>
+      <arg type='ay' name='info' direction='out'/>
+    </method>
+    
+    <method name='GetFullInfoBytes'>
+      <arg type='ay' name='info' direction='out'/>
+    </method>
+    
     <method name='GetConnectedClients'>
       <arg type='as' name='clients' direction='out'/>
     </method>
@@ -51,6 +104,10 @@ DBUS_MCP_INTERFACE = """
       <arg type='a{ss}' name='peers' direction='out'/>
     </method>
     
+    <method name='ListPeers'>
+      <arg type='a(ss)' name='peers' direction='out'/>
+    </method>
+    
     <property name='Version' type='s' access='read'/>
     <property name='Profile' type='s' access='read'/>
     <property name='SafetyLevel' type='s' access='read'/>
@@ -83,12 +140,26 @@ class DBusMCPService:
         """Initialize D-Bus service."""
         self.config = server_config
         self.start_time = datetime.now().isoformat()
+        self._start_monotonic = time.monotonic()
         self.connected_clients: List[str] = []
         self.registered_peers: Dict[str, str] = {}
         self._version = "0.1.0"
         self._profile = getattr(server_config, 'profile_name', 'unknown')
         self._safety_level = server_config.safety_level
         
+        # Set once published: the bus name obtained and the object's path
+        self.bus_name: Optional[str] = None
+        self.object_path: Optional[str] = None
+        
+        # GetInfo JSON of the other MCP instances on the bus, by name; kept
+        # from NameOwnerChanged so ListPeers answers from memory. Everything
+        # here runs on the GLib main loop, so no locking is needed.
+        self._connection: Optional[Gio.DBusConnection] = None
+        self._peer_info: Dict[str, str] = {}
+        # When each peer's info was last fetched, and fetches in flight
+        self._peer_fetched: Dict[str, float] = {}
+        self._peer_fetching: set = set()
+        
         logger.info("Initializing D-Bus MCP service")
     
     # Properties
@@ -118,9 +189,9 @@ class DBusMCPService:
         return len(self.connected_clients)
     
     # Methods
-    def GetInfo(self) -> str:
-        """Get server information as JSON."""
-        info = {
+    def _info(self) -> Dict[str, Any]:
+        """Server information, as returned by GetInfo."""
+        return {
             "version": self._version,
             "profile": self._profile,
             "safety_level": self._safety_level,
@@ -128,17 +199,50 @@ class DBusMCPService:
             "client_count": len(self.connected_clients),
             "peer_count": len(self.registered_peers)
         }
-        return json.dumps(info)
+    
+    def _status(self) -> Dict[str, Any]:
+        """Server status as plain values, as returned by GetStatus."""
+        return {
+            "running": True,
+            "uptime": str(timedelta(seconds=time.monotonic() - self._start_monotonic)),
+            "memory_usage": "N/A",  # Could implement actual memory tracking
+            "total_requests": 0,  # Could implement request counting
+        }
+    
+    def GetInfo(self) -> str:
+        """Get server information as JSON."""
+        return json.dumps(self._info())
     
     def GetStatus(self) -> Dict[str, Any]:
         """Get detailed server status."""
+        status = self._status()
+        return {key: GLib.Variant(_STATUS_TYPES[key], value) for key, value in status.items()}
+    
+    def GetFullInfo(self) -> str:
+        """
+        Get info, status, connected clients and peers as one JSON object.
+        
+        Saves a client the four round trips of calling each getter.
+        """
+        return json.dumps(self._full_info())
+    
+    def _full_info(self) -> Dict[str, Any]:
+        """Everything GetFullInfo reports."""
         return {
-            "running": GLib.Variant('b', True),
-            "uptime": GLib.Variant('s', str(datetime.now() - datetime.fromisoformat(self.start_time))),
-            "memory_usage": GLib.Variant('s', "N/A"),  # Could implement actual memory tracking
-            "total_requests": GLib.Variant('u', 0),  # Could implement request counting
+            "info": self._info(),
+            "status": self._status(),
+            "connected_clients": self.connected_clients,
+            "registered_peers": self.registered_peers
         }
     
+    def GetInfoBytes(self) -> bytes:
+        """GetInfo as UTF-8 JSON bytes, which clients parse without decoding first."""
+        return _dumps_bytes(self._info())
+    
+    def GetFullInfoBytes(self) -> bytes:
+        """GetFullInfo as UTF-8 JSON bytes."""
+        return _dumps_bytes(self._full_info())
+    
     def GetConnectedClients(self) -> List[str]:
         """Get list of connected client IDs."""
         return self.connected_clients
@@ -162,6 +266,123 @@ class DBusMCPService:
         """Get registered peer MCP instances."""
         return self.registered_peers
     
+    def ListPeers(self) -> List[tuple]:
+        """
+        List every MCP instance on the bus with its GetInfo JSON, this one included.
+        
+        Lets a client discover all instances in one call instead of
+        ListNames plus a GetInfo per instance. Peer info is as last
+        fetched, at most PEER_INFO_TTL seconds ago; '' means nothing has
+        been fetched yet and the client should ask that peer itself.
+        """
+        peers = [(self.bus_name, self.GetInfo())] if self.bus_name else []
+        peers.extend(self._peer_info.items())
+        now = time.monotonic()
+        for name in self._peer_info:
+            if now - self._peer_fetched.get(name, 0.0) > PEER_INFO_TTL:
+                self._fetch_peer_info(name)
+        return peers
+    
+    # Peer tracking (started by publish_dbus_service)
+    def watch_peers(self, connection: Gio.DBusConnection):
+        """Track the other MCP instances on a connection's bus."""
+        self._connection = connection
+        
+        # The bus only forwards owner changes in the org.mcp namespace
+        connection.signal_subscribe(
+            'org.freedesktop.DBus',
+            'org.freedesktop.DBus',
+            'NameOwnerChanged',
+            '/org/freedesktop/DBus',
+            MCP_NAMESPACE,
+            Gio.DBusSignalFlags.MATCH_ARG0_NAMESPACE,
+            self._on_peer_owner_changed,
+            None
+        )
+        
+        # Peers announce client changes, which change their info
+        for signal in _PEER_INFO_SIGNALS:
+            connection.signal_subscribe(
+                None,
+                'org.mcp.DBusServer',
+                signal,
+                None,
+                None,
+                Gio.DBusSignalFlags.NONE,
+                self._on_peer_info_changed,
+                None
+            )
+        
+        names = connection.call_sync(
+            'org.freedesktop.DBus',
+            '/org/freedesktop/DBus',
+            'org.freedesktop.DBus',
+            'ListNames',
+            None,
+            GLib.VariantType.new('(as)'),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None
+        ).unpack()[0]
+        for name in names:
+            if name.startswith(MCP_NAMESPACE + '.'):
+                self._add_peer(name)
+    
+    def _on_peer_owner_changed(self, connection, sender, object_path, iface, signal, params, _data=None):
+        """Start or stop tracking an MCP instance as its name comes and goes."""
+        name, old_owner, new_owner = params.unpack()
+        if new_owner:
+            self._add_peer(name)
+        else:
+            self._peer_info.pop(name, None)
+            self._peer_fetched.pop(name, None)
+    
+    def _on_peer_info_changed(self, connection, sender, object_path, iface, signal, params, _data=None):
+        """Refetch a peer's info after it reports a client change."""
+        # pydbus publishes each instance at the path mirroring its name
+        name = object_path[1:].replace('/', '.')
+        if name in self._peer_info:
+            self._fetch_peer_info(name)
+    
+    def _add_peer(self, name: str):
+        """Track another MCP instance and fetch its info."""
+        if name == self.bus_name:
+            return
+        self._peer_info.setdefault(name, '')
+        self._fetch_peer_info(name)
+    
+    def _fetch_peer_info(self, name: str):
+        """Refresh a peer's info in the background, without blocking the loop."""
+        if name in self._peer_fetching:
+            return
+        self._peer_fetching.add(name)
+        
+        def on_reply(connection, result, _data=None):
+            self._peer_fetching.discard(name)
+            try:
+                info = connection.call_finish(result).unpack()[0]
+            except GLib.Error as e:
+                logger.debug("Could not query peer %s: %s", name, e)
+                return
+            # The peer may have left while the call was in flight
+            if name in self._peer_info:
+                self._peer_info[name] = info
+                self._peer_fetched[name] = time.monotonic()
+        
+        self._connection.call(
+            name,
+            object_path_for(name),
+            'org.mcp.DBusServer',
+            'GetInfo',
+            None,
+            GLib.VariantType.new('(s)'),
+            Gio.DBusCallFlags.NONE,
+            PEER_INFO_TIMEOUT_MS,
+            None,
+            on_reply,
+            None
+        )
+    
     # Client tracking (called by main server)
     def add_client(self, client_id: str):
         """Track new client connection."""
@@ -200,6 +421,9 @@ def publish_dbus_service(server_config) -> Optional[DBusMCPService]:
         for name in service_names:
             try:
                 bus.publish(name, service)
+                # pydbus exports a single object at the path mirroring its name
+                service.bus_name = name
+                service.object_path = object_path_for(name)
                 logger.info(f"Published D-Bus service as: {name}")
                 published = True
                 break
@@ -209,6 +433,11 @@ def publish_dbus_service(server_config) -> Optional[DBusMCPService]:
         if not published:
             logger.warning("Could not publish D-Bus service under any name")
             return None
+        
+        try:
+            service.watch_peers(bus.con)
+        except Exception as e:
+            logger.warning(f"Could not track MCP peers: {e}")
             
         return service
         
@@ -5,16 +5,191 @@ Enforces security policies for D-Bus operations.
 """
 
 import os
+import sys
+import time
+import bisect
+import itertools
 import logging
+import queue
+import threading
 from typing import Dict, Any, Tuple, Set, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
-import fnmatch
+from datetime import datetime
+from collections import deque
+from functools import lru_cache
+from fnmatch import fnmatchcase
 
 from .profiles.base import SystemProfile
 
 logger = logging.getLogger(__name__)
 
+# Operations that are ALWAYS forbidden
+FORBIDDEN_OPERATIONS = frozenset({
+    'system.shutdown',
+    'system.reboot',
+    'system.poweroff',
+    'system.format_disk',
+    'system.install_package',
+    'system.remove_package',
+})
+
+# Default rate limits (operations per minute)
+DEFAULT_RATE_LIMITS = {
+    'default': 60,
+    'notify': 10,
+    'clipboard.write': 30,
+    'screenshot': 5,
+    'system.service_restart': 5,
+}
+
+# Safety levels that permit medium-level operations
+_MED_OR_LOW = frozenset({'medium', 'low'})
+
+# (category required level, policy safety level) pairs that are permitted
+_LEVEL_ALLOWS = frozenset({
+    ('high', 'high'), ('high', 'medium'), ('high', 'low'),
+    ('medium', 'medium'), ('medium', 'low'),
+    ('low', 'low'),
+})
+
+# Methods allowed at medium safety or lower that no category pattern
+# covers, keyed by exact method name:
+# (required interface or None, required service prefix or None, label)
+_SPECIAL_ALLOWS = {
+    'setClipboardContents': (None, 'org.kde.klipper', 'clipboard write'),
+    'activate': ('org.kde.Kate.Application', None, 'window activation'),
+}
+
+# Argument names redacted from audit entries
+_SENSITIVE_FIELDS = frozenset({'password', 'token', 'secret', 'key'})
+
+# Audit entries from every policy, as (policy, timestamp, tool, arguments,
+# result), drained by one shared thread so policies hold no thread of their own
+_audit_queue: queue.Queue = queue.Queue()
+_audit_thread: Optional[threading.Thread] = None
+_audit_thread_lock = threading.Lock()
+
+
+def _ensure_audit_thread():
+    """Start the shared audit drain thread if it isn't running."""
+    global _audit_thread
+    if _audit_thread is not None:
+        return
+    with _audit_thread_lock:
+        if _audit_thread is None:
+            _audit_thread = threading.Thread(
+                target=_drain_audit_queue, name='dbus-mcp-audit', daemon=True
+            )
+            _audit_thread.start()
+
+
+def _drain_audit_queue():
+    """Move queued entries into their policy's audit log (runs on the audit thread)."""
+    while True:
+        policy, timestamp, tool_name, arguments, result = _audit_queue.get()
+        try:
+            policy._record_audit_entry(timestamp, tool_name, arguments, result)
+        except Exception as e:
+            logger.error(f"Failed to record audit entry: {e}")
+        finally:
+            # Drop the reference so a finished policy can be collected
+            policy = None
+            _audit_queue.task_done()
+
+
+_WILDCARDS = '*?['
+
+# Flattened category table: (category, patterns, category info)
+_CategoryPatterns = Tuple[Tuple[str, Tuple[str, ...], Dict[str, Any]], ...]
+
+
+def _has_wildcard(text: str) -> bool:
+    """Check whether a glob fragment contains any fnmatch wildcard."""
+    return any(char in _WILDCARDS for char in text)
+
+
+def _flatten_categories(categories: Dict[str, Dict[str, Any]]) -> _CategoryPatterns:
+    """
+    Flatten the category table into tuples of interned strings.
+    
+    Index builders iterate this instead of re-fetching 'patterns' from each
+    category dict, and category names returned by lookups are interned.
+    """
+    return tuple(
+        (
+            sys.intern(category_name),
+            tuple(sys.intern(pattern) for pattern in category_info.get('patterns', [])),
+            category_info,
+        )
+        for category_name, category_info in categories.items()
+    )
+
+
+def _build_forbidden_index(flattened: _CategoryPatterns) -> Dict[str, str]:
+    """
+    Map literal method names from forbidden categories to their category.
+    
+    A name is only indexed when no earlier category pattern claims it, so a
+    hit here always agrees with a full pattern scan.
+    """
+    index = {}
+    earlier_patterns = []
+    for category_name, patterns, category_info in flattened:
+        if category_info.get('forbidden', False):
+            for pattern in patterns:
+                if _has_wildcard(pattern):
+                    continue
+                if any(fnmatchcase(pattern, p) for p in earlier_patterns):
+                    continue
+                index.setdefault(pattern, category_name)
+        earlier_patterns.extend(patterns)
+    return index
+
+
+# Trie key holding the best pattern whose literal prefix ends at a node.
+# Method names never contain an empty character, so it cannot collide.
+_TRIE_TERMINAL = ''
+
+def _index_patterns(flattened: _CategoryPatterns) -> Tuple[Any, ...]:
+    """
+    Split category globs by shape so most lookups avoid glob matching.
+    
+    Every pattern keeps its declaration order so that, when several match,
+    the category declared first still wins. Patterns are partitioned into:
+    
+    - literals ('Notify'): dict of name -> (order, category)
+    - prefixes ('Get*'): character trie; each node stores the best
+      (order, category) of the prefixes ending there
+    - suffixes ('*Desktop'): tuple of (order, suffix, category)
+    - complex globs ('*Input*'): tuple of (order, pattern, category)
+    
+    Returns:
+        Tuple of (literals, prefix trie, suffixes, complex globs)
+    """
+    literals: Dict[str, Tuple[int, str]] = {}
+    trie: Dict[str, Any] = {}
+    suffixes = []
+    complex_globs = []
+    order = 0
+    for category_name, patterns, _ in flattened:
+        for pattern in patterns:
+            entry = (order, category_name)
+            if not _has_wildcard(pattern):
+                literals.setdefault(pattern, entry)
+            elif pattern.endswith('*') and not _has_wildcard(pattern[:-1]):
+                node = trie
+                for char in pattern[:-1]:
+                    node = node.setdefault(char, {})
+                node.setdefault(_TRIE_TERMINAL, entry)
+            elif pattern.startswith('*') and not _has_wildcard(pattern[1:]):
+                suffixes.append((order, pattern[1:], category_name))
+            else:
+                complex_globs.append((order, pattern, category_name))
+                # Warm fnmatch's compiled-pattern cache so the first real
+                # lookup does not pay for glob translation
+                fnmatchcase('', pattern)
+            order += 1
+    return literals, trie, tuple(suffixes), tuple(complex_globs)
+
 
 class SecurityPolicy:
     """
@@ -179,37 +354,46 @@ class SecurityPolicy:
         }
     }
     
-    # Operations that are ALWAYS forbidden
-    FORBIDDEN_OPERATIONS = {
-        'system.shutdown',
-        'system.reboot',
-        'system.poweroff',
-        'system.format_disk',
-        'system.install_package',
-        'system.remove_package',
-    }
+    # Category patterns as tuples of interned strings
+    _PATTERNS = _flatten_categories(OPERATION_CATEGORIES)
     
-    # Default rate limits (operations per minute)
-    DEFAULT_RATE_LIMITS = {
-        'default': 60,
-        'notify': 10,
-        'clipboard.write': 30,
-        'screenshot': 5,
-        'system.service_restart': 5,
-    }
+    # Category patterns indexed by shape, shared by every instance
+    (_LITERAL_PATTERNS, _PREFIX_TRIE,
+     _SUFFIX_PATTERNS, _COMPLEX_PATTERNS) = _index_patterns(_PATTERNS)
+    
+    # Literal forbidden method names, checked before the full pattern scan
+    _FORBIDDEN_BY_METHOD = _build_forbidden_index(_PATTERNS)
+    
+    # Kept as class attributes for existing callers
+    FORBIDDEN_OPERATIONS = FORBIDDEN_OPERATIONS
+    DEFAULT_RATE_LIMITS = DEFAULT_RATE_LIMITS
     
-    def __init__(self, safety_level: str = None):
+    # Number of audit entries retained
+    AUDIT_LOG_SIZE = 10000
+    
+    # Sliding window for rate limits, in seconds
+    RATE_LIMIT_WINDOW = 60.0
+    
+    def __init__(self, safety_level: str = None, verbose_audit: bool = False):
         """
         Initialize the security policy.
         
         Args:
             safety_level: One of SAFETY_HIGH, SAFETY_MEDIUM, SAFETY_LOW
+            verbose_audit: Also record a 'check_started' entry for every check
         """
-        # Rate limiting tracking
-        self.operation_history: Dict[str, list] = defaultdict(list)
+        # Rate limiting tracking: per-tool ring of monotonic timestamps,
+        # sized to the tool's limit
+        self.operation_history: Dict[str, deque] = {}
+        
+        # Limit for tools without their own entry in DEFAULT_RATE_LIMITS
+        self._default_limit = DEFAULT_RATE_LIMITS['default']
         
-        # Audit log
-        self.audit_log = []
+        # Audit log (oldest entries drop off once full). Checks only enqueue
+        # raw entries; the shared audit thread owns the deque and the logging.
+        self.audit_log: deque = deque(maxlen=self.AUDIT_LOG_SIZE)
+        self.verbose_audit = verbose_audit
+        _ensure_audit_thread()
         
         # Set safety level with default
         if safety_level is None:
@@ -220,8 +404,17 @@ class SecurityPolicy:
             logger.warning(f"Unknown safety level: {safety_level}, defaulting to HIGH")
             self.safety_level = self.SAFETY_HIGH
         
+        # Profile facts used by check_operation, cached per profile object
+        self._cached_profile: Optional[SystemProfile] = None
+        self._disabled_tool_categories: frozenset = frozenset()
+        self._profile_is_systemd = False
+        
         logger.info(f"Security policy initialized with safety level: {self.safety_level}")
     
+    def _level_permits(self, required_level: Optional[str]) -> bool:
+        """Check if the current safety level permits a category's required level."""
+        return (required_level, self.safety_level) in _LEVEL_ALLOWS
+    
     @property
     def safety_level_emoji(self) -> str:
         """Get emoji representation of safety level."""
@@ -249,95 +442,112 @@ class SecurityPolicy:
         Returns:
             Tuple of (allowed, reason)
         """
-        # Log the check
-        self._audit_log(tool_name, arguments, "check_started")
+        if self.verbose_audit:
+            self._audit_log(tool_name, arguments, "check_started")
         
-        # Check if operation is forbidden
+        # Rejecting checks run first, cheapest first, so a denied operation
+        # never touches the rate limit history
         if self._is_forbidden(tool_name):
             self._audit_log(tool_name, arguments, "forbidden")
             return False, f"Operation '{tool_name}' is forbidden"
         
-        # Check rate limits
-        if not self._check_rate_limit(tool_name):
-            self._audit_log(tool_name, arguments, "rate_limited")
-            return False, f"Rate limit exceeded for '{tool_name}'"
+        if profile is not self._cached_profile:
+            self._cache_profile(profile)
         
         # Check profile-specific restrictions
-        available_tools = profile.get_available_tools()
-        tool_category = tool_name.split('.')[0]
+        tool_category = tool_name.partition('.')[0]
         
-        if tool_category in available_tools and not available_tools[tool_category]:
+        if tool_category in self._disabled_tool_categories:
             self._audit_log(tool_name, arguments, "not_available_in_profile")
             return False, f"Tool category '{tool_category}' not available in profile {profile.name}"
         
         # Additional checks based on tool
-        if tool_name.startswith('system.') and not profile.detect_init_system() == 'systemd':
+        if not self._profile_is_systemd and tool_name.startswith('system.'):
             return False, "System tools require systemd"
         
+        # Rate limits last - this is the only check that records state
+        if not self._check_rate_limit(tool_name):
+            self._audit_log(tool_name, arguments, "rate_limited")
+            return False, f"Rate limit exceeded for '{tool_name}'"
+        
         # All checks passed
         self._audit_log(tool_name, arguments, "allowed")
         return True, "Operation allowed"
     
+    def _cache_profile(self, profile: SystemProfile):
+        """
+        Cache the profile facts check_operation needs.
+        
+        A server uses one profile for its lifetime, so tool availability
+        and the init system are only queried when the profile changes.
+        """
+        available_tools = profile.get_available_tools()
+        self._disabled_tool_categories = frozenset(
+            category for category, enabled in available_tools.items() if not enabled
+        )
+        self._profile_is_systemd = profile.detect_init_system() == 'systemd'
+        self._cached_profile = profile
+    
     def _is_forbidden(self, tool_name: str) -> bool:
         """Check if an operation is in the forbidden list."""
-        return tool_name in self.FORBIDDEN_OPERATIONS
+        return tool_name in FORBIDDEN_OPERATIONS
     
     def _check_rate_limit(self, tool_name: str) -> bool:
         """
         Check if operation is within rate limits.
         
         Returns True if allowed, False if rate limited.
-        """
-        now = datetime.now()
-        one_minute_ago = now - timedelta(minutes=1)
         
-        # Clean old entries
-        self.operation_history[tool_name] = [
-            timestamp for timestamp in self.operation_history[tool_name]
-            if timestamp > one_minute_ago
-        ]
-        
-        # Get rate limit for this operation
-        if tool_name in self.DEFAULT_RATE_LIMITS:
-            limit = self.DEFAULT_RATE_LIMITS[tool_name]
-        else:
-            limit = self.DEFAULT_RATE_LIMITS['default']
+        Each tool keeps a deque with maxlen equal to its limit, so appending
+        evicts the oldest timestamp. The call is over the limit only when
+        the ring is full and its oldest entry is still inside the window.
+        """
+        now = time.monotonic()
+        history = self.operation_history.get(tool_name)
+        if history is None:
+            limit = DEFAULT_RATE_LIMITS.get(tool_name, self._default_limit)
+            history = self.operation_history[tool_name] = deque(maxlen=limit)
         
         # Check if under limit
-        if len(self.operation_history[tool_name]) >= limit:
+        if len(history) == history.maxlen and now - history[0] < self.RATE_LIMIT_WINDOW:
             return False
         
         # Record this operation
-        self.operation_history[tool_name].append(now)
+        history.append(now)
         return True
     
     def _audit_log(self, tool_name: str, arguments: Dict[str, Any], result: str):
-        """Add entry to audit log."""
-        entry = {
-            'timestamp': datetime.now().isoformat(),
+        """Queue an entry for the audit log."""
+        # Raw epoch seconds; formatted only when the log is read
+        _audit_queue.put_nowait((self, time.time(), tool_name, arguments, result))
+    
+    def _record_audit_entry(self, timestamp: float, tool_name: str,
+                            arguments: Dict[str, Any], result: str):
+        """Append a queued entry to the audit log (runs on the audit thread)."""
+        self.audit_log.append({
+            'timestamp': timestamp,
             'tool': tool_name,
             'arguments': self._sanitize_arguments(arguments),
             'result': result
-        }
-        
-        self.audit_log.append(entry)
+        })
         
         # Log significant events
-        if result in ['forbidden', 'rate_limited']:
-            logger.warning(f"Security event: {result} for {tool_name}")
-        
-        # Keep audit log size manageable
-        if len(self.audit_log) > 10000:
-            self.audit_log = self.audit_log[-5000:]
+        if result in ('forbidden', 'rate_limited'):
+            logger.warning("Security event: %s for %s", result, tool_name)
     
     def _sanitize_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize arguments for logging (remove sensitive data)."""
+        # Most calls carry nothing sensitive. Still copied: the entry is
+        # written later by the drain thread, and the caller may change
+        # its dict in the meantime
+        if _SENSITIVE_FIELDS.isdisjoint(arguments):
+            return dict(arguments)
+        
         # Create a copy
         sanitized = arguments.copy()
         
         # Remove potentially sensitive fields
-        sensitive_fields = {'password', 'token', 'secret', 'key'}
-        for field in sensitive_fields:
+        for field in _SENSITIVE_FIELDS:
             if field in sanitized:
                 sanitized[field] = '<redacted>'
         
@@ -345,21 +555,30 @@ class SecurityPolicy:
     
     def get_audit_log(self, limit: int = 100) -> list:
         """Get recent audit log entries."""
-        return self.audit_log[-limit:]
+        # Wait for queued entries so the log includes every finished check
+        _audit_queue.join()
+        
+        # Walk back from the newest entry so only `limit` items are touched
+        recent = list(itertools.islice(reversed(self.audit_log), limit))
+        recent.reverse()
+        return [
+            {**entry, 'timestamp': datetime.fromtimestamp(entry['timestamp']).isoformat()}
+            for entry in recent
+        ]
     
     def get_rate_limit_status(self) -> Dict[str, Dict[str, Any]]:
         """Get current rate limit status for all operations."""
-        now = datetime.now()
-        one_minute_ago = now - timedelta(minutes=1)
+        cutoff = time.monotonic() - self.RATE_LIMIT_WINDOW
         
         status = {}
-        for tool_name, timestamps in self.operation_history.items():
-            recent_count = len([t for t in timestamps if t > one_minute_ago])
-            
-            if tool_name in self.DEFAULT_RATE_LIMITS:
-                limit = self.DEFAULT_RATE_LIMITS[tool_name]
+        for tool_name, history in self.operation_history.items():
+            if not history or history[0] > cutoff:
+                # Whole ring is inside the window; no search needed
+                recent_count = len(history)
             else:
-                limit = self.DEFAULT_RATE_LIMITS['default']
+                # Timestamps are monotonic, so the history is already sorted
+                recent_count = len(history) - bisect.bisect_right(history, cutoff)
+            limit = history.maxlen
             
             status[tool_name] = {
                 'current': recent_count,
@@ -375,12 +594,7 @@ class SecurityPolicy:
         
         Returns the category name if matched, None otherwise.
         """
-        for category_name, category_info in self.OPERATION_CATEGORIES.items():
-            patterns = category_info.get('patterns', [])
-            for pattern in patterns:
-                if fnmatch.fnmatch(method, pattern):
-                    return category_name
-        return None
+        return _categorize_method_cached(method)
     
     def get_method_interaction_info(self, method: str) -> Optional[Dict[str, Any]]:
         """
@@ -415,46 +629,94 @@ class SecurityPolicy:
         Returns:
             True if the method call is allowed, False otherwise
         """
-        # First, try to categorize the method
-        category = self._categorize_method(method)
+        # The decision and its log line depend only on the safety level and
+        # the call; logged here so every blocked call is still recorded
+        allowed, level, message = _method_decision(self.safety_level, service, interface, method)
+        logger.log(level, message)
+        return allowed
+
+
+@lru_cache(maxsize=4096)
+def _method_decision(safety_level: str, service: str, interface: str,
+                     method: str) -> Tuple[bool, int, str]:
+    """
+    Decide whether a method call is allowed at a safety level, memoized.
+    
+    OPERATION_CATEGORIES is fixed at class level, so decisions can be shared
+    by every SecurityPolicy. Returns (allowed, log level, log message).
+    """
+    # Known destructive names resolve with a single dict lookup;
+    # everything else falls through to pattern categorization
+    category = SecurityPolicy._FORBIDDEN_BY_METHOD.get(method)
+    if category is None:
+        category = _categorize_method_cached(method)
+    
+    if category:
+        info = SecurityPolicy.OPERATION_CATEGORIES[category]
         
-        if category:
-            category_info = self.OPERATION_CATEGORIES[category]
-            
-            # Check if forbidden
-            if category_info.get('forbidden', False):
-                logger.warning(f"Blocked forbidden category '{category}': {service}.{interface}.{method}")
-                return False
-            
-            # Check safety level requirement
-            required_level = category_info.get('safety_level')
-            
-            if required_level == 'high':
-                # Always allowed
-                logger.debug(f"Allowed '{category}' (high safety): {method}")
-                return True
-            elif required_level == 'medium' and self.safety_level in ['medium', 'low']:
-                logger.debug(f"Allowed '{category}' (medium safety): {method}")
-                return True
-            elif required_level == 'low' and self.safety_level == 'low':
-                logger.debug(f"Allowed '{category}' (low safety): {method}")
-                return True
-            else:
-                logger.info(f"Blocked '{category}' - requires {required_level} safety, current: {self.safety_level}")
-                return False
-        
-        # Special handling for clipboard write at medium safety
-        # (since setClipboardContents doesn't match our write patterns)
-        if self.safety_level in ['medium', 'low']:
-            if method == 'setClipboardContents' and 'klipper' in service:
-                logger.debug(f"Allowed clipboard write (special case): {method}")
-                return True
-            
-            # Also handle window activation methods that don't match patterns
-            if method == 'activate' and interface == 'org.kde.Kate.Application':
-                logger.debug(f"Allowed window activation (special case): {method}")
-                return True
-        
-        # If no category matched, deny by default
-        logger.info(f"Method not categorized, denying: {service}.{interface}.{method}")
-        return False
\ No newline at end of file
+        # Check if forbidden
+        if info.get('forbidden', False):
+            return False, logging.WARNING, f"Blocked forbidden category '{category}': {service}.{interface}.{method}"
+        
+        # Check safety level requirement
+        required_level = info.get('safety_level')
+        if (required_level, safety_level) in _LEVEL_ALLOWS:
+            return True, logging.DEBUG, f"Allowed '{category}' at {safety_level} safety: {method}"
+        
+        return False, logging.INFO, f"Blocked '{category}' - requires {required_level} safety, current: {safety_level}"
+    
+    # Special cases for methods the patterns miss
+    # (e.g. Klipper's setClipboardContents)
+    override = _SPECIAL_ALLOWS.get(method)
+    if override is not None and safety_level in _MED_OR_LOW:
+        required_interface, service_prefix, label = override
+        if ((required_interface is None or interface == required_interface)
+                and (service_prefix is None or service.startswith(service_prefix))):
+            return True, logging.DEBUG, f"Allowed {label} (special case): {method}"
+    
+    # If no category matched, deny by default
+    return False, logging.INFO, f"Method not categorized, denying: {service}.{interface}.{method}"
+
+
+@lru_cache(maxsize=4096)
+def _categorize_method_cached(method: str) -> Optional[str]:
+    """
+    Resolve a method name to its category, memoized per method name.
+    
+    OPERATION_CATEGORIES is fixed at class level, so results can be shared
+    by every SecurityPolicy. Stages run from cheapest to most general:
+    exact literal lookup, prefix trie walk, suffix checks, then fnmatch for
+    the few complex globs. Each stage only needs to beat the best
+    declaration order found so far.
+    """
+    best = SecurityPolicy._LITERAL_PATTERNS.get(method)
+    
+    # Every node on the path is a prefix of the method
+    node = SecurityPolicy._PREFIX_TRIE
+    depth = 0
+    while node is not None:
+        terminal = node.get(_TRIE_TERMINAL)
+        if terminal is not None and (best is None or terminal < best):
+            best = terminal
+        if depth == len(method):
+            break
+        node = node.get(method[depth])
+        depth += 1
+    
+    # Remaining stages are ordered, so stop at the first match or once
+    # nothing left can beat the current best
+    for order, suffix, category_name in SecurityPolicy._SUFFIX_PATTERNS:
+        if best is not None and order >= best[0]:
+            break
+        if method.endswith(suffix):
+            best = (order, category_name)
+            break
+    
+    for order, pattern, category_name in SecurityPolicy._COMPLEX_PATTERNS:
+        if best is not None and order >= best[0]:
+            break
+        if fnmatchcase(method, pattern):
+            best = (order, category_name)
+            break
+    
+    return best[1] if best is not None else None
@@ -4,11 +4,20 @@ D-Bus MCP Server Core Implementation using low-level MCP API
 This module contains the main MCP server that bridges between
 AI clients and D-Bus services on Linux systems, using the 
 low-level MCP library for maximum control.
+
+Request handling here is I/O and dict dispatch, not numeric loops, so JIT
+compilers such as Numba were evaluated and rejected: they cannot compile
+this code and would add seconds of import time. Repeated argument checks
+are memoized instead.
 """
 
+import math
+import socket
+import time
 import logging
+from collections import defaultdict
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Callable
-from datetime import datetime
 import json
 
 from mcp.server.lowlevel import Server, NotificationOptions
@@ -21,9 +30,121 @@ from .profiles.base import SystemProfile
 from .dbus_manager import DBusManager
 from .security import SecurityPolicy
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _finite(value: Any) -> Any:
+    """Copy a result with NaN and infinities replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _dumps_indented(result: Any) -> str:
+    """
+    Serialize a tool result as indented JSON, using orjson when installed.
+    
+    NaN and infinities become null on both paths, as orjson writes them,
+    so the output does not depend on which serializer is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            # orjson rejects some values json accepts, such as ints over 64 bits
+            pass
+    return json.dumps(_finite(result), indent=2)
+
+
+def _dict_content(result: dict) -> List[TextContent]:
+    """Convert a dict result to JSON text content."""
+    return [TextContent(type="text", text=_dumps_indented(result))]
+
+
+def _text_content(result: str) -> List[TextContent]:
+    """Wrap a string result as text content."""
+    return [TextContent(type="text", text=result)]
+
+
+def _list_content(result: list) -> list:
+    """List results are already content items."""
+    return result
+
+
+# Tool result converters keyed by exact result type
+_RESULT_CONTENT: Dict[type, Callable[[Any], list]] = {
+    dict: _dict_content,
+    str: _text_content,
+    list: _list_content,
+}
+
+
+def _fallback_content(result: Any) -> list:
+    """Convert subclasses of the known result types, or anything else via str()."""
+    for result_type, converter in _RESULT_CONTENT.items():
+        if isinstance(result, result_type):
+            return converter(result)
+    return _text_content(str(result))
+
+
+# Python types accepted for each JSON Schema type in a tool's inputSchema
+_JSON_TYPES: Dict[str, Any] = {
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+    'array': (list, tuple),
+    'object': dict,
+}
+
+
+def _argument_error(schema: Dict[str, Any], arguments: Dict[str, Any]) -> Optional[str]:
+    """
+    Check tool arguments against the tool's input schema.
+    
+    Covers required arguments, declared types and enums. A null value is
+    treated as an omitted argument.
+    
+    Returns:
+        A message describing the first problem, or None if the arguments fit
+    """
+    missing = [name for name in schema.get('required', ()) if arguments.get(name) is None]
+    if missing:
+        return f"Missing required argument(s): {', '.join(missing)}"
+    
+    properties = schema.get('properties', {})
+    for name, value in arguments.items():
+        spec = properties.get(name)
+        if spec is None or value is None:
+            continue
+        
+        type_name = spec.get('type')
+        expected = _JSON_TYPES.get(type_name) if isinstance(type_name, str) else None
+        if expected is not None:
+            # bool is an int subclass, but not a JSON number
+            if not isinstance(value, expected) or (
+                    isinstance(value, bool) and type_name in ('integer', 'number')):
+                return f"Argument '{name}' must be of type {type_name}"
+        
+        enum = spec.get('enum')
+        if enum is not None and value not in enum:
+            return f"Argument '{name}' must be one of: {', '.join(map(str, enum))}"
+    
+    return None
+
 
 class ServerConfig(BaseModel):
     """Configuration for the D-Bus MCP server."""
@@ -36,6 +157,7 @@ class ServerConfig(BaseModel):
     rate_limit_per_minute: int = 60
     enable_system_bus: bool = True
     enable_audit_log: bool = True
+    verbose_audit: bool = False  # Also audit every check start
     
     # Feature flags
     enable_discovery_tools: bool = True
@@ -78,7 +200,10 @@ class DBusMCPServer:
         self.dbus_manager = DBusManager(
             enable_system_bus=self.config.enable_system_bus
         )
-        self.security = SecurityPolicy(safety_level=self.config.safety_level)
+        self.security = SecurityPolicy(
+            safety_level=self.config.safety_level,
+            verbose_audit=self.config.verbose_audit
+        )
         
         # Initialize file manager for operations that create files
         from .file_manager import FilePipeManager
@@ -90,14 +215,18 @@ class DBusMCPServer:
         # Tool registry
         self.tools: Dict[str, Tool] = {}
         self.tool_handlers: Dict[str, Callable] = {}
+        # tools/list response, rebuilt only after the tool set changes
+        self._tools_list_cache: Optional[List[Tool]] = None
+        # Argument checks by (tool, frozen arguments); cleared with the tool set
+        self._cached_argument_error = lru_cache(maxsize=256)(self._frozen_argument_error)
         
         # Statistics
         self.stats = {
-            "start_time": datetime.now(),
+            "start_time": time.monotonic(),
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
-            "requests_by_tool": {}
+            "requests_by_tool": defaultdict(int)
         }
         
         # Set up server handlers
@@ -114,50 +243,40 @@ class DBusMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """Return available tools."""
-            return list(self.tools.values())
+            if self._tools_list_cache is None:
+                self._tools_list_cache = list(self.tools.values())
+            return self._tools_list_cache
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[Any]:
             """Handle tool execution."""
-            if name not in self.tool_handlers:
+            handler = self.tool_handlers.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
             
             # Update statistics
-            self.stats["total_requests"] += 1
-            self.stats["requests_by_tool"][name] = \
-                self.stats["requests_by_tool"].get(name, 0) + 1
+            stats = self.stats
+            stats["total_requests"] += 1
+            stats["requests_by_tool"][name] += 1
+            
+            error = self._argument_error(name, arguments)
+            if error is not None:
+                stats["failed_requests"] += 1
+                raise ValueError(f"Invalid arguments for {name}: {error}")
             
             try:
                 # Execute the tool handler
-                handler = self.tool_handlers[name]
-                logger.debug(f"Executing tool handler for: {name}")
+                logger.debug("Executing tool handler for: %s", name)
                 result = await handler(arguments)
-                logger.debug(f"Tool {name} returned result type: {type(result)}")
+                logger.debug("Tool %s returned result type: %s", name, type(result))
                 
                 self.stats["successful_requests"] += 1
                 
                 # Ensure result is a list of content items
-                if isinstance(result, dict):
-                    # Convert dict to text content
-                    content = [TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                elif isinstance(result, str):
-                    content = [TextContent(
-                        type="text",
-                        text=result
-                    )]
-                elif isinstance(result, list):
-                    content = result
-                else:
-                    # Fallback
-                    content = [TextContent(
-                        type="text",
-                        text=str(result)
-                    )]
+                converter = _RESULT_CONTENT.get(type(result), _fallback_content)
+                content = converter(result)
                 
-                logger.debug(f"Tool {name} returning content: {content}")
+                logger.debug("Tool %s returning content: %s", name, content)
                 return content
                 
             except Exception as e:
@@ -165,6 +284,20 @@ class DBusMCPServer:
                 logger.error(f"Tool {name} failed: {e}", exc_info=True)
                 raise
     
+    def _argument_error(self, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Check a call's arguments against its tool's schema, memoized when hashable."""
+        arguments = arguments or {}
+        try:
+            key = frozenset(arguments.items())
+        except TypeError:
+            # Lists or objects among the values; checked without the cache
+            return _argument_error(self.tools[name].inputSchema, arguments)
+        return self._cached_argument_error(name, key)
+    
+    def _frozen_argument_error(self, name: str, frozen_arguments: frozenset) -> Optional[str]:
+        """Uncached check behind _argument_error, for hashable arguments."""
+        return _argument_error(self.tools[name].inputSchema, dict(frozen_arguments))
+    
     def add_tool(self, tool: Tool, handler: Callable):
         """
         Add a tool to the server.
@@ -175,6 +308,8 @@ class DBusMCPServer:
         """
         self.tools[tool.name] = tool
         self.tool_handlers[tool.name] = handler
+        self._tools_list_cache = None
+        self._cached_argument_error.cache_clear()
         logger.debug(f"Registered tool: {tool.name}")
     
     def remove_tool(self, name: str):
@@ -182,18 +317,28 @@ class DBusMCPServer:
         if name in self.tools:
             del self.tools[name]
             del self.tool_handlers[name]
+            self._tools_list_cache = None
+            self._cached_argument_error.cache_clear()
             logger.debug(f"Removed tool: {name}")
     
     def publish_on_dbus(self):
         """Publish this MCP server as a D-Bus service for discovery."""
         try:
-            from .dbus_service import publish_dbus_service
+            from .dbus_service import publish_dbus_service, DBUS_MCP_INTERFACE
             
             # Add profile name to config for the service
             self.config.profile_name = self.profile.name
             
             self.dbus_service = publish_dbus_service(self.config)
             if self.dbus_service:
+                self.dbus_manager.published_service = self.dbus_service
+                # introspect() on our own object needs no round trip to ourselves
+                self.dbus_manager.add_static_introspection(
+                    'session',
+                    self.dbus_service.bus_name,
+                    self.dbus_service.object_path,
+                    DBUS_MCP_INTERFACE
+                )
                 logger.info("MCP server published on D-Bus for discovery")
                 return True
             else:
@@ -203,11 +348,16 @@ class DBusMCPServer:
             logger.error(f"Error publishing D-Bus service: {e}")
             return False
     
-    async def run_stdio(self):
-        """Run the server with stdio transport."""
+    async def run_stdio(self, sock: Optional[socket.socket] = None):
+        """Run the server with stdio transport (or a given or systemd-passed socket)."""
         from mcp import stdio_server
+        from .systemd_server import get_systemd_socket, socket_stdio_streams
+        
+        if sock is None:
+            sock = get_systemd_socket()
+        streams = stdio_server() if sock is None else socket_stdio_streams(sock)
         
-        async with stdio_server() as (read_stream, write_stream):
+        async with streams as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
                 write_stream,
@@ -5,9 +5,9 @@ This module contains the main MCP server that bridges between
 AI clients and D-Bus services on Linux systems.
 """
 
+import time
 import logging
 from typing import Optional, Dict, Any
-from datetime import datetime
 
 from mcp.server import FastMCP
 from pydantic import BaseModel
@@ -31,6 +31,7 @@ class ServerConfig(BaseModel):
     rate_limit_per_minute: int = 60
     enable_system_bus: bool = True
     enable_audit_log: bool = True
+    verbose_audit: bool = False  # Also audit every check start
     
     # Feature flags
     enable_discovery_tools: bool = True
@@ -40,6 +41,32 @@ class ServerConfig(BaseModel):
         extra = "allow"
 
 
+class ServerStats:
+    """
+    Request counters for a running server.
+    
+    A plain __slots__ class rather than dataclass(slots=True), which needs
+    Python 3.10; counter updates are slot stores instead of dict lookups.
+    """
+    
+    __slots__ = (
+        "start_time",
+        "total_requests",
+        "successful_requests",
+        "failed_requests",
+        "requests_by_tool",
+    )
+    
+    def __init__(self):
+        # Monotonic, so uptime is immune to wall-clock changes
+        self.start_time = time.monotonic()
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        # Per-tool counters are [total, successful, failed]
+        self.requests_by_tool: Dict[str, list] = {}
+
+
 class DBusMCPServer:
     """
     Main D-Bus MCP Server implementation.
@@ -73,7 +100,10 @@ class DBusMCPServer:
         self.dbus_manager = DBusManager(
             enable_system_bus=self.config.enable_system_bus
         )
-        self.security = SecurityPolicy(safety_level=self.config.safety_level)
+        self.security = SecurityPolicy(
+            safety_level=self.config.safety_level,
+            verbose_audit=self.config.verbose_audit
+        )
         
         # Initialize file manager for operations that create files
         from .file_manager import FilePipeManager
@@ -83,13 +113,7 @@ class DBusMCPServer:
         self.file_manager = FilePipeManager(profile=profile)
         
         # Statistics
-        self.stats = {
-            "start_time": datetime.now(),
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "requests_by_tool": {}
-        }
+        self.stats = ServerStats()
         
         # Initialize server information
         self._setup_server_info()
@@ -102,13 +126,21 @@ class DBusMCPServer:
     def publish_on_dbus(self):
         """Publish this MCP server as a D-Bus service for discovery."""
         try:
-            from .dbus_service import publish_dbus_service
+            from .dbus_service import publish_dbus_service, DBUS_MCP_INTERFACE
             
             # Add profile name to config for the service
             self.config.profile_name = self.profile.name
             
             self.dbus_service = publish_dbus_service(self.config)
             if self.dbus_service:
+                self.dbus_manager.published_service = self.dbus_service
+                # introspect() on our own object needs no round trip to ourselves
+                self.dbus_manager.add_static_introspection(
+                    'session',
+                    self.dbus_service.bus_name,
+                    self.dbus_service.object_path,
+                    DBUS_MCP_INTERFACE
+                )
                 logger.info("MCP server published on D-Bus for discovery")
                 return True
             else:
@@ -135,18 +167,21 @@ class DBusMCPServer:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get server statistics."""
-        uptime = datetime.now() - self.stats["start_time"]
-        
+        stats = self.stats
         return {
-            "uptime_seconds": uptime.total_seconds(),
-            "total_requests": self.stats["total_requests"],
-            "successful_requests": self.stats["successful_requests"],
-            "failed_requests": self.stats["failed_requests"],
+            "uptime_seconds": time.monotonic() - stats.start_time,
+            "total_requests": stats.total_requests,
+            "successful_requests": stats.successful_requests,
+            "failed_requests": stats.failed_requests,
             "success_rate": (
-                self.stats["successful_requests"] / self.stats["total_requests"]
-                if self.stats["total_requests"] > 0 else 0
+                stats.successful_requests / stats.total_requests
+                if stats.total_requests > 0 else 0
             ),
-            "requests_by_tool": self.stats["requests_by_tool"],
+            "requests_by_tool": {
+                tool_name: {"total": total, "successful": successful, "failed": failed}
+                for tool_name, (total, successful, failed)
+                in stats.requests_by_tool.items()
+            },
             "profile": self.profile.name,
             "dbus_connections": {
                 "session": self.dbus_manager.session_bus is not None,
@@ -156,25 +191,19 @@ class DBusMCPServer:
     
     def track_request(self, tool_name: str, success: bool):
         """Track a tool request for statistics."""
-        self.stats["total_requests"] += 1
+        stats = self.stats
+        stats.total_requests += 1
         
         if success:
-            self.stats["successful_requests"] += 1
+            stats.successful_requests += 1
         else:
-            self.stats["failed_requests"] += 1
-        
-        if tool_name not in self.stats["requests_by_tool"]:
-            self.stats["requests_by_tool"][tool_name] = {
-                "total": 0,
-                "successful": 0,
-                "failed": 0
-            }
+            stats.failed_requests += 1
         
-        self.stats["requests_by_tool"][tool_name]["total"] += 1
-        if success:
-            self.stats["requests_by_tool"][tool_name]["successful"] += 1
-        else:
-            self.stats["requests_by_tool"][tool_name]["failed"] += 1
+        counters = stats.requests_by_tool.get(tool_name)
+        if counters is None:
+            counters = stats.requests_by_tool[tool_name] = [0, 0, 0]
+        counters[0] += 1
+        counters[1 if success else 2] += 1
     
     async def handle_tool_request(self, tool_name: str, arguments: Dict[str, Any]):
         """
@@ -194,8 +223,6 @@ class DBusMCPServer:
             self.track_request(tool_name, False)
             raise PermissionError(f"Operation denied: {reason}")
         
-        # Rate limiting would be checked here
-        
         # Tool executes the request
         # (actual execution happens in the tool implementation)
         
@@ -2,113 +2,193 @@
 """
 Socket bridge for systemd socket activation.
 
-This module bridges systemd socket activation to FastMCP's stdio-based transport.
-When systemd passes a socket, we accept connections and proxy them to/from stdio.
+This module bridges systemd socket activation to the MCP stdio transport.
+When systemd passes a socket, the server runs in this process and speaks
+line-delimited JSON directly on it. Setting DBUS_MCP_BRIDGE_SUBPROCESS=1
+restores the old behaviour of proxying the socket to a server subprocess.
+
+An io_uring transport was considered and not adopted: serving in-process
+already removes the pipe copies it would have sped up, and the Python
+liburing bindings are not packaged by the distributions we target.
 """
 
 import os
 import sys
+import fcntl
 import asyncio
 import socket
 import logging
 from typing import Optional
 
+from .systemd_server import listen_fds, child_environment
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# First file descriptor passed by systemd socket activation
+SD_LISTEN_FDS_START = 3
+
+# Bytes moved per read; large enough for typical MCP messages in one go
+CHUNK_SIZE = 1 << 16
+
+# Kernel buffer size requested for the pipes and the systemd socket
+BUFFER_SIZE = 1 << 20
+
+# F_SETPIPE_SZ is only exposed by the fcntl module from Python 3.10
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+
+
+def _grow_pipe(fd: int):
+    """Enlarge a pipe's kernel buffer, keeping the default if refused."""
+    try:
+        fcntl.fcntl(fd, F_SETPIPE_SZ, BUFFER_SIZE)
+    except OSError as e:
+        logger.debug(f"Could not resize pipe {fd}: {e}")
+
+
+def _grow_socket_buffers(sock: socket.socket):
+    """Enlarge a socket's send and receive buffers, best effort."""
+    for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, BUFFER_SIZE)
+        except OSError as e:
+            logger.debug(f"Could not set socket buffer option {option}: {e}")
+
 
 async def socket_to_stdio_bridge():
-    """Bridge systemd socket to stdio for FastMCP compatibility."""
-    # Check for systemd socket activation
-    listen_fds = int(os.environ.get('LISTEN_FDS', '0'))
+    """Serve MCP over the systemd-activated socket."""
+    # Check for systemd socket activation; this also clears the LISTEN_*
+    # variables, so neither an exec'd nor a child server sees them
+    listen_fds_count = listen_fds()
     
-    if listen_fds == 0:
+    if listen_fds_count == 0:
         # No socket activation - just exec the regular server
         logger.info("No systemd socket activation detected, running in direct mode")
         os.execvp(sys.executable, [sys.executable, '-m', 'dbus_mcp'] + sys.argv[1:])
         return
     
-    if listen_fds > 1:
-        logger.warning(f"Multiple sockets passed ({listen_fds}), using first one")
-    
-    # Get the socket from systemd (always starts at FD 3)
-    sock_fd = 3
+    # systemd passes sockets starting at FD 3. Each server publishes its own
+    # D-Bus service, so only one listener is supported; extra ones are closed
+    for sock_fd in range(SD_LISTEN_FDS_START + 1, SD_LISTEN_FDS_START + listen_fds_count):
+        logger.warning(f"Ignoring extra systemd socket FD {sock_fd}; only one listener is served")
+        os.close(sock_fd)
     
+    await _serve_socket(SD_LISTEN_FDS_START)
+
+
+async def _serve_socket(sock_fd: int):
+    """Serve MCP over one systemd-passed socket."""
     try:
         # Create socket from file descriptor
         sock = socket.socket(fileno=sock_fd)
-        sock.setblocking(False)
+        _grow_socket_buffers(sock)
         
         logger.info(f"Using systemd socket activation (FD={sock_fd})")
         
         # For Unix domain sockets with Accept=no, we need to handle a single connection
         # The socket is already connected when passed by systemd
-        
-        # Create async streams from the socket
-        reader, writer = await asyncio.open_connection(sock=sock)
-        
-        # Create pipes for subprocess stdio
-        stdin_r, stdin_w = os.pipe()
-        stdout_r, stdout_w = os.pipe()
-        
-        # Start the actual MCP server as subprocess with piped stdio
-        proc = await asyncio.create_subprocess_exec(
-            sys.executable, '-m', 'dbus_mcp', *sys.argv[1:],
-            stdin=stdin_r,
-            stdout=stdout_w,
-            stderr=sys.stderr.fileno()
-        )
-        
-        # Close unused pipe ends
-        os.close(stdin_r)
-        os.close(stdout_w)
-        
-        # Create tasks for bidirectional proxying
-        async def proxy_socket_to_stdin():
-            """Copy data from socket to MCP server stdin."""
-            stdin_stream = os.fdopen(stdin_w, 'wb')
-            try:
-                while True:
-                    data = await reader.read(4096)
-                    if not data:
-                        break
-                    stdin_stream.write(data)
-                    stdin_stream.flush()
-            except Exception as e:
-                logger.error(f"Error proxying socket to stdin: {e}")
-            finally:
-                stdin_stream.close()
-        
-        async def proxy_stdout_to_socket():
-            """Copy data from MCP server stdout to socket."""
-            stdout_stream = os.fdopen(stdout_r, 'rb')
-            try:
-                while True:
-                    data = await asyncio.get_event_loop().run_in_executor(
-                        None, stdout_stream.read, 4096
-                    )
-                    if not data:
-                        break
-                    writer.write(data)
-                    await writer.drain()
-            except Exception as e:
-                logger.error(f"Error proxying stdout to socket: {e}")
-            finally:
-                stdout_stream.close()
-                writer.close()
-                await writer.wait_closed()
-        
-        # Run proxy tasks concurrently
-        await asyncio.gather(
-            proxy_socket_to_stdin(),
-            proxy_stdout_to_socket(),
-            proc.wait()
-        )
+        if os.environ.get('DBUS_MCP_BRIDGE_SUBPROCESS') == '1':
+            await _proxy_to_subprocess(sock)
+        else:
+            await _serve_in_process(sock)
         
     except Exception as e:
-        logger.error(f"Socket bridge error: {e}")
+        logger.error(f"Socket bridge error on FD {sock_fd}: {e}")
         raise
 
 
+async def _serve_in_process(sock: socket.socket):
+    """Run the MCP server in this process directly on the socket."""
+    from .__main__ import create_parser, create_server, serve_stdio
+    
+    args = create_parser().parse_args(sys.argv[1:])
+    mcp_server = create_server(args)
+    await serve_stdio(mcp_server, sock)
+
+
+async def _proxy_to_subprocess(sock: socket.socket):
+    """Proxy the socket to a server subprocess over its stdio pipes."""
+    sock.setblocking(False)
+    
+    # Create async streams from the socket
+    reader, writer = await asyncio.open_connection(sock=sock)
+    
+    # Create pipes for subprocess stdio
+    stdin_r, stdin_w = os.pipe()
+    stdout_r, stdout_w = os.pipe()
+    _grow_pipe(stdin_w)
+    _grow_pipe(stdout_r)
+    
+    # Start the actual MCP server as subprocess with piped stdio
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, '-m', 'dbus_mcp', *sys.argv[1:],
+        stdin=stdin_r,
+        stdout=stdout_w,
+        stderr=sys.stderr.fileno(),
+        # The child gets the socket as stdio, not as fd 3
+        env=child_environment()
+    )
+    
+    # Close unused pipe ends
+    os.close(stdin_r)
+    os.close(stdout_w)
+    
+    # Attach the pipes to the event loop so both directions are polled
+    # directly instead of going through executor threads
+    loop = asyncio.get_running_loop()
+    stdout_reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(stdout_reader),
+        os.fdopen(stdout_r, 'rb', buffering=0)
+    )
+    stdin_transport, stdin_protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin,
+        os.fdopen(stdin_w, 'wb', buffering=0)
+    )
+    stdin_writer = asyncio.StreamWriter(stdin_transport, stdin_protocol, None, loop)
+    
+    # Create tasks for bidirectional proxying
+    async def proxy_socket_to_stdin():
+        """Copy data from socket to MCP server stdin."""
+        try:
+            while True:
+                data = await reader.read(CHUNK_SIZE)
+                if not data:
+                    break
+                stdin_writer.write(data)
+                await stdin_writer.drain()
+        except Exception as e:
+            logger.error(f"Error proxying socket to stdin: {e}")
+        finally:
+            stdin_writer.close()
+    
+    async def proxy_stdout_to_socket():
+        """Copy data from MCP server stdout to socket."""
+        try:
+            while True:
+                data = await stdout_reader.read(CHUNK_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except Exception as e:
+            logger.error(f"Error proxying stdout to socket: {e}")
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    
+    # Run proxy tasks concurrently
+    await asyncio.gather(
+        proxy_socket_to_stdin(),
+        proxy_stdout_to_socket(),
+        proc.wait()
+    )
+
+
 async def main():
     """Main entry point for socket bridge."""
     # Set up logging
@@ -127,4 +207,7 @@ async def main():
 
 
 if __name__ == '__main__':
+    # uvloop is optional; fall back to the stock loop when it isn't installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
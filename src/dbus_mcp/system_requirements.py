@@ -5,13 +5,34 @@ Checks for system-level Python packages that cannot be installed via pip
 and must be installed through the system package manager.
 """
 
-import importlib
+import re
+import sys
+import contextlib
+import importlib.util
 import logging
-import platform
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Install command per distro ID; {} is replaced by the package name
+INSTALL_CMD_TEMPLATES: Dict[str, str] = {
+    'arch': 'sudo pacman -S {}',
+    'debian': 'sudo apt install {}',
+    'ubuntu': 'sudo apt install {}',
+    'fedora': 'sudo dnf install {}',
+    'rhel': 'sudo yum install {}',
+    'centos': 'sudo yum install {}',
+    'opensuse': 'sudo zypper install {}',
+}
+_DEFAULT_INSTALL_CMD = 'Install {} using your system package manager'
+
+# Release files checked in order, with the pattern for the distro ID line
+_RELEASE_FILES = (
+    ('/etc/os-release', re.compile(r'^ID=(.*)$', re.MULTILINE)),
+    ('/etc/lsb-release', re.compile(r'^DISTRIB_ID=(.*)$', re.MULTILINE)),
+)
+
 
 class SystemPackage:
     """Represents a system-level Python package requirement."""
@@ -29,14 +50,36 @@ class SystemPackage:
         self.description = description
         self.required = required
         self.features = features or []
+        self._checked: Optional[Tuple[bool, Optional[str]]] = None
+        self._resolved_names: Dict[str, str] = {}
     
     def check(self) -> Tuple[bool, Optional[str]]:
-        """Check if the package is available."""
-        try:
-            importlib.import_module(self.import_name)
-            return True, None
-        except ImportError as e:
-            return False, str(e)
+        """Check if the package is available (probed once per process)."""
+        if self._checked is None:
+            if self.import_name in sys.modules:
+                self._checked = (True, None)
+            else:
+                # Locate the module without executing it; importing
+                # bindings like systemd's has side effects
+                try:
+                    if importlib.util.find_spec(self.import_name) is not None:
+                        self._checked = (True, None)
+                    else:
+                        self._checked = (False, f"No module named '{self.import_name}'")
+                except (ImportError, ValueError) as e:
+                    self._checked = (False, str(e))
+        return self._checked
+    
+    def package_name(self, distro: str) -> str:
+        """Get the system package name for a distro, falling back to Debian's."""
+        name = self._resolved_names.get(distro)
+        if name is None:
+            name = self.package_names.get(
+                distro,
+                self.package_names.get('debian', 'python3-' + self.import_name)
+            )
+            self._resolved_names[distro] = name
+        return name
 
 
 # System packages registry
@@ -70,27 +113,16 @@ SYSTEM_PACKAGES = [
 ]
 
 
+@lru_cache(maxsize=1)
 def detect_distro() -> str:
     """Detect the Linux distribution."""
-    try:
-        # Try to read /etc/os-release
-        with open('/etc/os-release', 'r') as f:
-            for line in f:
-                if line.startswith('ID='):
-                    return line.strip().split('=')[1].strip('"').lower()
-    except:
-        pass
-    
-    # Fallback to platform
-    dist = platform.linux_distribution()[0].lower()
-    if 'debian' in dist or 'ubuntu' in dist:
-        return 'debian'
-    elif 'arch' in dist:
-        return 'arch'
-    elif 'fedora' in dist:
-        return 'fedora'
-    elif 'rhel' in dist or 'centos' in dist:
-        return 'rhel'
+    for path, id_pattern in _RELEASE_FILES:
+        # A missing or unreadable file just moves on to the next one
+        with contextlib.suppress(OSError):
+            with open(path, 'r') as f:
+                match = id_pattern.search(f.read())
+            if match:
+                return match.group(1).strip().strip('"').lower()
     
     return 'unknown'
 
@@ -137,20 +169,8 @@ def check_system_requirements() -> Dict[str, Dict]:
 
 def get_install_command(distro: str, package: SystemPackage) -> str:
     """Get the installation command for a package on the given distro."""
-    package_name = package.package_names.get(distro, package.package_names.get('debian', 'python3-' + package.import_name))
-    
-    if distro == 'arch':
-        return f"sudo pacman -S {package_name}"
-    elif distro in ['debian', 'ubuntu']:
-        return f"sudo apt install {package_name}"
-    elif distro in ['fedora']:
-        return f"sudo dnf install {package_name}"
-    elif distro in ['rhel', 'centos']:
-        return f"sudo yum install {package_name}"
-    elif distro == 'opensuse':
-        return f"sudo zypper install {package_name}"
-    else:
-        return f"Install {package_name} using your system package manager"
+    template = INSTALL_CMD_TEMPLATES.get(distro, _DEFAULT_INSTALL_CMD)
+    return template.format(package.package_name(distro))
 
 
 def print_requirements_report():
@@ -205,6 +225,5 @@ def check_and_warn():
 
 if __name__ == "__main__":
     # Run as a standalone script to check requirements
-    import sys
     if not print_requirements_report():
         sys.exit(1)
\ No newline at end of file
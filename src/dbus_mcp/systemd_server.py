@@ -2,121 +2,116 @@
 """
 SystemD socket activation support for D-Bus MCP server.
 
-This module provides a custom stdio transport that works with systemd socket activation.
-It wraps the socket file descriptors to make them compatible with FastMCP's stdio expectations.
+When systemd passes a connected socket, the MCP stdio transport is run
+directly over it instead of over the process's stdin/stdout.
 """
 
 import os
-import sys
 import socket
-import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-class SystemdSocketWrapper:
-    """Wraps systemd socket to provide file-like interface for FastMCP."""
+def pin_cpu_from_env():
+    """
+    Pin this process to the CPUs listed in DBUS_MCP_PIN_CPU, if set.
     
-    def __init__(self, sock: socket.socket, mode: str):
-        self.socket = sock
-        self.mode = mode
-        self._buffer = b''
-        
-    def fileno(self):
-        """Return the socket's file descriptor."""
-        return self.socket.fileno()
-    
-    def readable(self):
-        """Check if socket is readable."""
-        return 'r' in self.mode
+    Takes a comma-separated list such as "2" or "2,3". Keeping the
+    request/response loop on the same cores as its peer avoids cache
+    misses from cross-core wakeups.
+    """
+    cpu_list = os.environ.get('DBUS_MCP_PIN_CPU')
+    if not cpu_list:
+        return
     
-    def writable(self):
-        """Check if socket is writable."""
-        return 'w' in self.mode
+    try:
+        cpus = {int(cpu) for cpu in cpu_list.split(',') if cpu.strip()}
+        os.sched_setaffinity(0, cpus)
+        logger.info(f"Pinned to CPUs: {sorted(cpus)}")
+    except (ValueError, OSError) as e:
+        logger.warning(f"Ignoring DBUS_MCP_PIN_CPU={cpu_list!r}: {e}")
+
+
+# Environment systemd sets for the process it passes sockets to
+LISTEN_ENV_VARS = ('LISTEN_FDS', 'LISTEN_PID', 'LISTEN_FDNAMES')
+
+
+def listen_fds(unset_environment: bool = True) -> int:
+    """
+    Count the sockets systemd passed to this process, as sd_listen_fds() does.
     
-    def read(self, size: int = -1) -> bytes:
-        """Read from socket."""
-        if size == -1:
-            size = 65536  # Read in chunks
-        try:
-            data = self.socket.recv(size)
-            return data
-        except BlockingIOError:
-            return b''
+    The count only applies when LISTEN_PID names this process; a child that
+    inherited the variables must not take its own fd 3 for the socket.
     
-    def write(self, data: bytes) -> int:
-        """Write to socket."""
-        try:
-            return self.socket.send(data)
-        except BlockingIOError:
+    Args:
+        unset_environment: Remove the LISTEN_* variables once read, so
+            child processes don't inherit them
+    """
+    try:
+        if os.environ.get('LISTEN_PID') != str(os.getpid()):
             return 0
-    
-    def flush(self):
-        """No-op for compatibility."""
-        pass
-    
-    def close(self):
-        """Close the socket."""
-        self.socket.close()
+        return max(int(os.environ.get('LISTEN_FDS', '0')), 0)
+    except ValueError as e:
+        logger.warning(f"Ignoring malformed LISTEN_FDS: {e}")
+        return 0
+    finally:
+        if unset_environment:
+            for name in LISTEN_ENV_VARS:
+                os.environ.pop(name, None)
+
 
+def child_environment() -> dict:
+    """Copy of the environment without the systemd socket activation variables."""
+    return {key: value for key, value in os.environ.items() if key not in LISTEN_ENV_VARS}
 
-def setup_systemd_stdio():
-    """Set up stdio using systemd socket activation."""
+
+def get_systemd_socket() -> Optional[socket.socket]:
+    """Return the socket passed by systemd socket activation, if any."""
     # Check for systemd socket activation
-    listen_fds = int(os.environ.get('LISTEN_FDS', '0'))
+    listen_fds_count = listen_fds()
     
-    if listen_fds == 0:
+    if listen_fds_count == 0:
         # No socket activation, use regular stdio
-        return False
+        return None
     
-    if listen_fds > 1:
-        logger.warning(f"Multiple sockets passed ({listen_fds}), using first one")
+    if listen_fds_count > 1:
+        logger.warning(f"Multiple sockets passed ({listen_fds_count}), using first one")
     
     # Get the socket from systemd (always starts at FD 3)
     sock_fd = 3
     
     try:
         # Create socket from file descriptor
-        sock = socket.fromfd(sock_fd, socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.setblocking(False)
-        
+        sock = socket.socket(fileno=sock_fd)
         logger.info(f"Using systemd socket activation (FD={sock_fd})")
-        
-        # Create wrapped file objects
-        stdin_wrapper = SystemdSocketWrapper(sock, 'rb')
-        stdout_wrapper = SystemdSocketWrapper(sock, 'wb')
-        
-        # Replace sys.stdin and sys.stdout with our wrappers
-        # Save originals first
-        sys._orig_stdin = sys.stdin
-        sys._orig_stdout = sys.stdout
-        sys._orig_stdin_buffer = sys.stdin.buffer
-        sys._orig_stdout_buffer = sys.stdout.buffer
-        
-        # Create TextIOWrapper around our socket wrappers
-        import io
-        sys.stdin = io.TextIOWrapper(io.BufferedReader(stdin_wrapper), encoding='utf-8')
-        sys.stdout = io.TextIOWrapper(io.BufferedWriter(stdout_wrapper), encoding='utf-8', line_buffering=True)
-        
-        # Also update the buffer attributes
-        sys.stdin.buffer = io.BufferedReader(stdin_wrapper)
-        sys.stdout.buffer = io.BufferedWriter(stdout_wrapper)
-        
-        return True
+        pin_cpu_from_env()
+        return sock
         
     except Exception as e:
         logger.error(f"Failed to set up systemd socket: {e}")
         raise
 
 
-def restore_stdio():
-    """Restore original stdio if needed."""
-    if hasattr(sys, '_orig_stdin'):
-        sys.stdin = sys._orig_stdin
-        sys.stdout = sys._orig_stdout
-        delattr(sys, '_orig_stdin')
-        delattr(sys, '_orig_stdout')
-        delattr(sys, '_orig_stdin_buffer')
-        delattr(sys, '_orig_stdout_buffer')
\ No newline at end of file
+@asynccontextmanager
+async def socket_stdio_streams(sock: socket.socket):
+    """
+    Open MCP stdio read/write streams over a connected socket.
+    
+    The MCP stdio transport accepts any async text files, so the socket's
+    file objects are handed to it directly. The socket is closed on exit.
+    """
+    import anyio
+    from mcp.server.stdio import stdio_server
+    
+    sock.setblocking(True)
+    stdin = anyio.wrap_file(sock.makefile('r', encoding='utf-8', newline=''))
+    stdout = anyio.wrap_file(sock.makefile('w', encoding='utf-8', newline=''))
+    
+    try:
+        async with stdio_server(stdin, stdout) as streams:
+            yield streams
+    finally:
+        sock.close()
@@ -2,6 +2,7 @@
 Screenshot tools for D-Bus MCP server using low-level API.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List
 import os
@@ -13,6 +14,95 @@ logger = logging.getLogger(__name__)
 
 def create_screenshot_tools(profile, security, dbus_manager, file_manager) -> List[tuple[Tool, callable]]:
     """Create screenshot-related tools."""
+    # The profile's screenshot interface is fixed for the process, so
+    # resolve it and pick the desktop-specific calls once, up front
+    config = profile.get_screenshot_config()
+    service_cache: Dict[str, Any] = {}
+    
+    def get_service():
+        """Get the screenshot service proxy, creating it on first use."""
+        service = service_cache.get('proxy')
+        if service is None:
+            service = service_cache['proxy'] = dbus_manager.get_service(
+                'session',
+                config['service'],
+                config['path']
+            )
+        return service
+    
+    def capture_to_file(method: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Capture through KWin's ScreenShot2 interface.
+        
+        KWin writes the image straight into a managed file through a passed
+        file descriptor, so the pixels never travel in the D-Bus reply.
+        """
+        fd, ref_id = file_manager.create_pipe("screenshot", "png")
+        try:
+            result = dbus_manager.call_with_fd(
+                'session',
+                config['service'],
+                config['path'],
+                config['interface'],
+                method,
+                [{}],  # options
+                fd
+            )
+            
+            # Finalizing converts KWin's raw framebuffer to PNG if needed
+            file_manager.finalize_file(ref_id, {
+                'type': 'image/png',
+                'result': result or {},
+                'capture_metadata': result,
+                **metadata
+            })
+        except Exception as e:
+            file_manager.mark_error(ref_id, str(e))
+            raise
+        
+        return {'id': ref_id, 'filename': file_manager.get_file_info(ref_id).path}
+    
+    # Different desktop environments have different interfaces
+    if config and config.get('adapter') == 'kwin':
+        methods = config.get('methods', {})
+        
+        def take_full_screen() -> Dict[str, Any]:
+            return capture_to_file(methods.get('screen', 'CaptureActiveScreen'), {})
+        
+        def take_active_window() -> Dict[str, Any]:
+            return capture_to_file(
+                methods.get('window', 'CaptureActiveWindow'),
+                {'window': 'active'}
+            )
+    elif 'kde' in profile.name.lower():
+        def take_full_screen() -> Dict[str, Any]:
+            # KDE uses ScreenShot2 interface
+            result = get_service().CaptureImage(
+                0,  # x
+                0,  # y
+                0,  # width (0 = full screen)
+                0,  # height (0 = full screen)
+                False,  # include_cursor
+                False   # include_decoration
+            )
+            return profile.process_screenshot_data(result, file_manager)
+        
+        def take_active_window() -> Dict[str, Any]:
+            # KDE uses CaptureActiveWindow
+            result = get_service().CaptureActiveWindow(
+                False,  # include_decoration
+                False   # include_cursor
+            )
+            return profile.process_screenshot_data(result, file_manager)
+    else:
+        def take_full_screen() -> Dict[str, Any]:
+            # GNOME/Generic interface
+            filename = get_service().Screenshot(False, True, "/tmp/screenshot.png")
+            return {'filename': filename, 'id': os.path.basename(filename)}
+        
+        def take_active_window() -> Dict[str, Any]:
+            filename = get_service().ScreenshotWindow(True, True, "/tmp/screenshot.png")
+            return {'filename': filename, 'id': os.path.basename(filename)}
     
     async def capture_screen(arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Capture a screenshot of the entire screen."""
@@ -21,45 +111,17 @@ def create_screenshot_tools(profile, security, dbus_manager, file_manager) -> Li
             allowed, reason = security.check_operation('capture_screenshot', {
                 'type': 'screen',
                 'target': 'full_screen'
-            })
+            }, profile)
             
             if not allowed:
                 return {"error": f"Operation blocked: {reason}"}
             
-            # Get screenshot config from profile
-            config = profile.get_screenshot_config()
             if not config:
                 return {"error": "Screenshot not supported on this profile"}
             
-            # Call D-Bus method to capture screenshot
-            service = dbus_manager.get_service(
-                'session',
-                config['service'],
-                config['path']
-            )
-            
-            # Different desktop environments have different interfaces
-            if 'kde' in profile.name.lower():
-                # KDE uses ScreenShot2 interface
-                result = service.CaptureImage(
-                    0,  # x
-                    0,  # y
-                    0,  # width (0 = full screen)
-                    0,  # height (0 = full screen)
-                    False,  # include_cursor
-                    False   # include_decoration
-                )
-                
-                # Process the screenshot data
-                screenshot_data = profile.process_screenshot_data(result, file_manager)
-                
-            else:
-                # GNOME/Generic interface
-                filename = service.Screenshot(False, True, "/tmp/screenshot.png")
-                screenshot_data = {
-                    'filename': filename,
-                    'id': os.path.basename(filename)
-                }
+            # The D-Bus round trip and image processing block, so keep them
+            # off the event loop
+            screenshot_data = await asyncio.to_thread(take_full_screen)
             
             return {
                 "id": screenshot_data.get('id'),
@@ -68,6 +130,8 @@ def create_screenshot_tools(profile, security, dbus_manager, file_manager) -> Li
             }
             
         except Exception as e:
+            # Drop the proxy so the next call reconnects to the service
+            service_cache.clear()
             logger.error(f"Failed to capture screenshot: {e}")
             return {"error": f"Failed to capture screenshot: {str(e)}"}
     
@@ -78,41 +142,15 @@ def create_screenshot_tools(profile, security, dbus_manager, file_manager) -> Li
             allowed, reason = security.check_operation('capture_screenshot', {
                 'type': 'window',
                 'target': 'active_window'
-            })
+            }, profile)
             
             if not allowed:
                 return {"error": f"Operation blocked: {reason}"}
             
-            # Get screenshot config from profile
-            config = profile.get_screenshot_config()
             if not config:
                 return {"error": "Screenshot not supported on this profile"}
             
-            # Call D-Bus method to capture active window
-            service = dbus_manager.get_service(
-                'session',
-                config['service'],
-                config['path']
-            )
-            
-            # Different desktop environments have different interfaces
-            if 'kde' in profile.name.lower():
-                # KDE uses CaptureActiveWindow
-                result = service.CaptureActiveWindow(
-                    False,  # include_decoration
-                    False   # include_cursor
-                )
-                
-                # Process the screenshot data
-                screenshot_data = profile.process_screenshot_data(result, file_manager)
-                
-            else:
-                # GNOME/Generic interface
-                filename = service.ScreenshotWindow(True, True, "/tmp/screenshot.png")
-                screenshot_data = {
-                    'filename': filename,
-                    'id': os.path.basename(filename)
-                }
+            screenshot_data = await asyncio.to_thread(take_active_window)
             
             return {
                 "id": screenshot_data.get('id'),
@@ -121,17 +159,19 @@ def create_screenshot_tools(profile, security, dbus_manager, file_manager) -> Li
             }
             
         except Exception as e:
+            # Drop the proxy so the next call reconnects to the service
+            service_cache.clear()
             logger.error(f"Failed to capture active window: {e}")
             return {"error": f"Failed to capture active window: {str(e)}"}
     
     async def list_screenshot_files(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """List available screenshot files."""
         try:
-            files = file_manager.list_files()
+            files = await asyncio.to_thread(file_manager.list_files)
             return [
                 {
-                    "id": f["id"],
-                    "filename": f["filename"],
+                    "id": f["reference"],
+                    "filename": f["path"],
                     "size": f["size"],
                     "created": f["created"].isoformat() if hasattr(f["created"], 'isoformat') else str(f["created"])
                 }
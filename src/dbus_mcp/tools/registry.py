@@ -5,11 +5,19 @@ This module handles registration of all available tools based on
 the system profile and security settings.
 """
 
+import asyncio
 import logging
+from operator import attrgetter
 from typing import Dict, Any, List
 import json
 
 from mcp import Tool
+from gi.repository import GLib
+
+try:
+    from dbus_fast import Variant as FastVariant
+except ImportError:
+    FastVariant = None
 
 from ..profiles.base import SystemProfile
 from ..security import SecurityPolicy
@@ -19,69 +27,152 @@ from ..file_manager import FilePipeManager
 
 logger = logging.getLogger(__name__)
 
+# Bus connection accessor per accepted "bus" argument; read on each call
+# since DBusManager connects lazily
+_BUS_ACCESSORS = {
+    'session': attrgetter('session_bus'),
+    'system': attrgetter('system_bus'),
+}
+
+# Notification urgency byte by name (freedesktop notification spec)
+_URGENCY = {'low': 0, 'normal': 1, 'critical': 2}
+
+# Notify hints per urgency, marshalled to GLib.Variant once; GVariants are
+# immutable and pydbus only reads the dict
+_URGENCY_HINTS = {
+    name: {'urgency': GLib.Variant('y', value)}
+    for name, value in _URGENCY.items()
+}
+
+# The same hints for the dbus-fast path, when it is installed
+if FastVariant is not None:
+    _FAST_URGENCY_HINTS = {
+        name: {'urgency': FastVariant('y', value)}
+        for name, value in _URGENCY.items()
+    }
+
+# show_help text; every line ends in a newline so blocks concatenate
+_HELP_HEADER = """\
+D-Bus MCP Server - Available Capabilities
+Profile: {name} - {description}
+Safety Level: {emoji} {level}
+
+Core Tools:
+- show_help: Show this help message
+- notify: Send desktop notification
+- status: Get system status overview
+- discover: Explore available tools by category
+- list_services: List all D-Bus services
+- introspect: Explore service interfaces and methods
+- call_method: Call arbitrary D-Bus methods
+
+"""
+
+_HELP_MEDIUM_SAFETY = """\
+Current Safety Level - {emoji} Productivity operations (recommended for development):
+
+  ✏️ Send text to editors (Kate, KWrite)
+  📁 Open files/folders in Dolphin
+  🌐 Open URLs in browser
+  🪟 Focus and activate windows
+  📸 Take screenshots (with user consent)
+  ⌨️ Simulate keyboard input to active window
+
+"""
+
+# Tool definitions are constant, so they are built once at import and
+# shared by every server that registers them
+_HELP_TOOL = Tool(
+    name="show_help",
+    description="Show available D-Bus MCP capabilities and tools",
+    inputSchema={
+        "type": "object",
+        "properties": {}
+    }
+)
+
+_NOTIFY_TOOL = Tool(
+    name="notify",
+    description="Send a desktop notification to the user",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "title": {
+                "type": "string",
+                "description": "Notification title"
+            },
+            "message": {
+                "type": "string",
+                "description": "Notification message body"
+            },
+            "urgency": {
+                "type": "string",
+                "enum": ["low", "normal", "critical"],
+                "default": "normal",
+                "description": "Urgency level"
+            }
+        },
+        "required": ["title", "message"]
+    }
+)
+
+_LIST_SERVICES_TOOL = Tool(
+    name="list_services",
+    description="List all available D-Bus services",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "bus": {
+                "type": "string",
+                "enum": ["session", "system"],
+                "default": "session",
+                "description": "D-Bus type to query"
+            }
+        }
+    }
+)
+
 
 def create_help_tool(server, profile: SystemProfile, security: SecurityPolicy) -> tuple[Tool, callable]:
     """Create the help tool."""
     
+    # The output depends only on the profile and the safety level, which
+    # are fixed for the server's lifetime, so build it once
+    emoji = security.safety_level_emoji
+    header = _HELP_HEADER.format(
+        name=profile.name,
+        description=profile.description,
+        emoji=emoji,
+        level=security.safety_level.upper()
+    )
+    
+    # Add safety level info
+    safety_block = _HELP_MEDIUM_SAFETY.format(emoji=emoji) if security.safety_level == "medium" else ""
+    
+    # Add profile-specific capabilities
+    capabilities = profile.get_available_tools()
+    capabilities_block = ""
+    if capabilities:
+        capabilities_block = "Profile-Specific Tools:\n" + "".join(
+            f"  - {category}\n" for category, tools in capabilities.items() if tools
+        )
+    
+    footer = f"\nTo change safety level, restart with: --safety-level {security.safety_level}"
+    help_text = "".join((header, safety_block, capabilities_block, footer))
+    
     async def help_handler(arguments: Dict[str, Any]) -> str:
         """Show available D-Bus MCP capabilities and tools."""
-        lines = [
-            "D-Bus MCP Server - Available Capabilities",
-            f"Profile: {profile.name} - {profile.description}",
-            f"Safety Level: {security.safety_level_emoji} {security.safety_level.upper()}",
-            "",
-            "Core Tools:",
-            "- show_help: Show this help message",
-            "- notify: Send desktop notification",
-            "- status: Get system status overview",
-            "- discover: Explore available tools by category",
-            "- list_services: List all D-Bus services",
-            "- introspect: Explore service interfaces and methods",
-            "- call_method: Call arbitrary D-Bus methods",
-            ""
-        ]
-        
-        # Add safety level info
-        if security.safety_level == "medium":
-            lines.extend([
-                f"Current Safety Level - {security.safety_level_emoji} Productivity operations (recommended for development):",
-                "",
-                "  ✏️ Send text to editors (Kate, KWrite)",
-                "  📁 Open files/folders in Dolphin",
-                "  🌐 Open URLs in browser",
-                "  🪟 Focus and activate windows",
-                "  📸 Take screenshots (with user consent)",
-                "  ⌨️ Simulate keyboard input to active window",
-                ""
-            ])
-        
-        # Add profile-specific capabilities
-        capabilities = profile.get_available_tools()
-        if capabilities:
-            lines.append("Profile-Specific Tools:")
-            for category, tools in capabilities.items():
-                if tools:
-                    lines.append(f"  - {category}")
-        
-        lines.append(f"\nTo change safety level, restart with: --safety-level {security.safety_level}")
-        
-        return "\n".join(lines)
-    
-    tool = Tool(
-        name="show_help",
-        description="Show available D-Bus MCP capabilities and tools",
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
-    )
+        return help_text
     
-    return tool, help_handler
+    return _HELP_TOOL, help_handler
 
 
-def create_notify_tool(profile: SystemProfile) -> tuple[Tool, callable]:
+def create_notify_tool(profile: SystemProfile, dbus_manager: DBusManager) -> tuple[Tool, callable]:
     """Create the notify tool."""
     
+    config = profile.get_notification_config()
+    notify_path = config.get('path', '/org/freedesktop/Notifications')
+    
     async def notify_handler(arguments: Dict[str, Any]) -> str:
         """Send a desktop notification."""
         title = arguments.get("title", "")
@@ -89,36 +180,42 @@ def create_notify_tool(profile: SystemProfile) -> tuple[Tool, callable]:
         urgency = arguments.get("urgency", "normal")
         
         try:
-            from ..dbus_manager import DBusManager
+            # With dbus-fast installed, send it from the event loop without
+            # going through GLib's marshalling or a blocking call
+            if dbus_manager.has_async_backend:
+                hints = _FAST_URGENCY_HINTS.get(urgency, _FAST_URGENCY_HINTS['normal'])
+                reply = await dbus_manager.call_async(
+                    config['service'],
+                    notify_path,
+                    'org.freedesktop.Notifications',
+                    'Notify',
+                    'susssasa{sv}i',
+                    ['dbus-mcp', 0, '', title, message, [], hints, 5000]
+                )
+                return f"Notification sent (ID: {reply[0]})"
             
-            # Get notification config from profile
-            config = profile.get_notification_config()
+            # Unknown urgencies fall back to normal
+            hints = _URGENCY_HINTS.get(urgency, _URGENCY_HINTS['normal'])
             
-            # Connect to D-Bus
-            dbus = DBusManager()
-            notifier = dbus.get_service(
+            # Send notification through Gio's async API on the server's
+            # connection, so the event loop keeps running meanwhile
+            (notification_id,) = await dbus_manager.call_gio(
                 'session',
                 config['service'],
-                config.get('path', '/org/freedesktop/Notifications')
-            )
-            
-            # Convert urgency to int
-            urgency_map = {'low': 0, 'normal': 1, 'critical': 2}
-            urgency_int = urgency_map.get(urgency, 1)
-            
-            # Send notification
-            from gi.repository import GLib
-            hints = {'urgency': GLib.Variant('y', urgency_int)}
-            
-            notification_id = notifier.Notify(
-                'dbus-mcp',      # app_name
-                0,               # replaces_id
-                '',              # icon
-                title,           # summary
-                message,         # body
-                [],              # actions
-                hints,           # hints with GLib.Variant
-                5000             # timeout (ms)
+                notify_path,
+                'org.freedesktop.Notifications',
+                'Notify',
+                GLib.Variant('(susssasa{sv}i)', (
+                    'dbus-mcp',      # app_name
+                    0,               # replaces_id
+                    '',              # icon
+                    title,           # summary
+                    message,         # body
+                    [],              # actions
+                    hints,           # hints with GLib.Variant
+                    5000             # timeout (ms)
+                )),
+                '(u)'
             )
             
             return f"Notification sent (ID: {notification_id})"
@@ -127,32 +224,7 @@ def create_notify_tool(profile: SystemProfile) -> tuple[Tool, callable]:
             logger.error(f"Failed to send notification: {e}")
             return f"Failed to send notification: {str(e)}"
     
-    tool = Tool(
-        name="notify",
-        description="Send a desktop notification to the user",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "description": "Notification title"
-                },
-                "message": {
-                    "type": "string",
-                    "description": "Notification message body"
-                },
-                "urgency": {
-                    "type": "string",
-                    "enum": ["low", "normal", "critical"],
-                    "default": "normal",
-                    "description": "Urgency level"
-                }
-            },
-            "required": ["title", "message"]
-        }
-    )
-    
-    return tool, notify_handler
+    return _NOTIFY_TOOL, notify_handler
 
 
 def create_list_services_tool(dbus_manager: DBusManager) -> tuple[Tool, callable]:
@@ -164,53 +236,26 @@ def create_list_services_tool(dbus_manager: DBusManager) -> tuple[Tool, callable
         
         try:
             # Get the appropriate bus
-            if bus == "session":
-                if not dbus_manager.session_bus:
-                    return "Session bus not available"
-                bus_obj = dbus_manager.session_bus
-            elif bus == "system":
-                if not dbus_manager.system_bus:
-                    return "System bus not available"
-                bus_obj = dbus_manager.system_bus
-            else:
+            get_bus = _BUS_ACCESSORS.get(bus)
+            if get_bus is None:
                 return f"Invalid bus type: {bus}. Use 'session' or 'system'"
+            if not get_bus(dbus_manager):
+                return f"{bus.capitalize()} bus not available"
             
-            # Get service list
-            dbus_service = bus_obj.get('org.freedesktop.DBus', '/org/freedesktop/DBus')
-            services = dbus_service.ListNames()
-            
-            # Sort and categorize
-            well_known = sorted([s for s in services if not s.startswith(':')])
-            unique = [s for s in services if s.startswith(':')]
-            
-            lines = [f"{bus.capitalize()} Bus Services ({len(well_known)} well-known, {len(unique)} unique):"]
-            lines.append("\nWell-known services:")
-            for service in well_known:
-                lines.append(f"  {service}")
+            # Sorted names mirrored by the manager: fetched once with
+            # ListNames, then kept current from NameOwnerChanged signals
+            well_known, unique_count = dbus_manager.get_well_known_names(bus)
             
-            return "\n".join(lines)
+            header = f"{bus.capitalize()} Bus Services ({len(well_known)} well-known, {unique_count} unique):"
+            # One join with the indent in the separator, so no per-name strings
+            body = "  " + "\n  ".join(well_known) if well_known else ""
+            return header + "\n\nWell-known services:\n" + body
             
         except Exception as e:
             logger.error(f"Failed to list services: {e}")
             return f"Failed to list services: {str(e)}"
     
-    tool = Tool(
-        name="list_services",
-        description="List all available D-Bus services",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "bus": {
-                    "type": "string",
-                    "enum": ["session", "system"],
-                    "default": "session",
-                    "description": "D-Bus type to query"
-                }
-            }
-        }
-    )
-    
-    return tool, list_services_handler
+    return _LIST_SERVICES_TOOL, list_services_handler
 
 
 def register_core_tools(
@@ -237,7 +282,7 @@ def register_core_tools(
     server.add_tool(tool, handler)
     
     # 2. Notify tool
-    tool, handler = create_notify_tool(profile)
+    tool, handler = create_notify_tool(profile, dbus_manager)
     server.add_tool(tool, handler)
     
     # 3. List services tool
@@ -261,4 +306,37 @@ def register_core_tools(
         server.add_tool(tool, handler)
     logger.info("Registered MCP discovery tools")
     
-    logger.info(f"Registered core tools for profile: {profile.name}")
\ No newline at end of file
+    logger.info(f"Registered core tools for profile: {profile.name}")
+
+
+async def prewarm_core_tools(profile: SystemProfile, dbus_manager: DBusManager):
+    """
+    Open the D-Bus state the core tools use, with the lookups overlapped.
+    
+    Registration itself makes no bus calls, so the first tool calls would
+    otherwise pay for connecting, the name list and the notifier proxy.
+    Meant to run alongside the server; failures only cost the warm start.
+    """
+    config = profile.get_notification_config()
+    
+    def seed_names(bus_name: str):
+        dbus_manager.get_well_known_names(bus_name)
+    
+    def resolve_notifier():
+        dbus_manager.get_cached_service(
+            'session',
+            config['service'],
+            config.get('path', '/org/freedesktop/Notifications')
+        )
+    
+    jobs = [lambda: seed_names('session'), resolve_notifier]
+    if dbus_manager.enable_system_bus:
+        jobs.append(lambda: seed_names('system'))
+    
+    results = await asyncio.gather(
+        *(asyncio.to_thread(job) for job in jobs),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug("Prewarm step failed: %s", result)
@@ -4,15 +4,39 @@ Tool Registry
 Registers MCP tools based on system profile and configuration.
 """
 
+import os
+import sys
+import time
+import reprlib
+import asyncio
 import logging
-from typing import Dict, Any, TYPE_CHECKING, Optional, List
+import threading
+from typing import Dict, Any, TYPE_CHECKING, Optional, List, Callable
 
 from mcp.server import FastMCP
+from mcp.server.fastmcp import Context
 from mcp import Tool
 from mcp.types import TextContent
 from gi.repository import GLib
 
 from ..profiles.base import SystemProfile
+from ..dbus_manager import INTROSPECT_CACHE_SIZE
+from .system.mcp_discovery_fastmcp import create_mcp_discovery_tools
+from .tool_index import ToolIndex, summarize
+
+# Interfaces every object has (Introspectable, Properties, Peer, ...),
+# left out of introspect() listings
+_STANDARD_IFACE_PREFIX = 'org.freedesktop.DBus.'
+
+# lxml walks introspection documents in C; the stdlib parser is the fallback
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _IFACE_XPATH = None
+else:
+    # The standard interfaces are filtered out during the C traversal
+    _IFACE_XPATH = ET.XPath(f'interface[not(starts-with(@name, "{_STANDARD_IFACE_PREFIX}"))]')
 
 if TYPE_CHECKING:
     from ..security import SecurityPolicy
@@ -21,6 +45,259 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# With DBUS_MCP_LAZY=1 only help, discover and load_tool are advertised at
+# startup; the rest are held back until load_tool() asks for them, keeping
+# unused schemas out of the client's prompt
+LAZY_TOOLS = os.environ.get('DBUS_MCP_LAZY') == '1'
+
+# How long a status() environment probe is reused before re-detecting
+ENV_CACHE_TTL = 5.0
+
+# Seconds a tool waits on the bus before giving up, so a hung service costs
+# one tool call rather than stalling the client; Gio calls are given the
+# same budget so GLib drops the pending reply too
+TOOL_TIMEOUTS = {
+    'notify': 5.0,
+    'status': 2.0,
+    'list_services': 5.0,
+    'introspect': 10.0,
+    'call_method': 30.0,
+    'clipboard': 5.0,
+    'capture': 30.0,
+}
+
+# call_method result formatting: items are shown through a bounded repr,
+# and the listing stops once it passes MAX_RESULT_CHARS
+MAX_RESULT_CHARS = 4096
+_RESULT_REPR = reprlib.Repr()
+_RESULT_REPR.maxlist = _RESULT_REPR.maxtuple = _RESULT_REPR.maxdict = _RESULT_REPR.maxset = 20
+_RESULT_REPR.maxstring = 1024
+_RESULT_REPR.maxother = 200
+
+# call_methods_batch limits: calls accepted per batch, and how many of
+# them are on the bus at once
+MAX_BATCH_CALLS = 16
+BATCH_CONCURRENCY = 4
+
+# status() probe labels, in the order the probes run
+_STATUS_PROBES = ('Battery', 'Network', 'Environment')
+
+# Most objects introspect() visits when recursing into child nodes, and
+# the deepest level of children it will descend to
+MAX_INTROSPECT_NODES = 64
+MAX_INTROSPECT_DEPTH = 3
+
+# Notification urgency byte by name (freedesktop notification spec)
+_URGENCY = {'low': 0, 'normal': 1, 'critical': 2}
+
+# Notify hints per urgency, marshalled to GLib.Variant once; GVariants are
+# immutable, so every call can share them
+_URGENCY_HINTS = {
+    name: {'urgency': GLib.Variant('y', value)}
+    for name, value in _URGENCY.items()
+}
+
+# UPower Device.State and NetworkManager Connectivity labels, indexed by value
+_UPOWER_STATE = ('Unknown', 'Unknown', 'Charging', 'Unknown', 'Discharging', 'Empty', 'Full')
+_NM_CONNECTIVITY = ('Unknown', 'None', 'Portal', 'Limited', 'Full')
+
+# CaptureActiveWindow arguments (before the fd) per (include_decorations,
+# include_cursor); the option Variants are built once and only read
+_TRUE = GLib.Variant('b', True)
+_CAPTURE_WINDOW_ARGS = {
+    (True, True): ({'include-decoration': _TRUE, 'include-cursor': _TRUE},),
+    (True, False): ({'include-decoration': _TRUE},),
+    (False, True): ({'include-cursor': _TRUE},),
+    (False, False): ({},),
+}
+# CaptureActiveScreen takes no options
+_CAPTURE_SCREEN_ARGS = ({},)
+
+# Identical screenshot requests within this many seconds of a capture that
+# is still running share its file; later ones capture afresh
+CAPTURE_JOIN_WINDOW = 0.5
+
+# help() safety level markers
+_SAFETY_ICONS = {'high': '🟢', 'medium': '🟡', 'low': '🔴'}
+
+# help() core tool list; the same for every profile
+_CORE_TOOLS_HELP = """\
+Core Tools:
+- help: Show this help message
+- notify: Send desktop notification
+- status: Get system status overview
+- discover: Explore available tools by category
+- list_services: List all D-Bus services
+- introspect: Explore service interfaces and methods
+- call_method: Call arbitrary D-Bus methods
+- call_methods_batch: Call several D-Bus methods in one request
+"""
+
+# Category markers indexed by the enabled flag
+_TICK = ("✗", "✓")
+
+# Warnings prefixed to call_method results, by the policy's interaction type
+_INTERACTION_WARNINGS = {
+    'user_selection': "\n⚠️  This operation requires user interaction: Please click on the target when prompted.\n",
+    'user_confirmation': "\n⚠️  This operation requires user confirmation.\n",
+}
+_DEFAULT_INTERACTION_WARNING = "\n⚠️  This operation requires user interaction.\n"
+
+
+def _text_content(*chunks: str) -> List[TextContent]:
+    """Wrap output chunks as MCP text content, one item per chunk."""
+    return [TextContent(type="text", text=chunk) for chunk in chunks]
+
+
+_VALID_BUSES = frozenset(('session', 'system'))
+
+
+def _timed_out(tool: str) -> str:
+    """Message returned when a tool's bus work runs past its TOOL_TIMEOUTS budget."""
+    return f"Timed out after {TOOL_TIMEOUTS[tool]:g}s"
+
+
+def _log_failure(action: str, error: Exception):
+    """Log a failed tool call; D-Bus errors are expected, anything else gets a traceback."""
+    if isinstance(error, GLib.Error):
+        logger.warning("Failed to %s: %s", action, error)
+    else:
+        logger.exception("Failed to %s: %s", action, error)
+
+
+def _bus_error(dbus_manager: 'DBusManager', bus: str) -> Optional[str]:
+    """Return why a bus name can't be used, or None if it is connected."""
+    # Reject bad input first; valid names map straight onto the
+    # manager's session_bus / system_bus properties
+    if bus not in _VALID_BUSES:
+        return f"Invalid bus type: {bus}. Use 'session' or 'system'"
+    if getattr(dbus_manager, bus + '_bus'):
+        return None
+    return f"{bus.capitalize()} bus not available"
+
+
+# Search index over every tool passed to _tool(), loaded or deferred
+_TOOL_INDEX = ToolIndex()
+
+
+def _tool(server: FastMCP, deferred: Optional[Dict[str, Callable]]):
+    """Register a tool function, or hold it back when a deferred table is given."""
+    def register(fn: Callable) -> Callable:
+        _TOOL_INDEX.add(fn)
+        if deferred is None:
+            server.tool()(fn)
+        else:
+            deferred[fn.__name__] = fn
+        return fn
+    return register
+
+
+def _format_arg(arg) -> str:
+    """Format an <arg> element as name:type, or just type when unnamed."""
+    arg_name = arg.get('name')
+    arg_type = arg.get('type')
+    return f"{arg_name}:{arg_type}" if arg_name else arg_type
+
+
+def _method_line(name: str, args_in: List[str], args_out: List[str]) -> str:
+    """Format a method and its formatted arguments as an introspect() listing line."""
+    line = f"    - {name}({', '.join(args_in)})"
+    if args_out:
+        line += f" → ({', '.join(args_out)})"
+    return line
+
+
+def _format_property(prop) -> str:
+    """Format a <property> element as an introspect() listing line."""
+    return f"    - {prop.get('name')} ({prop.get('type')}) [{prop.get('access', 'read')}]"
+
+
+def _format_method(method) -> str:
+    """Format a <method> element as an introspect() listing line."""
+    args_in = []
+    args_out = []
+    # Bound once; this runs for every argument of every method listed
+    add_in = args_in.append
+    add_out = args_out.append
+    for arg in method.iterfind('arg'):
+        if arg.get('direction') == 'out':
+            add_out(_format_arg(arg))
+        else:
+            add_in(_format_arg(arg))
+    return _method_line(method.get('name'), args_in, args_out)
+
+
+def _read_introspection_tree(introspect_xml: str) -> tuple:
+    """Read an introspection document with lxml: a parsed tree and compiled XPath."""
+    # lxml only accepts documents with an encoding declaration as bytes
+    root = ET.fromstring(introspect_xml.encode('utf-8'))
+    child_names = [name for name in (node.get('name') for node in root.iterfind('node')) if name]
+    interfaces = [
+        (
+            interface.get('name'),
+            [_format_method(method) for method in interface.iterfind('method')],
+            [_format_property(prop) for prop in interface.iterfind('property')],
+            [signal.get('name') for signal in interface.iterfind('signal')],
+        )
+        for interface in _IFACE_XPATH(root)
+    ]
+    return child_names, interfaces
+
+
+def _read_introspection_events(introspect_xml: str) -> tuple:
+    """
+    Read an introspection document with the stdlib pull parser.
+    
+    Only the parts introspect() lists are kept, as they stream past;
+    each element is cleared once read, so no full tree is held.
+    """
+    parser = ET.XMLPullParser(('start', 'end'))
+    parser.feed(introspect_xml)
+    parser.close()
+    
+    child_names = []
+    interfaces = []
+    current = None  # (name, methods, properties, signals) being read
+    method = None   # (name, args_in, args_out) being read
+    depth = 0
+    for event, elem in parser.read_events():
+        if event == 'start':
+            depth += 1
+            tag = elem.tag
+            if depth == 2:
+                if tag == 'node':
+                    name = elem.get('name')
+                    if name:
+                        child_names.append(name)
+                elif tag == 'interface':
+                    name = elem.get('name', '')
+                    if name.startswith(_STANDARD_IFACE_PREFIX):
+                        current = None
+                    else:
+                        current = (name, [], [], [])
+                        interfaces.append(current)
+            elif depth == 3 and current is not None:
+                if tag == 'method':
+                    method = (elem.get('name'), [], [])
+                elif tag == 'property':
+                    current[2].append(_format_property(elem))
+                elif tag == 'signal':
+                    current[3].append(elem.get('name'))
+            elif depth == 4 and method is not None and tag == 'arg':
+                method[2 if elem.get('direction') == 'out' else 1].append(_format_arg(elem))
+        else:
+            depth -= 1
+            if depth == 2 and method is not None:
+                current[1].append(_method_line(*method))
+                method = None
+            elem.clear()
+    return child_names, interfaces
+
+
+# lxml builds its tree in C, so it keeps the tree walk; the stdlib parser
+# streams events instead of building Python objects for the whole document
+_read_introspection = _read_introspection_tree if _IFACE_XPATH is not None else _read_introspection_events
+
 
 def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'SecurityPolicy',
                        dbus_manager: 'DBusManager', file_manager: 'FilePipeManager'):
@@ -37,31 +314,64 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
         file_manager: The server's file manager instance
     """
     
+    # Profile configuration is fixed for the life of the server, so read it
+    # once here instead of re-running detection inside every tool call
+    available = {sys.intern(category): enabled for category, enabled in profile.get_available_tools().items()}
+    notification_config = profile.get_notification_config()
+    
+    # help() and discover() output depends only on the profile and the
+    # safety level, neither of which changes while the server runs
+    text_cache: Dict[str, str] = {}
+    
+    # Last detect_environment() result and when it was taken
+    env_cache: Dict[str, Any] = {'env': None, 'at': 0.0}
+    
+    # introspect() listings by (bus, service, path), with the XML they were
+    # built from; DBusManager decides when that XML is stale. Bounded like
+    # the XML cache, and dropped along with it.
+    describe_cache: Dict[tuple, tuple] = {}
+    # describe_object() runs on worker threads, several at once
+    describe_lock = threading.Lock()
+    
+    # Describes in progress, so concurrent requests for one object share
+    # a single fetch and parse
+    describing: Dict[tuple, 'asyncio.Future'] = {}
+    
+    # Tools not yet registered with the server, by name (lazy mode only)
+    deferred: Optional[Dict[str, Callable]] = {} if LAZY_TOOLS else None
+    
+    async def describe(bus: str, service: str, path: str):
+        """Describe an object in a worker thread, joining an identical call in flight."""
+        key = (bus, service, path)
+        future = describing.get(key)
+        if future is None:
+            future = describing[key] = asyncio.ensure_future(
+                asyncio.to_thread(describe_object, bus, service, path)
+            )
+            future.add_done_callback(lambda _: describing.pop(key, None))
+        return await asyncio.shield(future)
+    
     # 1. Help tool - always available
-    @server.tool()
+    @_tool(server, None)
     async def help() -> str:
         """Get help about available D-Bus capabilities and tools."""
-        available = profile.get_available_tools()
-        
+        text = text_cache.get('help')
+        if text is None:
+            text = text_cache['help'] = build_help_text()
+        return text
+    
+    def build_help_text() -> str:
+        """Assemble the help() output."""
         # Safety level indicator
-        safety_icons = {'high': '🟢', 'medium': '🟡', 'low': '🔴'}
         current_safety = security.safety_level
-        safety_icon = safety_icons.get(current_safety, '❓')
+        safety_icon = _SAFETY_ICONS.get(current_safety, '❓')
         
         help_text = [
             "D-Bus MCP Server - Available Capabilities",
             f"Profile: {profile.name} - {profile.description}",
             f"Safety Level: {safety_icon} {current_safety.upper()}",
             "",
-            "Core Tools:",
-            "- help: Show this help message",
-            "- notify: Send desktop notification",
-            "- status: Get system status overview",
-            "- discover: Explore available tools by category",
-            "- list_services: List all D-Bus services",
-            "- introspect: Explore service interfaces and methods",
-            "- call_method: Call arbitrary D-Bus methods",
-            ""
+            _CORE_TOOLS_HELP
         ]
         
         # Show capabilities for current safety level if profile supports it
@@ -73,23 +383,18 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
                     f"Current Safety Level - {level_info['description']}:",
                     ""
                 ])
-                for capability in level_info['capabilities']:
-                    help_text.append(f"  {capability}")
+                help_text.extend("  " + capability for capability in level_info['capabilities'])
                 help_text.append("")
         else:
             # Fallback to category display
             help_text.append("Available Categories:")
-            for category, enabled in available.items():
-                status = "✓" if enabled else "✗"
-                help_text.append(f"  {status} {category}")
+            help_text.extend(f"  {_TICK[bool(enabled)]} {category}" for category, enabled in available.items())
             help_text.append("")
         
-        if profile.get_profile_specific_tools():
-            help_text.extend([
-                "Profile-Specific Tools:",
-            ])
-            for tool in profile.get_profile_specific_tools():
-                help_text.append(f"  - {tool}")
+        specific_tools = profile.get_profile_specific_tools()
+        if specific_tools:
+            help_text.append("Profile-Specific Tools:")
+            help_text.extend(f"  - {tool}" for tool in specific_tools)
         
         help_text.extend([
             "",
@@ -99,7 +404,7 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
         return "\n".join(help_text)
     
     # 2. Notify tool - basic notification
-    @server.tool()
+    @_tool(server, deferred)
     async def notify(title: str, message: str, urgency: str = "normal") -> str:
         """
         Send a desktop notification to the user.
@@ -110,124 +415,181 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
             urgency: Urgency level (low, normal, critical)
         """
         try:
-            from ..dbus_manager import DBusManager
+            # Unknown urgencies fall back to normal
+            hints = _URGENCY_HINTS.get(urgency, _URGENCY_HINTS['normal'])
             
-            # Get notification config from profile
-            config = profile.get_notification_config()
-            
-            # Connect to D-Bus
-            dbus = DBusManager()
-            notifier = dbus.get_service(
+            # Send notification; awaited on the GLib loop so a slow
+            # notification daemon doesn't stall other tool calls
+            timeout = TOOL_TIMEOUTS['notify']
+            (notification_id,) = await asyncio.wait_for(dbus_manager.call_gio(
                 'session',
-                config['service'],
-                config.get('path', '/org/freedesktop/Notifications')
-            )
-            
-            # Convert urgency to int
-            urgency_map = {'low': 0, 'normal': 1, 'critical': 2}
-            urgency_int = urgency_map.get(urgency, 1)
-            
-            # Send notification
-            # For pydbus, we need to use GLib.Variant for the hints
-            from gi.repository import GLib
-            hints = {'urgency': GLib.Variant('y', urgency_int)}
-            
-            notification_id = notifier.Notify(
-                'dbus-mcp',      # app_name
-                0,               # replaces_id
-                '',              # icon
-                title,           # summary
-                message,         # body
-                [],              # actions
-                hints,           # hints with GLib.Variant
-                5000             # timeout (ms)
-            )
+                notification_config['service'],
+                notification_config.get('path', '/org/freedesktop/Notifications'),
+                'org.freedesktop.Notifications',
+                'Notify',
+                GLib.Variant('(susssasa{sv}i)', (
+                    'dbus-mcp',      # app_name
+                    0,               # replaces_id
+                    '',              # icon
+                    title,           # summary
+                    message,         # body
+                    [],              # actions
+                    hints,           # hints with GLib.Variant
+                    5000             # timeout (ms)
+                )),
+                '(u)',
+                timeout_ms=int(timeout * 1000)
+            ), timeout)
             
             return f"Notification sent (ID: {notification_id})"
             
+        except asyncio.TimeoutError:
+            return _timed_out('notify')
         except Exception as e:
-            logger.error(f"Failed to send notification: {e}")
+            _log_failure("send notification", e)
             return f"Failed to send notification: {str(e)}"
     
     # 3. Status tool - system overview
-    @server.tool()
+    def probe_battery() -> Optional[str]:
+        """Read battery status from UPower, or None if unavailable."""
+        if not dbus_manager.system_bus:
+            return None
+        try:
+            # Checked against the mirrored name list, so a machine without
+            # UPower costs neither a round trip nor a D-Bus error
+            if not dbus_manager.has_service('system', 'org.freedesktop.UPower'):
+                return None
+            # Mirrored locally and updated from PropertiesChanged signals
+            props = dbus_manager.get_cached_properties(
+                'system',
+                'org.freedesktop.UPower',
+                '/org/freedesktop/UPower/devices/DisplayDevice',
+                'org.freedesktop.UPower.Device'
+            )
+            battery = props['Percentage']
+            state = props['State']
+            state_label = _UPOWER_STATE[state] if 0 <= state < len(_UPOWER_STATE) else 'Unknown'
+            return f"Battery: {battery}% ({state_label})"
+        except (GLib.Error, KeyError):
+            return None
+    
+    def probe_network() -> Optional[str]:
+        """Read connectivity from NetworkManager, or None if unavailable."""
+        if not dbus_manager.system_bus:
+            return None
+        try:
+            if not dbus_manager.has_service('system', 'org.freedesktop.NetworkManager'):
+                return None
+            props = dbus_manager.get_cached_properties(
+                'system',
+                'org.freedesktop.NetworkManager',
+                '/org/freedesktop/NetworkManager',
+                'org.freedesktop.NetworkManager'
+            )
+            connectivity = props['Connectivity']
+            connectivity_label = (
+                _NM_CONNECTIVITY[connectivity] if 0 <= connectivity < len(_NM_CONNECTIVITY) else 'Unknown'
+            )
+            network = f"Network: {connectivity_label}"
+            # Comes with the same reply, so report it too
+            connection_type = props.get('PrimaryConnectionType')
+            if connection_type:
+                network += f" ({connection_type})"
+            return network
+        except (GLib.Error, KeyError):
+            return None
+    
+    def probe_environment() -> Dict[str, Any]:
+        """Return the profile's environment, re-detected at most every ENV_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if env_cache['env'] is None or now - env_cache['at'] > ENV_CACHE_TTL:
+            env_cache['env'] = profile.detect_environment()
+            env_cache['at'] = now
+        return env_cache['env']
+    
+    @_tool(server, deferred)
     async def status() -> str:
         """Get a quick system status overview including battery, network, and load."""
         try:
-            from ..dbus_manager import DBusManager
-            
-            dbus = DBusManager()
-            status_info = []
-            
-            # Try to get battery status
-            if dbus.system_bus:
-                try:
-                    upower = dbus.get_service(
-                        'system',
-                        'org.freedesktop.UPower',
-                        '/org/freedesktop/UPower/devices/DisplayDevice'
-                    )
-                    battery = upower.Get('org.freedesktop.UPower.Device', 'Percentage')
-                    state = upower.Get('org.freedesktop.UPower.Device', 'State')
-                    state_map = {1: 'Unknown', 2: 'Charging', 4: 'Discharging', 5: 'Empty', 6: 'Full'}
-                    status_info.append(f"Battery: {battery}% ({state_map.get(state, 'Unknown')})")
-                except:
-                    pass
-            
-            # Try to get network status
-            if dbus.system_bus:
-                try:
-                    nm = dbus.get_service(
-                        'system',
-                        'org.freedesktop.NetworkManager',
-                        '/org/freedesktop/NetworkManager'
-                    )
-                    connectivity = nm.Get('org.freedesktop.NetworkManager', 'Connectivity')
-                    conn_map = {0: 'Unknown', 1: 'None', 2: 'Portal', 3: 'Limited', 4: 'Full'}
-                    status_info.append(f"Network: {conn_map.get(connectivity, 'Unknown')}")
-                except:
-                    pass
+            # The probes are independent blocking calls; run them side by
+            # side in worker threads so the slowest one sets the latency.
+            # Each has its own time budget, so a hung or failing probe only
+            # affects its own line, not the whole report
+            results = await asyncio.gather(
+                asyncio.wait_for(asyncio.to_thread(probe_battery), TOOL_TIMEOUTS['status']),
+                asyncio.wait_for(asyncio.to_thread(probe_network), TOOL_TIMEOUTS['status']),
+                asyncio.wait_for(asyncio.to_thread(probe_environment), TOOL_TIMEOUTS['status']),
+                return_exceptions=True
+            )
+            timed_out = []
+            for label, result in zip(_STATUS_PROBES, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    timed_out.append(f"{label}: timed out")
+                elif isinstance(result, Exception):
+                    logger.debug("Status probe failed: %s", result)
+            battery, network, env = (
+                None if isinstance(result, Exception) else result for result in results
+            )
+            
+            status_info = [line for line in (battery, network) if line]
             
             # Get system info from profile
-            env = profile.detect_environment()
-            status_info.extend([
-                f"Profile: {env['profile']}",
-                f"Desktop: {env.get('desktop', 'None')}",
-                f"Display: {env.get('display_server', 'None')}"
-            ])
+            if env is not None:
+                status_info.extend([
+                    f"Profile: {env['profile']}",
+                    f"Desktop: {env.get('desktop', 'None')}",
+                    f"Display: {env.get('display_server', 'None')}"
+                ])
+            
+            status_info.extend(timed_out)
             
             return "\n".join(status_info) if status_info else "Unable to get system status"
             
         except Exception as e:
-            logger.error(f"Failed to get status: {e}")
+            _log_failure("get status", e)
             return f"Failed to get status: {str(e)}"
     
     # 4. Discover tool - explore available tools
-    @server.tool()
+    @_tool(server, None)
     async def discover(category: str = None) -> str:
         """
         Discover available D-Bus tools and capabilities.
         
         Args:
-            category: Optional category to explore (desktop, media, system, etc.)
+            category: Optional category or search words (e.g. "screenshot of my window")
         """
         if category:
-            # TODO: Return tools for specific category
-            return f"Tools for category '{category}' will be implemented based on profile"
+            matches = _TOOL_INDEX.search(category)
+            if not matches:
+                return f"No tools match '{category}'"
+            lines = [f"Tools matching '{category}':"]
+            for name, summary in matches:
+                marker = " (use load_tool first)" if deferred and name in deferred else ""
+                lines.append(f"  - {name}: {summary}{marker}")
+            return "\n".join(lines)
         else:
             # Return available categories
-            available = profile.get_available_tools()
-            lines = ["Available categories (use discover(category='name') for details):"]
-            
-            for cat, enabled in available.items():
-                if enabled:
-                    lines.append(f"  - {cat}")
+            text = text_cache.get('discover')
+            if text is None:
+                lines = ["Available categories (use discover(category='name') for details):"]
+                
+                for cat, enabled in available.items():
+                    if enabled:
+                        lines.append(f"  - {cat}")
+                
+                text = text_cache['discover'] = "\n".join(lines)
             
-            return "\n".join(lines)
+            # The deferred set shrinks as tools are loaded, so it isn't cached
+            if deferred:
+                summaries = "\n".join(
+                    f"  - {name}: {summarize(fn)}" for name, fn in deferred.items()
+                )
+                return f"{text}\n\nTools available via load_tool(names=[...]):\n{summaries}"
+            return text
     
     # 5. List services tool - enumerate D-Bus services
-    @server.tool()
-    async def list_services(bus: str = "session") -> str:
+    @_tool(server, deferred)
+    async def list_services(bus: str = "session") -> List[TextContent]:
         """
         List all available D-Bus services on the specified bus.
         
@@ -235,44 +597,36 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
             bus: Which bus to list services from ('session' or 'system')
         """
         try:
-            from ..dbus_manager import DBusManager
-            
-            dbus = DBusManager()
+            dbus = dbus_manager
             
             # Get the appropriate bus
-            if bus == "session":
-                if not dbus.session_bus:
-                    return "Session bus not available"
-                bus_obj = dbus.session_bus
-            elif bus == "system":
-                if not dbus.system_bus:
-                    return "System bus not available"
-                bus_obj = dbus.system_bus
-            else:
-                return f"Invalid bus type: {bus}. Use 'session' or 'system'"
-            
-            # Get service list from org.freedesktop.DBus
-            dbus_service = bus_obj.get('org.freedesktop.DBus', '/org/freedesktop/DBus')
-            services = dbus_service.ListNames()
-            
-            # Sort and categorize services
-            well_known = sorted([s for s in services if not s.startswith(':')])
-            unique = [s for s in services if s.startswith(':')]
+            error = _bus_error(dbus, bus)
+            if error:
+                return _text_content(error)
             
-            lines = [f"{bus.capitalize()} Bus Services ({len(well_known)} well-known, {len(unique)} unique):"]
-            lines.append("\nWell-known services:")
-            for service in well_known:
-                lines.append(f"  {service}")
+            # Kept sorted from NameOwnerChanged signals; unique (':1.42')
+            # names are only counted, never listed. Only the first call per
+            # bus makes a round trip, which runs off the event loop.
+            well_known, unique_count = await asyncio.wait_for(
+                asyncio.to_thread(dbus.get_well_known_names, bus),
+                TOOL_TIMEOUTS['list_services']
+            )
             
-            return "\n".join(lines)
+            header = f"{bus.capitalize()} Bus Services ({len(well_known)} well-known, {unique_count} unique):"
+            # One join with the indent in the separator, so no per-name strings
+            body = "  " + "\n  ".join(well_known) if well_known else ""
+            return _text_content(header, "Well-known services:\n" + body)
             
+        except asyncio.TimeoutError:
+            return _text_content(_timed_out('list_services'))
         except Exception as e:
-            logger.error(f"Failed to list services: {e}")
-            return f"Failed to list services: {str(e)}"
+            _log_failure("list services", e)
+            return _text_content(f"Failed to list services: {str(e)}")
     
     # 6. Introspect tool - explore service interfaces
-    @server.tool()
-    async def introspect(service: str, path: str = "/", bus: str = "session") -> str:
+    @_tool(server, deferred)
+    async def introspect(service: str, path: str = "/", bus: str = "session",
+                         depth: int = 1) -> List[TextContent]:
         """
         Introspect a D-Bus service to discover its interfaces and methods.
         
@@ -280,111 +634,138 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
             service: The D-Bus service name (e.g., 'org.kde.klipper')
             path: Object path (default: '/')
             bus: Which bus to use ('session' or 'system')
+            depth: Levels to describe (default: 1, only the object itself);
+                each extra level also describes one more level of children,
+                up to 3
         """
+        depth = min(max(depth, 1), MAX_INTROSPECT_DEPTH)
         try:
-            from ..dbus_manager import DBusManager
-            import xml.etree.ElementTree as ET
-            
-            dbus = DBusManager()
+            dbus = dbus_manager
             
             # Get the appropriate bus
-            if bus == "session":
-                if not dbus.session_bus:
-                    return "Session bus not available"
-                bus_obj = dbus.session_bus
-            elif bus == "system":
-                if not dbus.system_bus:
-                    return "System bus not available"
-                bus_obj = dbus.system_bus
-            else:
-                return f"Invalid bus type: {bus}. Use 'session' or 'system'"
+            error = _bus_error(dbus, bus)
+            if error:
+                return _text_content(error)
             
-            # Get the service object
+            # The whole walk shares one time budget
+            deadline = time.monotonic() + TOOL_TIMEOUTS['introspect']
+            
+            # Describe the requested object, off the event loop
             try:
-                service_obj = bus_obj.get(service, path)
-            except Exception as e:
-                return f"Failed to connect to {service} at {path}: {str(e)}"
+                sections, children = await asyncio.wait_for(
+                    describe(bus, service, path),
+                    TOOL_TIMEOUTS['introspect']
+                )
+            except (GLib.Error, ET.ParseError) as e:
+                return _text_content(f"Failed to introspect {service} at {path}: {str(e)}")
             
-            # Call Introspect method
-            introspect_xml = service_obj.Introspect()
+            # One content item per object header and per interface, so a
+            # large service is never copied into one combined string
+            chunks = [f"Service: {service}\n{sections[0]}", *sections[1:]]
             
-            # Parse XML and extract useful information
-            root = ET.fromstring(introspect_xml)
+            # Then each further level of children, fetching a level's
+            # objects concurrently, until depth or the node cap is reached
+            visited = 1
+            truncated = False
+            for _ in range(depth - 1):
+                level = children[:MAX_INTROSPECT_NODES - visited]
+                truncated = len(level) < len(children)
+                if not level:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    chunks.append(f"(stopped after {TOOL_TIMEOUTS['introspect']:g}s)")
+                    truncated = False
+                    break
+                visited += len(level)
+                # Each child gets the rest of the budget on its own, so one
+                # slow object only loses its own listing
+                results = await asyncio.gather(
+                    *(asyncio.wait_for(describe(bus, service, child), remaining) for child in level),
+                    return_exceptions=True
+                )
+                children = []
+                for child, result in zip(level, results):
+                    if isinstance(result, asyncio.TimeoutError):
+                        chunks.append(f"Path: {child}\n  Timed out")
+                        continue
+                    if isinstance(result, Exception):
+                        chunks.append(f"Path: {child}\n  Failed to introspect: {result}")
+                        continue
+                    child_sections, grandchildren = result
+                    chunks.extend(child_sections)
+                    children.extend(grandchildren)
             
-            lines = [f"Service: {service}"]
-            lines.append(f"Path: {path}")
+            if truncated:
+                chunks.append(f"(stopped after {MAX_INTROSPECT_NODES} objects)")
+            
+            return _text_content(*chunks)
+            
+        except asyncio.TimeoutError:
+            return _text_content(_timed_out('introspect'))
+        except Exception as e:
+            _log_failure("introspect service", e)
+            return _text_content(f"Failed to introspect: {str(e)}")
+    
+    def describe_object(bus: str, service: str, path: str):
+        """
+        Introspect one object.
+        
+        Returns its listing as text sections (path and child nodes first,
+        then one per interface) and the paths of its child nodes.
+        """
+        introspect_xml = dbus_manager.introspect(bus, service, path)
+        key = (bus, service, path)
+        with describe_lock:
+            cached = describe_cache.get(key)
+        if cached is not None and cached[0] is introspect_xml:
+            return cached[1], cached[2]
+        
+        # Parse XML and extract useful information
+        child_names, interfaces = _read_introspection(introspect_xml)
+        
+        lines = [f"Path: {path}"]
+        
+        # List child nodes
+        base = path.rstrip('/')
+        children = tuple(f"{base}/{name}" for name in child_names)
+        if children:
             lines.append("")
+            lines.append("Child nodes:")
+            lines.append("  " + "\n  ".join(children))
+        sections = ["\n".join(lines)]
+        
+        # List interfaces, leaving out the standard org.freedesktop.DBus.* ones
+        for iface_name, methods, properties, signals in interfaces:
+            lines = [f"Interface: {iface_name}"]
             
-            # List child nodes
-            nodes = root.findall('node')
-            if nodes:
-                lines.append("Child nodes:")
-                for node in nodes:
-                    name = node.get('name')
-                    if name:
-                        lines.append(f"  {path.rstrip('/')}/{name}")
-                lines.append("")
-            
-            # List interfaces
-            interfaces = root.findall('interface')
-            for interface in interfaces:
-                iface_name = interface.get('name')
-                if iface_name.startswith('org.freedesktop.DBus.'):
-                    continue  # Skip standard interfaces
-                
-                lines.append(f"Interface: {iface_name}")
-                
-                # Methods
-                methods = interface.findall('method')
-                if methods:
-                    lines.append("  Methods:")
-                    for method in methods:
-                        method_name = method.get('name')
-                        # Get arguments
-                        args_in = []
-                        args_out = []
-                        for arg in method.findall('arg'):
-                            arg_type = arg.get('type')
-                            arg_name = arg.get('name', '')
-                            if arg.get('direction') == 'out':
-                                args_out.append(f"{arg_name}:{arg_type}" if arg_name else arg_type)
-                            else:
-                                args_in.append(f"{arg_name}:{arg_type}" if arg_name else arg_type)
-                        
-                        args_str = f"({', '.join(args_in)})"
-                        if args_out:
-                            args_str += f" → ({', '.join(args_out)})"
-                        
-                        lines.append(f"    - {method_name}{args_str}")
-                
-                # Properties
-                properties = interface.findall('property')
-                if properties:
-                    lines.append("  Properties:")
-                    for prop in properties:
-                        prop_name = prop.get('name')
-                        prop_type = prop.get('type')
-                        prop_access = prop.get('access', 'read')
-                        lines.append(f"    - {prop_name} ({prop_type}) [{prop_access}]")
-                
-                # Signals
-                signals = interface.findall('signal')
-                if signals:
-                    lines.append("  Signals:")
-                    for signal in signals:
-                        signal_name = signal.get('name')
-                        lines.append(f"    - {signal_name}")
-                
-                lines.append("")
+            # Methods
+            if methods:
+                lines.append("  Methods:")
+                lines.extend(methods)
             
-            return "\n".join(lines)
+            # Properties
+            if properties:
+                lines.append("  Properties:")
+                lines.extend(properties)
             
-        except Exception as e:
-            logger.error(f"Failed to introspect service: {e}")
-            return f"Failed to introspect: {str(e)}"
+            # Signals
+            if signals:
+                lines.append("  Signals:")
+                lines.append("    - " + "\n    - ".join(signals))
+            
+            sections.append("\n".join(lines))
+        
+        sections = tuple(sections)
+        with describe_lock:
+            describe_cache[key] = (introspect_xml, sections, children)
+            if len(describe_cache) > INTROSPECT_CACHE_SIZE:
+                # Oldest insertion first; entries are rebuilt cheaply from cached XML
+                describe_cache.pop(next(iter(describe_cache)), None)
+        return sections, children
     
     # 7. Call method tool - invoke D-Bus methods
-    @server.tool()
+    @_tool(server, deferred)
     async def call_method(
         service: str,
         path: str,
@@ -404,9 +785,20 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
             args: List of arguments to pass to the method
             bus: Which bus to use ('session' or 'system')
         """
+        # Proxy lookup (an Introspect on first use) and the call itself block,
+        # so run them in a worker thread and keep the event loop serving
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(invoke_method, service, path, interface, method, args, bus),
+                TOOL_TIMEOUTS['call_method']
+            )
+        except asyncio.TimeoutError:
+            return _timed_out('call_method')
+    
+    def invoke_method(service: str, path: str, interface: str, method: str,
+                      args: Optional[list] = None, bus: str = "session") -> str:
+        """Check, perform and format one D-Bus method call; shared by call_method and call_methods_batch."""
         try:
-            from ..dbus_manager import DBusManager
-            
             # Check if this method call is allowed using the server's security policy
             if not security.is_method_allowed(service, interface, method):
                 return f"Security: Method {interface}.{method} is not allowed"
@@ -416,33 +808,20 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
             interaction_warning = None
             if interaction_info:
                 interaction_type = interaction_info['interaction_type']
-                if interaction_type == 'user_selection':
-                    logger.info(f"Method {method} requires user interaction: click/select")
-                    # Include warning in result
-                    interaction_warning = f"\n⚠️  This operation requires user interaction: Please click on the target when prompted.\n"
-                elif interaction_type == 'user_confirmation':
-                    logger.info(f"Method {method} requires user confirmation")
-                    interaction_warning = f"\n⚠️  This operation requires user confirmation.\n"
-                else:
-                    interaction_warning = f"\n⚠️  This operation requires user interaction.\n"
+                logger.info("Method %s requires user interaction: %s", method, interaction_type)
+                # Include warning in result
+                interaction_warning = _INTERACTION_WARNINGS.get(interaction_type, _DEFAULT_INTERACTION_WARNING)
             
-            dbus = DBusManager()
+            dbus = dbus_manager
             
             # Get the appropriate bus
-            if bus == "session":
-                if not dbus.session_bus:
-                    return "Session bus not available"
-                bus_obj = dbus.session_bus
-            elif bus == "system":
-                if not dbus.system_bus:
-                    return "System bus not available"
-                bus_obj = dbus.system_bus
-            else:
-                return f"Invalid bus type: {bus}. Use 'session' or 'system'"
+            error = _bus_error(dbus, bus)
+            if error:
+                return error
             
             # Get the service object
             try:
-                service_obj = bus_obj.get(service, path)
+                service_obj = dbus.get_cached_service(bus, service, path)
             except Exception as e:
                 return f"Failed to connect to {service} at {path}: {str(e)}"
             
@@ -465,11 +844,18 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
                     response = f"Method {method} called successfully (no return value)"
                 elif isinstance(result, (list, tuple)):
                     lines = [f"Method {method} returned:"]
+                    add_line = lines.append
+                    size = 0
                     for i, item in enumerate(result):
-                        lines.append(f"  [{i}]: {repr(item)}")
+                        if size > MAX_RESULT_CHARS:
+                            add_line(f"  ... ({len(result) - i} more items)")
+                            break
+                        line = f"  [{i}]: {_RESULT_REPR.repr(item)}"
+                        size += len(line)
+                        add_line(line)
                     response = "\n".join(lines)
                 else:
-                    response = f"Method {method} returned: {repr(result)}"
+                    response = f"Method {method} returned: {_RESULT_REPR.repr(result)}"
                 
                 # Add interaction warning if applicable
                 if interaction_info:
@@ -478,55 +864,155 @@ def register_core_tools(server: FastMCP, profile: SystemProfile, security: 'Secu
                 return response
                     
             except Exception as e:
+                # Anything the call itself raised is the caller's to see: D-Bus
+                # errors, arguments that don't marshal, and pydbus's
+                # AttributeError/KeyError for an unknown method or interface
                 return f"Method call failed: {str(e)}"
             
         except Exception as e:
-            logger.error(f"Failed to call method: {e}")
+            _log_failure("call method", e)
             return f"Failed to call method: {str(e)}"
     
+    # 8. Batch call tool - several method calls in one request
+    @_tool(server, deferred)
+    async def call_methods_batch(calls: list) -> str:
+        """
+        Call several D-Bus methods concurrently and return all results at once.
+        
+        Args:
+            calls: List of at most 16 calls, each a dict with service, path,
+                interface, method and optional args and bus (same meaning as
+                call_method); each counts against call_method's rate limit
+        """
+        def run_call(call: Any) -> str:
+            if not isinstance(call, dict):
+                return "Invalid call: expected an object with service, path, interface and method"
+            missing = [key for key in ('service', 'path', 'interface', 'method') if key not in call]
+            if missing:
+                return f"Invalid call: missing {', '.join(missing)}"
+            return invoke_method(
+                call['service'],
+                call['path'],
+                call['interface'],
+                call['method'],
+                call.get('args'),
+                call.get('bus', 'session')
+            )
+        
+        if not calls:
+            return "No calls given"
+        if len(calls) > MAX_BATCH_CALLS:
+            return f"Too many calls: {len(calls)} given, at most {MAX_BATCH_CALLS} per batch"
+        
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def run_checked(call: Any) -> str:
+            # Every call passes the security policy and rate limit on its
+            # own, exactly as if it were a separate call_method request
+            arguments = call if isinstance(call, dict) else {}
+            allowed, reason = security.check_operation('call_method', arguments, profile)
+            if not allowed:
+                return f"Operation denied: {reason}"
+            # Each call is a blocking bus round trip; overlap a few of them
+            # in worker threads, each with call_method's time budget
+            async with semaphore:
+                return await asyncio.wait_for(asyncio.to_thread(run_call, call), TOOL_TIMEOUTS['call_method'])
+        
+        results = await asyncio.gather(*(run_checked(call) for call in calls), return_exceptions=True)
+        results = [
+            _timed_out('call_method') if isinstance(result, asyncio.TimeoutError) else result
+            for result in results
+        ]
+        
+        sections = []
+        for i, (call, result) in enumerate(zip(calls, results)):
+            label = f"{call.get('interface')}.{call.get('method')}" if isinstance(call, dict) else "?"
+            sections.append(f"[{i}] {label}:\n{result}")
+        return "\n\n".join(sections)
+    
     # Register profile-specific clipboard tools if available
-    if profile.get_available_tools().get('clipboard', False):
-        register_clipboard_tools(server, profile)
+    if available.get('clipboard', False):
+        register_clipboard_tools(server, profile, dbus_manager, deferred)
     
     # Register screenshot tools if running on a desktop
     if profile.has_display():
-        register_screenshot_tools(server, profile, security, dbus_manager, file_manager)
+        register_screenshot_tools(server, profile, security, dbus_manager, file_manager, deferred)
+    
+    if deferred is not None:
+        @server.tool()
+        async def load_tool(names: List[str], ctx: Context) -> str:
+            """
+            Load deferred tools so they can be called.
+            
+            Args:
+                names: Tool names, as listed by discover()
+            """
+            loaded = []
+            unknown = []
+            for name in names:
+                fn = deferred.pop(name, None)
+                if fn is None:
+                    unknown.append(name)
+                else:
+                    server.tool()(fn)
+                    loaded.append(name)
+            
+            if loaded:
+                # Clients re-fetch tools/list on this notification
+                await ctx.session.send_tool_list_changed()
+                logger.info("Loaded deferred tools: %s", ", ".join(loaded))
+            
+            lines = []
+            if loaded:
+                lines.append(f"Loaded: {', '.join(loaded)}")
+            if unknown:
+                lines.append(f"Not available (or already loaded): {', '.join(unknown)}")
+            return "\n".join(lines) or "No tools requested"
     
     # Register MCP discovery tools (always available)
-    from .system.mcp_discovery import create_mcp_discovery_tools
     mcp_tools = create_mcp_discovery_tools(dbus_manager)
     for tool in mcp_tools:
         server.add_tool(tool)
     logger.info("Registered MCP discovery tools")
     
-    logger.info(f"Registered core tools for profile: {profile.name}")
+    logger.info("Registered core tools for profile: %s", profile.name)
 
 
-def register_clipboard_tools(server: FastMCP, profile: SystemProfile):
-    """Register clipboard tools based on profile configuration."""
+def register_clipboard_tools(server: FastMCP, profile: SystemProfile,
+                             dbus_manager: 'DBusManager',
+                             deferred: Optional[Dict[str, Callable]] = None):
+    """Register clipboard tools based on profile configuration (held in deferred when given)."""
+    
+    config = profile.get_clipboard_config()
+    
+    # Bound Klipper methods by action, with the proxy they were taken from;
+    # a new proxy (after Klipper restarts) means looking them up again
+    method_cache: Dict[str, Any] = {}
+    
+    def klipper_method(action: str):
+        """Return the bound Klipper method for a clipboard action."""
+        klipper = dbus_manager.get_cached_service(
+            'session',
+            config['service'],
+            config['path']
+        )
+        cached = method_cache.get(action)
+        if cached is None or cached[0] is not klipper:
+            cached = method_cache[action] = (klipper, getattr(klipper, config['methods'][action]))
+        return cached[1]
     
-    @server.tool()
+    @_tool(server, deferred)
     async def clipboard_read() -> str:
         """Read the current clipboard contents."""
         try:
-            from ..dbus_manager import DBusManager
-            
-            # Get clipboard config from profile
-            config = profile.get_clipboard_config()
-            
             if config.get('adapter') == 'klipper':
                 # KDE Klipper specific
-                dbus = DBusManager()
-                klipper = dbus.get_service(
-                    'session',
-                    config['service'],
-                    config['path']
+                # Blocking pydbus call, so it runs in a worker thread
+                contents = await asyncio.wait_for(
+                    asyncio.to_thread(lambda: klipper_method('read')()),
+                    TOOL_TIMEOUTS['clipboard']
                 )
                 
-                # Call the appropriate method
-                method_name = config['methods']['read']
-                contents = getattr(klipper, method_name)()
-                
                 # Check if we got text content
                 if contents:
                     return contents
@@ -539,11 +1025,13 @@ def register_clipboard_tools(server: FastMCP, profile: SystemProfile):
                 # Generic portal or other adapter
                 return "Clipboard adapter not yet implemented"
                 
+        except asyncio.TimeoutError:
+            return _timed_out('clipboard')
         except Exception as e:
-            logger.error(f"Failed to read clipboard: {e}")
+            _log_failure("read clipboard", e)
             return f"Failed to read clipboard: {str(e)}"
     
-    @server.tool()
+    @_tool(server, deferred)
     async def clipboard_write(text: str) -> str:
         """
         Write text to the clipboard.
@@ -552,81 +1040,72 @@ def register_clipboard_tools(server: FastMCP, profile: SystemProfile):
             text: Text to write to clipboard
         """
         try:
-            from ..dbus_manager import DBusManager
-            
-            # Get clipboard config from profile
-            config = profile.get_clipboard_config()
-            
             if config.get('adapter') == 'klipper':
                 # KDE Klipper specific
-                dbus = DBusManager()
-                klipper = dbus.get_service(
-                    'session',
-                    config['service'],
-                    config['path']
+                await asyncio.wait_for(
+                    asyncio.to_thread(lambda: klipper_method('write')(text)),
+                    TOOL_TIMEOUTS['clipboard']
                 )
                 
-                # Call the appropriate method
-                method_name = config['methods']['write']
-                getattr(klipper, method_name)(text)
-                
                 return "Text written to clipboard"
             else:
                 # Generic portal or other adapter
                 return "Clipboard adapter not yet implemented"
                 
+        except asyncio.TimeoutError:
+            return _timed_out('clipboard')
         except Exception as e:
-            logger.error(f"Failed to write clipboard: {e}")
+            _log_failure("write clipboard", e)
             return f"Failed to write clipboard: {str(e)}"
 
 
 def register_screenshot_tools(server: FastMCP, profile: SystemProfile, security: 'SecurityPolicy',
-                             dbus_manager: 'DBusManager', file_manager: 'FilePipeManager'):
-    """Register screenshot capture tools."""
+                             dbus_manager: 'DBusManager', file_manager: 'FilePipeManager',
+                             deferred: Optional[Dict[str, Callable]] = None):
+    """Register screenshot capture tools (held in deferred when given)."""
     
-    @server.tool()
-    async def capture_active_window(
-        include_decorations: bool = True,
-        include_cursor: bool = False
-    ) -> Dict[str, Any]:
-        """
-        Capture a screenshot of the currently active window.
-        
-        Args:
-            include_decorations: Include window decorations (title bar, etc.)
-            include_cursor: Include mouse cursor in the screenshot
+    # Captures in progress by target and options, with their start time
+    capturing: Dict[tuple, tuple] = {}
+    
+    async def shared_capture(key: tuple, capture: Callable) -> Dict[str, Any]:
+        """Run a capture, joining an identical one started moments ago."""
+        entry = capturing.get(key)
+        if entry is None or time.monotonic() - entry[0] > CAPTURE_JOIN_WINDOW:
+            future = asyncio.ensure_future(capture())
+            entry = capturing[key] = (time.monotonic(), future)
             
-        Returns:
-            Dictionary with file reference and metadata
-        """
+            def release(_, entry=entry):
+                if capturing.get(key) is entry:
+                    del capturing[key]
+            future.add_done_callback(release)
+        # Each caller gets its own copy of the shared result
+        return dict(await asyncio.shield(entry[1]))
+    
+    async def capture_window(include_decorations: bool, include_cursor: bool) -> Dict[str, Any]:
+        """Capture the active window into a new managed file."""
         try:
             # Create pipe for screenshot
             fd, ref_id = file_manager.create_pipe("screenshot", "png")
             
             try:
-                # Prepare options
-                options = {}
-                if include_decorations:
-                    options['include-decoration'] = GLib.Variant('b', True)
-                if include_cursor:
-                    options['include-cursor'] = GLib.Variant('b', True)
-                
                 # Call screenshot method with file descriptor
-                result = dbus_manager.call_with_fd(
+                result = await asyncio.wait_for(dbus_manager.call_with_fd_async(
                     'session',
                     'org.kde.KWin.ScreenShot2',
                     '/org/kde/KWin/ScreenShot2',
                     'org.kde.KWin.ScreenShot2',
                     'CaptureActiveWindow',
-                    [options],
-                    fd
-                )
+                    _CAPTURE_WINDOW_ARGS[(bool(include_decorations), bool(include_cursor))],
+                    fd,
+                    timeout_ms=int(TOOL_TIMEOUTS['capture'] * 1000)
+                ), TOOL_TIMEOUTS['capture'])
                 
                 # Log the result to see what metadata we get
-                logger.info(f"CaptureActiveWindow result: {result}")
+                logger.info("CaptureActiveWindow result: %s", result)
                 
-                # Finalize file with metadata
-                file_manager.finalize_file(ref_id, {
+                # Finalize file with metadata; converting a raw framebuffer
+                # to PNG is CPU-bound, so it runs in a worker thread
+                await asyncio.to_thread(file_manager.finalize_file, ref_id, {
                     'type': 'image/png',
                     'window': 'active',
                     'result': result or {},
@@ -647,60 +1126,51 @@ def register_screenshot_tools(server: FastMCP, profile: SystemProfile, security:
                 file_manager.mark_error(ref_id, str(e))
                 raise
                 
+        except asyncio.TimeoutError:
+            return {'error': _timed_out('capture')}
         except Exception as e:
-            logger.error(f"Failed to capture screenshot: {e}")
+            _log_failure("capture screenshot", e)
             return {
                 'error': f"Failed to capture screenshot: {str(e)}"
             }
     
-    @server.tool()
-    async def capture_screen(
-        screen_name: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """
-        Capture a screenshot of an entire screen.
-        
-        Args:
-            screen_name: Screen identifier (optional, captures active screen if not specified)
-            
-        Returns:
-            Dictionary with file reference and metadata
-        """
+    async def capture_output(screen_name: Optional[str]) -> Dict[str, Any]:
+        """Capture a screen into a new managed file."""
         try:
             # Create pipe for screenshot
             fd, ref_id = file_manager.create_pipe("screenshot", "png")
             
             try:
-                # Prepare options
-                options = {}
-                
                 # Call appropriate method
                 if screen_name:
-                    result = dbus_manager.call_with_fd(
+                    result = await asyncio.wait_for(dbus_manager.call_with_fd_async(
                         'session',
                         'org.kde.KWin.ScreenShot2',
                         '/org/kde/KWin/ScreenShot2',
                         'org.kde.KWin.ScreenShot2',
                         'CaptureScreen',
-                        [screen_name, options],
-                        fd
-                    )
+                        (screen_name,) + _CAPTURE_SCREEN_ARGS,
+                        fd,
+                        timeout_ms=int(TOOL_TIMEOUTS['capture'] * 1000)
+                    ), TOOL_TIMEOUTS['capture'])
                 else:
-                    result = dbus_manager.call_with_fd(
+                    result = await asyncio.wait_for(dbus_manager.call_with_fd_async(
                         'session',
                         'org.kde.KWin.ScreenShot2',
                         '/org/kde/KWin/ScreenShot2',
                         'org.kde.KWin.ScreenShot2',
                         'CaptureActiveScreen',
-                        [options],
-                        fd
-                    )
+                        _CAPTURE_SCREEN_ARGS,
+                        fd,
+                        timeout_ms=int(TOOL_TIMEOUTS['capture'] * 1000)
+                    ), TOOL_TIMEOUTS['capture'])
                 
                 # Log the result to see what metadata we get
-                logger.info(f"CaptureScreen result: {result}")
+                logger.info("CaptureScreen result: %s", result)
                 
-                # Finalize file with metadata
-                file_manager.finalize_file(ref_id, {
+                # Finalize file with metadata; converting a raw framebuffer
+                # to PNG is CPU-bound, so it runs in a worker thread
+                await asyncio.to_thread(file_manager.finalize_file, ref_id, {
                     'type': 'image/png',
                     'screen': screen_name or 'active',
                     'result': result or {},
@@ -721,13 +1191,48 @@ def register_screenshot_tools(server: FastMCP, profile: SystemProfile, security:
                 file_manager.mark_error(ref_id, str(e))
                 raise
                 
+        except asyncio.TimeoutError:
+            return {'error': _timed_out('capture')}
         except Exception as e:
-            logger.error(f"Failed to capture screen: {e}")
+            _log_failure("capture screen", e)
             return {
                 'error': f"Failed to capture screen: {str(e)}"
             }
     
-    @server.tool()
+    @_tool(server, deferred)
+    async def capture_active_window(
+        include_decorations: bool = True,
+        include_cursor: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Capture a screenshot of the currently active window.
+        
+        Args:
+            include_decorations: Include window decorations (title bar, etc.)
+            include_cursor: Include mouse cursor in the screenshot
+            
+        Returns:
+            Dictionary with file reference and metadata
+        """
+        key = ('window', bool(include_decorations), bool(include_cursor))
+        return await shared_capture(key, lambda: capture_window(include_decorations, include_cursor))
+    
+    @_tool(server, deferred)
+    async def capture_screen(
+        screen_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Capture a screenshot of an entire screen.
+        
+        Args:
+            screen_name: Screen identifier (optional, captures active screen if not specified)
+            
+        Returns:
+            Dictionary with file reference and metadata
+        """
+        return await shared_capture(('screen', screen_name or None), lambda: capture_output(screen_name))
+    
+    @_tool(server, deferred)
     async def list_screenshot_files() -> List[Dict[str, Any]]:
         """List all screenshot files captured in this session."""
         return file_manager.list_files(purpose='screenshot')
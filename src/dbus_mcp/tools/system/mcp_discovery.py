@@ -5,52 +5,202 @@ MCP instance discovery tools for low-level API.
 These tools enable discovery and communication between multiple MCP instances.
 """
 
+import asyncio
+import time
 import logging
 import json
-from typing import Dict, List, Any
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 
 from mcp import Tool
 
+from gi.repository import GLib
+
+from ...dbus_service import object_path_for
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# GetInfo replies are JSON text or bytes; orjson parses them faster when installed
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Seconds to wait for a peer to acknowledge a notification
+NOTIFY_TIMEOUT = 5
+
+# Seconds a discovery or info result is reused, so back-to-back queries
+# share one round of D-Bus calls
+RESULT_CACHE_TTL = 0.5
+
+
+# Tool definitions, built once at import and shared by every tool set
+DISCOVER_TOOL = Tool(
+    name="discover_mcp_servers",
+    description="Discover other MCP server instances on D-Bus",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "bus": {
+                "type": "string",
+                "enum": ["session", "system"],
+                "default": "session",
+                "description": "D-Bus bus to search"
+            }
+        }
+    }
+)
+
+INFO_TOOL = Tool(
+    name="get_mcp_server_info",
+    description="Get detailed information from a specific MCP server",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "service_name": {
+                "type": "string",
+                "description": "D-Bus service name of the MCP server"
+            }
+        },
+        "required": ["service_name"]
+    }
+)
+
+NOTIFY_TOOL = Tool(
+    name="send_mcp_notification",
+    description="Send a notification to another MCP instance",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "service_name": {
+                "type": "string",
+                "description": "Target MCP server D-Bus service name"
+            },
+            "message": {
+                "type": "string",
+                "description": "Message to send"
+            }
+        },
+        "required": ["service_name", "message"]
+    }
+)
+
 
 def create_mcp_discovery_tools_lowlevel(dbus_manager) -> List[tuple[Tool, callable]]:
     """Create tools for MCP instance discovery and communication."""
     
+    # Recent results keyed by ('discover', bus) or ('info', service name)
+    recent: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+    
+    def cached(key: Tuple[str, str]) -> Any:
+        """Return a result stored less than RESULT_CACHE_TTL ago, or None."""
+        entry = recent.get(key)
+        if entry is not None and time.monotonic() - entry[0] < RESULT_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def remember(key: Tuple[str, str], result: Any) -> Any:
+        """Store a result for reuse and return it."""
+        recent[key] = (time.monotonic(), result)
+        return result
+    
+    def forget(service_name: str):
+        """Drop results made stale by a name's owner changing."""
+        recent.pop(('info', service_name), None)
+        if service_name.startswith("org.mcp."):
+            for key in list(recent):
+                if key[0] == 'discover':
+                    recent.pop(key, None)
+    
+    dbus_manager.add_invalidation_listener(forget)
+    
+    # Calls still running, with the same keys as recent
+    inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+    
+    async def shared(key: Tuple[str, str], work: Callable[[], Awaitable[Any]]) -> Any:
+        """Run work, or join an identical call that is already running."""
+        future = inflight.get(key)
+        if future is None:
+            future = inflight[key] = asyncio.ensure_future(work())
+            
+            def release(_):
+                if inflight.get(key) is future:
+                    del inflight[key]
+            future.add_done_callback(release)
+        # One caller being cancelled must not cancel the call for the others
+        return await asyncio.shield(future)
+    
     async def discover_mcp_servers(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Discover other MCP server instances on D-Bus."""
-        bus = arguments.get("bus", "session")
-        
+        bus_name = "session" if arguments.get("bus", "session") == "session" else "system"
+        return await shared(('discover', bus_name), lambda: discover(bus_name))
+    
+    async def discover(bus_name: str) -> List[Dict[str, Any]]:
+        """Find MCP servers on a bus and get their info."""
         try:
-            from pydbus import SessionBus, SystemBus
-            
-            bus_obj = SessionBus() if bus == "session" else SystemBus()
-            
-            # Get all services
-            dbus_obj = bus_obj.get("org.freedesktop.DBus", "/org/freedesktop/DBus")
-            services = dbus_obj.ListNames()
-            
-            # Filter for MCP services
-            mcp_services = []
-            for service in services:
-                if service.startswith("org.mcp."):
-                    try:
-                        # Try to get info from the service
-                        mcp_obj = bus_obj.get(service, "/org/mcp/DBusServer")
-                        info = json.loads(mcp_obj.GetInfo())
-                        
-                        mcp_services.append({
-                            "service_name": service,
-                            "info": info
-                        })
-                    except Exception as e:
-                        logger.debug(f"Could not query {service}: {e}")
-                        mcp_services.append({
-                            "service_name": service,
-                            "info": {"error": str(e)}
-                        })
-            
-            return mcp_services
+            bus_obj = dbus_manager.session_bus if bus_name == "session" else dbus_manager.system_bus
+            if bus_obj is None:
+                logger.warning("System bus is not enabled")
+                return []
+            
+            hit = cached(('discover', bus_name))
+            if hit is not None:
+                return hit
+            
+            # Proxies come from the manager's cache, keyed by (bus, name,
+            # path) and dropped when the name's owner changes
+            def probe(service: str) -> Dict[str, Any]:
+                """Get info from an MCP service (blocking)."""
+                mcp_obj = dbus_manager.get_cached_service(bus_name, service, object_path_for(service))
+                if hasattr(mcp_obj, "GetInfoBytes"):
+                    return _loads(bytes(mcp_obj.GetInfoBytes()))
+                return _loads(mcp_obj.GetInfo())
+            
+            def list_peers(service: str) -> List[tuple]:
+                """Get every MCP instance and its info from one of them (blocking)."""
+                return dbus_manager.get_cached_service(bus_name, service, object_path_for(service)).ListPeers()
+            
+            # MCP services from the manager's name mirror, which follows
+            # NameOwnerChanged; only the first call per bus runs ListNames
+            candidates = await asyncio.to_thread(dbus_manager.get_names_with_prefix, bus_name, "org.mcp.")
+            
+            # Any instance can list all of them with their info in one call;
+            # instances predating ListPeers fall through to probing each
+            services = candidates
+            listed: Dict[str, Any] = {}
+            if candidates:
+                try:
+                    peers = await asyncio.to_thread(list_peers, candidates[0])
+                except (AttributeError, GLib.Error) as e:
+                    logger.debug("ListPeers unavailable on %s: %s", candidates[0], e)
+                else:
+                    services = [service for service, _ in peers]
+                    listed = {service: _loads(info) for service, info in peers if info}
+            
+            # Ask the rest directly, e.g. peers too new for the lister to
+            # have their info yet. Each probe is a round trip, so they
+            # overlap in worker threads.
+            to_probe = [service for service in services if service not in listed]
+            results = await asyncio.gather(
+                *(asyncio.to_thread(probe, service) for service in to_probe),
+                return_exceptions=True
+            )
+            for service, result in zip(to_probe, results):
+                if isinstance(result, Exception):
+                    logger.debug("Could not query %s: %s", service, result)
+                    result = {"error": str(result)}
+                listed[service] = result
+            
+            mcp_services = [
+                {
+                    "service_name": service,
+                    "info": listed[service]
+                }
+                for service in services
+            ]
+            
+            return remember(('discover', bus_name), mcp_services)
             
         except Exception as e:
             logger.error(f"Error discovering MCP servers: {e}")
@@ -59,58 +209,62 @@ def create_mcp_discovery_tools_lowlevel(dbus_manager) -> List[tuple[Tool, callab
     async def get_mcp_server_info(arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed information from a specific MCP server."""
         service_name = arguments.get("service_name", "")
-        
+        return await shared(('info', service_name), lambda: server_info(service_name))
+    
+    async def server_info(service_name: str) -> Dict[str, Any]:
+        """Get a server's info, status, clients and peers."""
         try:
-            from pydbus import SessionBus
+            hit = cached(('info', service_name))
+            if hit is not None:
+                return hit
             
-            bus = SessionBus()
-            mcp_obj = bus.get(service_name, "/org/mcp/DBusServer")
-            
-            # Get basic info
-            info = json.loads(mcp_obj.GetInfo())
-            
-            # Get status
-            status = mcp_obj.GetStatus()
-            
-            # Get connected clients
-            clients = mcp_obj.GetConnectedClients()
-            
-            # Get peers
-            peers = mcp_obj.GetPeers()
+            def fetch() -> Dict[str, Any]:
+                """Get everything in one call, or one call per part from older peers (blocking)."""
+                # The cached proxy remembers which of these the peer has
+                mcp_obj = dbus_manager.get_cached_service('session', service_name, object_path_for(service_name))
+                if hasattr(mcp_obj, "GetFullInfoBytes"):
+                    return _loads(bytes(mcp_obj.GetFullInfoBytes()))
+                if hasattr(mcp_obj, "GetFullInfo"):
+                    return _loads(mcp_obj.GetFullInfo())
+                
+                return {
+                    "info": _loads(mcp_obj.GetInfo()),
+                    "status": mcp_obj.GetStatus(),
+                    "connected_clients": mcp_obj.GetConnectedClients(),
+                    "registered_peers": mcp_obj.GetPeers()
+                }
             
-            return {
-                "info": info,
-                "status": dict(status),
-                "connected_clients": clients,
-                "registered_peers": peers
-            }
+            return remember(('info', service_name), await asyncio.to_thread(fetch))
             
         except Exception as e:
             logger.error(f"Error getting MCP server info: {e}")
             return {"error": str(e)}
     
+    def own_source() -> str:
+        """The name we are published under on D-Bus, if we are published."""
+        service = dbus_manager.published_service
+        if service is not None and service.bus_name:
+            return service.bus_name
+        return "org.mcp.DBusServer.unknown"
+    
     async def send_mcp_notification(arguments: Dict[str, Any]) -> str:
         """Send a notification to another MCP instance."""
         service_name = arguments.get("service_name", "")
         message = arguments.get("message", "")
         
         try:
-            from pydbus import SessionBus
+            def send() -> str:
+                """Deliver the notification (blocking)."""
+                mcp_obj = dbus_manager.get_cached_service('session', service_name, object_path_for(service_name))
+                try:
+                    return mcp_obj.SendNotification(own_source(), message, timeout=NOTIFY_TIMEOUT)
+                except Exception:
+                    # Don't keep a proxy to a peer that failed; rebuild it next time
+                    dbus_manager.invalidate_service(service_name)
+                    raise
             
-            bus = SessionBus()
-            mcp_obj = bus.get(service_name, "/org/mcp/DBusServer")
-            
-            # Get our own service name (if we have one)
-            source = "org.mcp.DBusServer.unknown"
-            try:
-                # Try to find our own service name
-                dbus_obj = bus.get("org.freedesktop.DBus", "/org/freedesktop/DBus")
-                our_name = dbus_obj.GetNameOwner("org.mcp.DBusServer")
-                source = "org.mcp.DBusServer"
-            except:
-                pass
-            
-            response = mcp_obj.SendNotification(source, message)
+            # A slow peer ties up one worker thread, not the event loop
+            response = await asyncio.to_thread(send)
             
             return response
             
@@ -118,59 +272,8 @@ def create_mcp_discovery_tools_lowlevel(dbus_manager) -> List[tuple[Tool, callab
             logger.error(f"Error sending MCP notification: {e}")
             return f"Error: {str(e)}"
     
-    # Create tool definitions
-    discover_tool = Tool(
-        name="discover_mcp_servers",
-        description="Discover other MCP server instances on D-Bus",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "bus": {
-                    "type": "string",
-                    "enum": ["session", "system"],
-                    "default": "session",
-                    "description": "D-Bus bus to search"
-                }
-            }
-        }
-    )
-    
-    info_tool = Tool(
-        name="get_mcp_server_info",
-        description="Get detailed information from a specific MCP server",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "service_name": {
-                    "type": "string",
-                    "description": "D-Bus service name of the MCP server"
-                }
-            },
-            "required": ["service_name"]
-        }
-    )
-    
-    notify_tool = Tool(
-        name="send_mcp_notification",
-        description="Send a notification to another MCP instance",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "service_name": {
-                    "type": "string",
-                    "description": "Target MCP server D-Bus service name"
-                },
-                "message": {
-                    "type": "string",
-                    "description": "Message to send"
-                }
-            },
-            "required": ["service_name", "message"]
-        }
-    )
-    
     return [
-        (discover_tool, discover_mcp_servers),
-        (info_tool, get_mcp_server_info),
-        (notify_tool, send_mcp_notification)
+        (DISCOVER_TOOL, discover_mcp_servers),
+        (INFO_TOOL, get_mcp_server_info),
+        (NOTIFY_TOOL, send_mcp_notification)
     ]
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Keyword search over tool metadata.
+
+A small BM25F index: each tool is a document with separately weighted
+fields (name, search hint, docstring tags, description, parameter names),
+so discover() can rank tools against free-text queries such as
+"screenshot of my window".
+"""
+
+import re
+import math
+import inspect
+from array import array
+from typing import Callable, Dict, List, Tuple
+
+# Field weights; a hit in the tool name counts for three description hits
+FIELD_WEIGHTS = {'name': 3.0, 'hint': 2.0, 'tags': 2.0, 'desc': 1.0, 'params': 1.0}
+_FIELDS = tuple(FIELD_WEIGHTS)
+
+# BM25 term-frequency saturation and length normalisation
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Extra words for tools whose names and docstrings miss common phrasings
+SEARCH_HINTS = {
+    'help': 'usage capabilities overview',
+    'notify': 'alert message popup toast desktop',
+    'status': 'battery power network load health system overview',
+    'list_services': 'bus names enumerate services',
+    'introspect': 'interfaces methods signals properties explore object',
+    'call_method': 'invoke run execute dbus method',
+    'call_methods_batch': 'invoke many multiple parallel batch',
+    'clipboard_read': 'paste copy text read clipboard',
+    'clipboard_write': 'copy set text write clipboard',
+    'capture_active_window': 'screenshot window picture image grab focused',
+    'capture_screen': 'screenshot screen monitor display picture image grab',
+    'list_screenshot_files': 'screenshot files images captured',
+}
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case words of a text, with a plural 's' stripped so forms match."""
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def summarize(fn: Callable) -> str:
+    """Return the first line of a tool function's docstring."""
+    doc = (fn.__doc__ or '').strip()
+    return doc.split('\n', 1)[0]
+
+
+class ToolIndex:
+    """BM25F index of tool functions, keyed by tool name."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.summaries: List[str] = []
+        # term -> flat (doc id, field id, term frequency) triples
+        self._postings: Dict[str, array] = {}
+        # Field lengths, one row of len(_FIELDS) per document
+        self._lengths = array('H')
+        self._avg_lengths: Tuple[float, ...] = ()
+        self._idf: Dict[str, float] = {}
+
+    def add(self, fn: Callable):
+        """Index a tool function; a name already indexed is left as is."""
+        name = fn.__name__
+        if name in self.names:
+            return
+        doc_id = len(self.names)
+        self.names.append(name)
+        summary = summarize(fn)
+        self.summaries.append(summary)
+
+        doc = inspect.getdoc(fn) or ''
+        params = [p for p in inspect.signature(fn).parameters if p != 'ctx']
+        fields = {
+            'name': tokenize(name),
+            'hint': tokenize(SEARCH_HINTS.get(name, '')),
+            'tags': tokenize(doc[len(summary):]),
+            'desc': tokenize(summary),
+            'params': tokenize(' '.join(params)),
+        }
+
+        for field_id, field in enumerate(_FIELDS):
+            tokens = fields[field]
+            self._lengths.append(min(len(tokens), 0xFFFF))
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = array('H')
+                postings.extend((doc_id, field_id, count))
+
+        # Statistics change with every document; recomputed on next search
+        self._avg_lengths = ()
+        self._idf.clear()
+
+    def _prepare(self):
+        """Compute average field lengths and term IDFs for the current documents."""
+        count = len(self.names)
+        width = len(_FIELDS)
+        self._avg_lengths = tuple(
+            (sum(self._lengths[field_id::width]) / count) or 1.0
+            for field_id in range(width)
+        )
+        for term, postings in self._postings.items():
+            docs = len(set(postings[0::3]))
+            self._idf[term] = math.log(1 + (count - docs + 0.5) / (docs + 0.5))
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, str]]:
+        """Return up to limit (name, summary) pairs ranked against a query."""
+        if not self.names:
+            return []
+        if not self._avg_lengths:
+            self._prepare()
+
+        width = len(_FIELDS)
+        weights = tuple(FIELD_WEIGHTS[field] for field in _FIELDS)
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            # Length-normalised, field-weighted frequency per document
+            weighted: Dict[int, float] = {}
+            for i in range(0, len(postings), 3):
+                doc_id, field_id, count = postings[i], postings[i + 1], postings[i + 2]
+                norm = 1 - BM25_B + BM25_B * self._lengths[doc_id * width + field_id] / self._avg_lengths[field_id]
+                weighted[doc_id] = weighted.get(doc_id, 0.0) + weights[field_id] * count / norm
+            idf = self._idf[term]
+            for doc_id, tf in weighted.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf / (BM25_K1 + tf)
+
+        ranked = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
+        return [(self.names[doc_id], self.summaries[doc_id]) for doc_id in ranked]
@@ -0,0 +1,28 @@
+"""Import smoke tests: every server module must at least import."""
+
+import importlib
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("gi")
+pytest.importorskip("pydbus")
+
+
+@pytest.mark.parametrize("module", [
+    "dbus_mcp.server",
+    "dbus_mcp.server_fastmcp",
+    "dbus_mcp.tools.registry",
+    "dbus_mcp.tools.registry_fastmcp",
+    "dbus_mcp.tools.system.mcp_discovery",
+    "dbus_mcp.tools.system.mcp_discovery_fastmcp",
+])
+def test_module_imports(module):
+    importlib.import_module(module)
+
+
+def test_fastmcp_registry_uses_fastmcp_discovery_tools():
+    from dbus_mcp.tools import registry_fastmcp
+    from dbus_mcp.tools.system import mcp_discovery_fastmcp
+    
+    assert registry_fastmcp.create_mcp_discovery_tools is mcp_discovery_fastmcp.create_mcp_discovery_tools
@@ -0,0 +1,180 @@
+"""Tests for the FastMCP core tools: batch calls and lazy tool loading."""
+
+import time
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("gi")
+pytest.importorskip("pydbus")
+
+from mcp.server import FastMCP
+
+from dbus_mcp.profiles.base import SystemProfile
+from dbus_mcp.security import SecurityPolicy
+from dbus_mcp.tools import registry_fastmcp
+from dbus_mcp.tools.registry_fastmcp import MAX_BATCH_CALLS, register_core_tools
+
+
+class HeadlessProfile(SystemProfile):
+    """Profile without a display or clipboard, so only core tools register."""
+
+    @property
+    def name(self) -> str:
+        return "test-headless"
+
+    @property
+    def description(self) -> str:
+        return "Headless test profile"
+
+    def has_display(self) -> bool:
+        return False
+
+    def get_available_tools(self):
+        return {'clipboard': False, 'notifications': True, 'system': True}
+
+    def detect_init_system(self) -> str:
+        return 'systemd'
+
+
+def make_call(method: str) -> dict:
+    return {
+        'service': 'org.freedesktop.login1',
+        'path': '/org/freedesktop/login1',
+        'interface': 'org.freedesktop.login1.Manager',
+        'method': method,
+    }
+
+
+@pytest.fixture
+def proxy():
+    proxy = MagicMock()
+    proxy.GetAll.return_value = {'Docked': False}
+    proxy.ListSessions.return_value = []
+    return proxy
+
+
+@pytest.fixture
+def security():
+    return SecurityPolicy('high')
+
+
+def build_server(security, proxy) -> FastMCP:
+    dbus_manager = MagicMock()
+    dbus_manager.get_cached_service.return_value = proxy
+    server = FastMCP("test")
+    register_core_tools(server, HeadlessProfile(), security, dbus_manager, MagicMock())
+    return server
+
+
+def tool_fn(server: FastMCP, name: str):
+    return server._tool_manager.get_tool(name).fn
+
+
+async def tool_names(server: FastMCP) -> set:
+    return {tool.name for tool in await server.list_tools()}
+
+
+@pytest.fixture
+def server(monkeypatch, security, proxy):
+    monkeypatch.setattr(registry_fastmcp, 'LAZY_TOOLS', False)
+    return build_server(security, proxy)
+
+
+async def test_batch_rejects_more_than_max_calls(server, proxy):
+    calls = [make_call('GetAll')] * (MAX_BATCH_CALLS + 1)
+
+    result = await tool_fn(server, 'call_methods_batch')(calls)
+
+    assert result.startswith("Too many calls")
+    proxy.GetAll.assert_not_called()
+
+
+async def test_batch_accepts_max_calls(server, proxy):
+    calls = [make_call('GetAll')] * MAX_BATCH_CALLS
+
+    result = await tool_fn(server, 'call_methods_batch')(calls)
+
+    assert proxy.GetAll.call_count == MAX_BATCH_CALLS
+    assert f"[{MAX_BATCH_CALLS - 1}] org.freedesktop.login1.Manager.GetAll:" in result
+
+
+async def test_batch_refuses_forbidden_call_and_runs_the_rest(server, proxy):
+    calls = [make_call('GetAll'), make_call('PowerOff'), make_call('ListSessions')]
+
+    result = await tool_fn(server, 'call_methods_batch')(calls)
+
+    sections = result.split("\n\n")
+    assert len(sections) == 3
+    assert sections[0].startswith("[0] org.freedesktop.login1.Manager.GetAll:\nMethod GetAll returned")
+    assert sections[1] == (
+        "[1] org.freedesktop.login1.Manager.PowerOff:\n"
+        "Security: Method org.freedesktop.login1.Manager.PowerOff is not allowed"
+    )
+    assert sections[2].startswith("[2] org.freedesktop.login1.Manager.ListSessions:\nMethod ListSessions returned")
+    proxy.PowerOff.assert_not_called()
+    proxy.GetAll.assert_called_once_with()
+    proxy.ListSessions.assert_called_once_with()
+
+
+async def test_batch_checks_each_call_against_the_rate_limit(server, proxy, security):
+    # Leave room for exactly one more call_method in the window
+    limit = security.DEFAULT_RATE_LIMITS['default']
+    history = security.operation_history['call_method'] = deque(maxlen=limit)
+    history.extend([time.monotonic()] * (limit - 1))
+
+    result = await tool_fn(server, 'call_methods_batch')([make_call('GetAll'), make_call('ListSessions')])
+
+    assert "Method GetAll returned" in result
+    assert "[1] org.freedesktop.login1.Manager.ListSessions:\nOperation denied: Rate limit exceeded" in result
+    proxy.GetAll.assert_called_once_with()
+    proxy.ListSessions.assert_not_called()
+
+
+async def test_batch_reports_malformed_calls(server):
+    result = await tool_fn(server, 'call_methods_batch')([{'service': 'org.example'}, "nope"])
+
+    assert "[0] None.None:\nInvalid call: missing path, interface, method" in result
+    assert "[1] ?:\nInvalid call: expected an object" in result
+
+
+async def test_tools_register_directly_without_lazy_mode(monkeypatch, security, proxy):
+    monkeypatch.setattr(registry_fastmcp, 'LAZY_TOOLS', False)
+    server = build_server(security, proxy)
+
+    names = await tool_names(server)
+
+    assert {'call_method', 'call_methods_batch', 'introspect'} <= names
+    assert 'load_tool' not in names
+
+
+async def test_lazy_mode_defers_tools_until_loaded(monkeypatch, security, proxy):
+    monkeypatch.setattr(registry_fastmcp, 'LAZY_TOOLS', True)
+    server = build_server(security, proxy)
+    assert 'load_tool' in await tool_names(server)
+    assert 'call_method' not in await tool_names(server)
+
+    ctx = MagicMock()
+    ctx.session.send_tool_list_changed = AsyncMock()
+    result = await tool_fn(server, 'load_tool')(['call_method', 'no_such_tool'], ctx)
+
+    assert result == "Loaded: call_method\nNot available (or already loaded): no_such_tool"
+    assert 'call_method' in await tool_names(server)
+    assert 'call_methods_batch' not in await tool_names(server)
+    ctx.session.send_tool_list_changed.assert_awaited_once()
+
+
+async def test_loading_a_tool_twice_does_not_notify_again(monkeypatch, security, proxy):
+    monkeypatch.setattr(registry_fastmcp, 'LAZY_TOOLS', True)
+    server = build_server(security, proxy)
+    ctx = MagicMock()
+    ctx.session.send_tool_list_changed = AsyncMock()
+    load_tool = tool_fn(server, 'load_tool')
+
+    await load_tool(['introspect'], ctx)
+    result = await load_tool(['introspect'], ctx)
+
+    assert result == "Not available (or already loaded): introspect"
+    ctx.session.send_tool_list_changed.assert_awaited_once()
@@ -0,0 +1,114 @@
+"""Tests for the BM25F tool search index."""
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("gi")
+pytest.importorskip("pydbus")
+
+from dbus_mcp.tools.tool_index import SEARCH_HINTS, ToolIndex, tokenize
+
+
+def notify(title: str, message: str):
+    """Send a desktop notification to the user."""
+
+
+def capture_screen(screen_name: str = None):
+    """
+    Capture a screenshot of an entire screen.
+
+    Args:
+        screen_name: Screen identifier
+    """
+
+
+def capture_active_window(include_decorations: bool = True):
+    """Capture a screenshot of the currently active window."""
+
+
+def list_services(bus: str = "session"):
+    """List services available on a D-Bus bus."""
+
+
+def clipboard_read():
+    """Read the current clipboard contents."""
+
+
+@pytest.fixture
+def index():
+    index = ToolIndex()
+    for fn in (notify, capture_screen, capture_active_window, list_services, clipboard_read):
+        index.add(fn)
+    return index
+
+
+def names(results):
+    return [name for name, _ in results]
+
+
+def test_tokenize_lowercases_and_strips_plurals():
+    assert tokenize("Screenshots of Windows") == ["screenshot", "of", "window"]
+    # Short words and double-s endings keep their final 's'
+    assert tokenize("bus class") == ["bus", "class"]
+
+
+def test_empty_index_returns_nothing():
+    assert ToolIndex().search("screenshot") == []
+
+
+def test_search_returns_summary_with_name(index):
+    assert index.search("clipboard", limit=1) == [("clipboard_read", "Read the current clipboard contents.")]
+
+
+def test_name_match_outranks_description_match():
+    def raise_window():
+        """Bring something to the front."""
+
+    def move_item():
+        """Move a window to another place."""
+
+    index = ToolIndex()
+    index.add(move_item)
+    index.add(raise_window)
+    assert names(index.search("window")) == ["raise_window", "move_item"]
+
+
+def test_terms_combine_across_fields(index):
+    ranked = names(index.search("screenshot of my screen"))
+    assert ranked[0] == "capture_screen"
+    assert set(ranked[:2]) == {"capture_screen", "capture_active_window"}
+
+
+def test_search_hints_find_tools_by_other_phrasings(index):
+    # 'toast' appears nowhere but in notify's search hint
+    assert "toast" in SEARCH_HINTS["notify"]
+    assert names(index.search("toast")) == ["notify"]
+    # as does 'enumerate' for list_services
+    assert names(index.search("enumerate")) == ["list_services"]
+
+
+def test_unknown_terms_match_nothing(index):
+    assert index.search("vacuum cleaner") == []
+
+
+def test_limit_caps_results(index):
+    assert len(index.search("screenshot capture window screen", limit=1)) == 1
+
+
+def test_adding_a_name_twice_keeps_the_first(index):
+    def notify():
+        """Something else entirely."""
+
+    index.add(notify)
+    assert index.names.count("notify") == 1
+    assert index.search("notification", limit=1) == [("notify", "Send a desktop notification to the user.")]
+
+
+def test_documents_added_after_a_search_are_found(index):
+    index.search("clipboard")
+
+    def clipboard_write(text: str):
+        """Write text to the clipboard."""
+
+    index.add(clipboard_write)
+    assert "clipboard_write" in names(index.search("paste write"))